@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: cybersentinel.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'cybersentinel.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x63ybersentinel.proto\x12\rcybersentinel\"\x17\n\x04Time\x12\x0f\n\x07unix_ms\x18\x01 \x01(\x03\"%\n\tEntityRef\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\"`\n\rHostTelemetry\x12\x1f\n\x02ts\x18\x01 \x01(\x0b\x32\x13.cybersentinel.Time\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\x10\n\x08\x65\x63s_json\x18\x04 \x01(\t\"\xa7\x01\n\x05\x41lert\x12\x1f\n\x02ts\x18\x01 \x01(\x0b\x32\x13.cybersentinel.Time\x12\n\n\x02id\x18\x02 \x01(\t\x12\x10\n\x08severity\x18\x03 \x01(\t\x12*\n\x08\x65ntities\x18\x04 \x03(\x0b\x32\x18.cybersentinel.EntityRef\x12\x0c\n\x04tags\x18\x05 \x03(\t\x12\x0f\n\x07summary\x18\x06 \x01(\t\x12\x14\n\x0c\x65vidence_ref\x18\x07 \x01(\t\"\xa9\x01\n\x07\x46inding\x12\x1f\n\x02ts\x18\x01 \x01(\x0b\x32\x13.cybersentinel.Time\x12\n\n\x02id\x18\x02 \x01(\t\x12\x12\n\nhypothesis\x18\x03 \x01(\t\x12-\n\x0bgraph_nodes\x18\x04 \x03(\x0b\x32\x18.cybersentinel.EntityRef\x12\x16\n\x0e\x63\x61ndidate_ttps\x18\x05 \x03(\t\x12\x16\n\x0erationale_json\x18\x06 \x01(\t\"\x81\x01\n\nActionPlan\x12\x1f\n\x02ts\x18\x01 \x01(\x0b\x32\x13.cybersentinel.Time\x12\x13\n\x0bincident_id\x18\x02 \x01(\t\x12\x11\n\tplaybooks\x18\x03 \x03(\t\x12\x17\n\x0f\x63hange_set_json\x18\x04 \x01(\t\x12\x11\n\trisk_tier\x18\x05 \x01(\t\"a\n\x0bPlaybookRun\x12\x1f\n\x02ts\x18\x01 \x01(\x0b\x32\x13.cybersentinel.Time\x12\x13\n\x0bplaybook_id\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x0c\n\x04logs\x18\x04 \x01(\t\"\xab\x02\n\rIncidentFrame\x12\x1f\n\x02ts\x18\x01 \x01(\x0b\x32\x13.cybersentinel.Time\x12\x13\n\x0bincident_id\x18\x02 \x01(\t\x12\x31\n\ttelemetry\x18\x03 \x01(\x0b\x32\x1c.cybersentinel.HostTelemetryH\x00\x12%\n\x05\x61lert\x18\x04 \x01(\x0b\x32\x14.cybersentinel.AlertH\x00\x12)\n\x07\x66inding\x18\x05 \x01(\x0b\x32\x16.cybersentinel.FindingH\x00\x12)\n\x04plan\x18\x06 \x01(\x0b\x32\x19.cybersentinel.ActionPlanH\x00\x12)\n\x03run\x18\x07 \x01(\x0b\x32\x1a.cybersentinel.PlaybookRunH\x00\x42\t\n\x07payloadb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'cybersentinel_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TIME']._serialized_start=38
+  _globals['_TIME']._serialized_end=61
+  _globals['_ENTITYREF']._serialized_start=63
+  _globals['_ENTITYREF']._serialized_end=100
+  _globals['_HOSTTELEMETRY']._serialized_start=102
+  _globals['_HOSTTELEMETRY']._serialized_end=198
+  _globals['_ALERT']._serialized_start=201
+  _globals['_ALERT']._serialized_end=368
+  _globals['_FINDING']._serialized_start=371
+  _globals['_FINDING']._serialized_end=540
+  _globals['_ACTIONPLAN']._serialized_start=543
+  _globals['_ACTIONPLAN']._serialized_end=672
+  _globals['_PLAYBOOKRUN']._serialized_start=674
+  _globals['_PLAYBOOKRUN']._serialized_end=771
+  _globals['_INCIDENTFRAME']._serialized_start=774
+  _globals['_INCIDENTFRAME']._serialized_end=1073
+# @@protoc_insertion_point(module_scope)
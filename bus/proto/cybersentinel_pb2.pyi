@@ -0,0 +1,111 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Time(_message.Message):
+    __slots__ = ("unix_ms",)
+    UNIX_MS_FIELD_NUMBER: _ClassVar[int]
+    unix_ms: int
+    def __init__(self, unix_ms: _Optional[int] = ...) -> None: ...
+
+class EntityRef(_message.Message):
+    __slots__ = ("type", "id")
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    type: str
+    id: str
+    def __init__(self, type: _Optional[str] = ..., id: _Optional[str] = ...) -> None: ...
+
+class HostTelemetry(_message.Message):
+    __slots__ = ("ts", "host", "source", "ecs_json")
+    TS_FIELD_NUMBER: _ClassVar[int]
+    HOST_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
+    ECS_JSON_FIELD_NUMBER: _ClassVar[int]
+    ts: Time
+    host: str
+    source: str
+    ecs_json: str
+    def __init__(self, ts: _Optional[_Union[Time, _Mapping]] = ..., host: _Optional[str] = ..., source: _Optional[str] = ..., ecs_json: _Optional[str] = ...) -> None: ...
+
+class Alert(_message.Message):
+    __slots__ = ("ts", "id", "severity", "entities", "tags", "summary", "evidence_ref")
+    TS_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    SEVERITY_FIELD_NUMBER: _ClassVar[int]
+    ENTITIES_FIELD_NUMBER: _ClassVar[int]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    SUMMARY_FIELD_NUMBER: _ClassVar[int]
+    EVIDENCE_REF_FIELD_NUMBER: _ClassVar[int]
+    ts: Time
+    id: str
+    severity: str
+    entities: _containers.RepeatedCompositeFieldContainer[EntityRef]
+    tags: _containers.RepeatedScalarFieldContainer[str]
+    summary: str
+    evidence_ref: str
+    def __init__(self, ts: _Optional[_Union[Time, _Mapping]] = ..., id: _Optional[str] = ..., severity: _Optional[str] = ..., entities: _Optional[_Iterable[_Union[EntityRef, _Mapping]]] = ..., tags: _Optional[_Iterable[str]] = ..., summary: _Optional[str] = ..., evidence_ref: _Optional[str] = ...) -> None: ...
+
+class Finding(_message.Message):
+    __slots__ = ("ts", "id", "hypothesis", "graph_nodes", "candidate_ttps", "rationale_json")
+    TS_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    HYPOTHESIS_FIELD_NUMBER: _ClassVar[int]
+    GRAPH_NODES_FIELD_NUMBER: _ClassVar[int]
+    CANDIDATE_TTPS_FIELD_NUMBER: _ClassVar[int]
+    RATIONALE_JSON_FIELD_NUMBER: _ClassVar[int]
+    ts: Time
+    id: str
+    hypothesis: str
+    graph_nodes: _containers.RepeatedCompositeFieldContainer[EntityRef]
+    candidate_ttps: _containers.RepeatedScalarFieldContainer[str]
+    rationale_json: str
+    def __init__(self, ts: _Optional[_Union[Time, _Mapping]] = ..., id: _Optional[str] = ..., hypothesis: _Optional[str] = ..., graph_nodes: _Optional[_Iterable[_Union[EntityRef, _Mapping]]] = ..., candidate_ttps: _Optional[_Iterable[str]] = ..., rationale_json: _Optional[str] = ...) -> None: ...
+
+class ActionPlan(_message.Message):
+    __slots__ = ("ts", "incident_id", "playbooks", "change_set_json", "risk_tier")
+    TS_FIELD_NUMBER: _ClassVar[int]
+    INCIDENT_ID_FIELD_NUMBER: _ClassVar[int]
+    PLAYBOOKS_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_SET_JSON_FIELD_NUMBER: _ClassVar[int]
+    RISK_TIER_FIELD_NUMBER: _ClassVar[int]
+    ts: Time
+    incident_id: str
+    playbooks: _containers.RepeatedScalarFieldContainer[str]
+    change_set_json: str
+    risk_tier: str
+    def __init__(self, ts: _Optional[_Union[Time, _Mapping]] = ..., incident_id: _Optional[str] = ..., playbooks: _Optional[_Iterable[str]] = ..., change_set_json: _Optional[str] = ..., risk_tier: _Optional[str] = ...) -> None: ...
+
+class PlaybookRun(_message.Message):
+    __slots__ = ("ts", "playbook_id", "status", "logs")
+    TS_FIELD_NUMBER: _ClassVar[int]
+    PLAYBOOK_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    LOGS_FIELD_NUMBER: _ClassVar[int]
+    ts: Time
+    playbook_id: str
+    status: str
+    logs: str
+    def __init__(self, ts: _Optional[_Union[Time, _Mapping]] = ..., playbook_id: _Optional[str] = ..., status: _Optional[str] = ..., logs: _Optional[str] = ...) -> None: ...
+
+class IncidentFrame(_message.Message):
+    __slots__ = ("ts", "incident_id", "telemetry", "alert", "finding", "plan", "run")
+    TS_FIELD_NUMBER: _ClassVar[int]
+    INCIDENT_ID_FIELD_NUMBER: _ClassVar[int]
+    TELEMETRY_FIELD_NUMBER: _ClassVar[int]
+    ALERT_FIELD_NUMBER: _ClassVar[int]
+    FINDING_FIELD_NUMBER: _ClassVar[int]
+    PLAN_FIELD_NUMBER: _ClassVar[int]
+    RUN_FIELD_NUMBER: _ClassVar[int]
+    ts: Time
+    incident_id: str
+    telemetry: HostTelemetry
+    alert: Alert
+    finding: Finding
+    plan: ActionPlan
+    run: PlaybookRun
+    def __init__(self, ts: _Optional[_Union[Time, _Mapping]] = ..., incident_id: _Optional[str] = ..., telemetry: _Optional[_Union[HostTelemetry, _Mapping]] = ..., alert: _Optional[_Union[Alert, _Mapping]] = ..., finding: _Optional[_Union[Finding, _Mapping]] = ..., plan: _Optional[_Union[ActionPlan, _Mapping]] = ..., run: _Optional[_Union[PlaybookRun, _Mapping]] = ...) -> None: ...
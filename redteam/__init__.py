@@ -11,12 +11,13 @@ from redteam.framework import RedTeamSimulator
 from redteam.campaign_generator import ATTACKCampaignGenerator
 from redteam.telemetry_simulator import TelemetrySimulator
 from redteam.adversary_engine import AdversaryBehaviorEngine
-from redteam.orchestrator import CampaignOrchestrator
+from redteam.orchestrator import CampaignOrchestrator, install_uring_event_loop_policy
 
 __all__ = [
     "RedTeamSimulator",
     "ATTACKCampaignGenerator", 
     "TelemetrySimulator",
     "AdversaryBehaviorEngine",
-    "CampaignOrchestrator"
+    "CampaignOrchestrator",
+    "install_uring_event_loop_policy"
 ]
\ No newline at end of file
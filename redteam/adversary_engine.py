@@ -356,9 +356,9 @@ class AdversaryBehaviorEngine:
         base_score = 0.5
         
         # Adjust for adversary preferences
-        if technique_id in self.profile.preferred_techniques:
+        if technique_id in self.profile.preferred_technique_set:
             base_score += 0.3
-        elif technique_id in self.profile.avoided_techniques:
+        elif technique_id in self.profile.avoided_technique_set:
             base_score -= 0.5
         
         # Adjust for difficulty vs skill level
@@ -532,7 +532,7 @@ class AdversaryBehaviorEngine:
         
         # Calculate confidence in this decision
         base_confidence = self.state.confidence_level
-        if technique_id in self.profile.preferred_techniques:
+        if technique_id in self.profile.preferred_technique_set:
             confidence = min(1.0, base_confidence + 0.2)
         else:
             confidence = base_confidence
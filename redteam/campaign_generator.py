@@ -848,7 +848,7 @@ class ATTACKCampaignGenerator:
                 continue
             
             # Avoid forbidden techniques
-            if technique_id in adversary_profile.avoided_techniques:
+            if technique_id in adversary_profile.avoided_technique_set:
                 continue
             
             selected_techniques.append(technique_id)
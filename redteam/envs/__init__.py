@@ -2,5 +2,6 @@
 
 from .attack_env import AttackEnv, EnvConfig, Phase
 from .detector_adapter import DetectorAdapter
+from .vec_env import VecEnv, SubprocVecEnv
 
-__all__ = ["AttackEnv", "EnvConfig", "Phase", "DetectorAdapter"]
+__all__ = ["AttackEnv", "EnvConfig", "Phase", "DetectorAdapter", "VecEnv", "SubprocVecEnv"]
@@ -0,0 +1,221 @@
+"""
+Vectorized wrappers that step several attack environments together.
+
+``VecEnv`` steps its environments in-process; ``SubprocVecEnv`` runs each
+environment in a worker process and shares observations and action masks
+through a ``multiprocessing.shared_memory`` block. Both expose batched
+arrays so a policy can run one forward pass for all environments per step.
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .attack_env import AttackEnv
+
+
+class VecEnv:
+    """
+    Steps N environments in lockstep, in-process.
+
+    Environments are not auto-reset: once an environment reports done it is
+    skipped (zero reward, empty info) until the next ``reset()``. The
+    returned ``obs``/``masks`` arrays are reused between calls; copy them
+    if they must outlive the next step.
+    """
+
+    def __init__(self, env_fns: Sequence[Callable[[], AttackEnv]]):
+        self.envs = [env_fn() for env_fn in env_fns]
+        self.num_envs = len(self.envs)
+        self.obs_dim = self.envs[0].obs_dim
+        self.n_actions = self.envs[0].n_actions
+        self._allocate(np.zeros(self.num_envs * self._row_bytes(), dtype=np.uint8))
+
+    def _row_bytes(self) -> int:
+        """Bytes per environment in the shared obs/mask block."""
+        return self.obs_dim * np.dtype(np.float32).itemsize + self.n_actions
+
+    def _allocate(self, block: np.ndarray):
+        """Lay out the obs and mask arrays over a flat byte block."""
+        n_obs = self.num_envs * self.obs_dim * np.dtype(np.float32).itemsize
+        self.obs = block[:n_obs].view(np.float32).reshape(self.num_envs, self.obs_dim)
+        self.masks = block[n_obs:].view(bool).reshape(self.num_envs, self.n_actions)
+        self.dones = np.zeros(self.num_envs, dtype=bool)
+
+    def reset(self, seeds: Optional[Sequence[Optional[int]]] = None
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reset environments.
+
+        Args:
+            seeds: Per-environment seeds. If fewer seeds than environments
+                are given, the remaining environments start out done.
+
+        Returns:
+            Tuple of (obs[N, obs_dim], masks[N, n_actions])
+        """
+        n_active = self.num_envs if seeds is None else len(seeds)
+        for i, env in enumerate(self.envs[:n_active]):
+            obs, info = env.reset(seed=None if seeds is None else seeds[i])
+            self.obs[i] = obs
+            self.masks[i] = info.get("action_mask", env.get_action_mask())
+        self.dones[:n_active] = False
+        self.dones[n_active:] = True
+        return self.obs, self.masks
+
+    def step(self, actions: np.ndarray
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """
+        Step every environment that is not done.
+
+        Returns:
+            Tuple of (obs[N, obs_dim], rewards[N], dones[N], infos)
+        """
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        infos: List[Dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        for i, env in enumerate(self.envs):
+            if self.dones[i]:
+                continue
+            obs, reward, done, info = env.step(int(actions[i]))
+            self.obs[i] = obs
+            self.masks[i] = info.get("action_mask", env.get_action_mask())
+            rewards[i] = reward
+            self.dones[i] = done
+            infos[i] = info
+        return self.obs, rewards, self.dones.copy(), infos
+
+    def get_technique_name(self, action: int) -> str:
+        """Get technique ID for an action index."""
+        return self.envs[0].get_technique_name(action)
+
+    def close(self):
+        """Release resources held by the environments."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _subproc_worker(remote, parent_remote, env_fn: Callable[[], AttackEnv],
+                    block: shared_memory.SharedMemory, index: int,
+                    obs_dim: int, n_actions: int, num_envs: int):
+    """Own one environment and serve reset/step commands over a pipe."""
+    parent_remote.close()
+    env = env_fn()
+
+    n_obs = num_envs * obs_dim * np.dtype(np.float32).itemsize
+    flat = np.ndarray((block.size,), dtype=np.uint8, buffer=block.buf)
+    obs_row = flat[:n_obs].view(np.float32).reshape(num_envs, obs_dim)[index]
+    mask_row = flat[n_obs:n_obs + num_envs * n_actions].view(bool).reshape(num_envs, n_actions)[index]
+
+    try:
+        while True:
+            cmd, data = remote.recv()
+            if cmd == "reset":
+                obs, info = env.reset(seed=data)
+                obs_row[:] = obs
+                mask_row[:] = info.get("action_mask", env.get_action_mask())
+                remote.send(None)
+            elif cmd == "step":
+                obs, reward, done, info = env.step(data)
+                obs_row[:] = obs
+                mask_row[:] = info.get("action_mask", env.get_action_mask())
+                remote.send((reward, done, info))
+            elif cmd == "close":
+                break
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        del obs_row, mask_row, flat
+        remote.close()
+
+
+class SubprocVecEnv(VecEnv):
+    """
+    Steps N environments in worker processes.
+
+    Each worker writes its observation and action mask straight into a
+    shared-memory block, so only actions, rewards and info dicts cross the
+    pipes. Same interface and reset/done semantics as ``VecEnv``.
+    """
+
+    def __init__(self, env_fns: Sequence[Callable[[], AttackEnv]]):
+        probe = env_fns[0]()
+        self.num_envs = len(env_fns)
+        self.obs_dim = probe.obs_dim
+        self.n_actions = probe.n_actions
+        self._probe = probe
+        self._closed = False
+
+        size = self.num_envs * self._row_bytes()
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._allocate(np.ndarray((size,), dtype=np.uint8, buffer=self._shm.buf))
+
+        # Fork lets workers inherit the mapping instead of re-attaching by name
+        ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else None)
+        self._remotes, work_remotes = zip(*[ctx.Pipe() for _ in range(self.num_envs)])
+        self._processes = []
+        for index, (work_remote, remote, env_fn) in enumerate(
+                zip(work_remotes, self._remotes, env_fns)):
+            process = ctx.Process(
+                target=_subproc_worker,
+                args=(work_remote, remote, env_fn, self._shm, index,
+                      self.obs_dim, self.n_actions, self.num_envs),
+                daemon=True,
+            )
+            process.start()
+            work_remote.close()
+            self._processes.append(process)
+
+    def reset(self, seeds: Optional[Sequence[Optional[int]]] = None
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        n_active = self.num_envs if seeds is None else len(seeds)
+        for i, remote in enumerate(self._remotes[:n_active]):
+            remote.send(("reset", None if seeds is None else seeds[i]))
+        for remote in self._remotes[:n_active]:
+            remote.recv()
+        self.dones[:n_active] = False
+        self.dones[n_active:] = True
+        return self.obs, self.masks
+
+    def step(self, actions: np.ndarray
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        active = np.flatnonzero(~self.dones)
+        for i in active:
+            self._remotes[i].send(("step", int(actions[i])))
+
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        infos: List[Dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        for i in active:
+            reward, done, info = self._remotes[i].recv()
+            rewards[i] = reward
+            self.dones[i] = done
+            infos[i] = info
+        return self.obs, rewards, self.dones.copy(), infos
+
+    def get_technique_name(self, action: int) -> str:
+        """Get technique ID for an action index."""
+        return self._probe.get_technique_name(action)
+
+    def close(self):
+        """Stop the workers and free the shared-memory block."""
+        if self._closed:
+            return
+        self._closed = True
+        for remote in self._remotes:
+            try:
+                remote.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        for remote in self._remotes:
+            remote.close()
+
+        del self.obs, self.masks
+        self._shm.close()
+        self._shm.unlink()
@@ -1,17 +1,81 @@
 """Red Team Simulation Framework - core infrastructure for adversary simulations."""
 
 import asyncio
+import io
+import itertools
 import logging
 import json
+import os
+import re
+import sys
 import uuid
-from typing import Dict, Any, List, Optional, Set
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Mapping, Callable, Awaitable, Optional, Set, Tuple, FrozenSet
+from collections import deque
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from enum import Enum
+from dataclasses import dataclass, fields
+from enum import Enum, IntFlag
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+_TECHNIQUE_ID_PATTERN = re.compile(r"T\d{4}(?:\.\d{3})?")
+
+def _load_technique_catalog(path: Path) -> FrozenSet[str]:
+    """Load the known ATT&CK technique IDs (a JSON list), if a catalog is present."""
+    
+    try:
+        with open(path) as f:
+            return frozenset(sys.intern(tid) for tid in json.load(f))
+    except FileNotFoundError:
+        return frozenset()
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable ATT&CK technique catalog {path}: {e}")
+        return frozenset()
+
+# Closed ATT&CK vocabulary, loaded once at import
+_ATTACK_TECHNIQUE_IDS: FrozenSet[str] = _load_technique_catalog(
+    Path(__file__).parent / "data" / "attack_techniques.json"
+)
+
+@lru_cache(maxsize=None)
+def _is_technique_id_format(technique_id: str) -> bool:
+    return _TECHNIQUE_ID_PATTERN.fullmatch(technique_id) is not None
+
+def _validate_technique(technique_id: str) -> bool:
+    """Check an ATT&CK technique ID against the catalog (or ID format if none)."""
+    
+    if _ATTACK_TECHNIQUE_IDS:
+        return technique_id in _ATTACK_TECHNIQUE_IDS
+    return _is_technique_id_format(technique_id)
+
+def _intern_strings(value: Any) -> Any:
+    """Recursively intern strings in nested lists/dicts of catalog data."""
+    
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    if isinstance(value, dict):
+        return {_intern_strings(k): _intern_strings(v) for k, v in value.items()}
+    return value
+
+def _intern_fields(obj: Any) -> Any:
+    """Intern the string content of every field of a catalog dataclass."""
+    
+    for f in fields(obj):
+        setattr(obj, f.name, _intern_strings(getattr(obj, f.name)))
+    return obj
+
 class CampaignPhase(Enum):
     """Phases of a red team campaign."""
     RECONNAISSANCE = "reconnaissance"
@@ -28,6 +92,10 @@ class CampaignPhase(Enum):
     EXFILTRATION = "exfiltration"
     IMPACT = "impact"
 
+# Phase <-> int8 code used by the campaign columns
+_CAMPAIGN_PHASES = tuple(CampaignPhase)
+_CAMPAIGN_PHASE_CODES = {phase: code for code, phase in enumerate(_CAMPAIGN_PHASES)}
+
 class SimulationMode(Enum):
     """Simulation execution modes."""
     REAL_TIME = "real_time"
@@ -35,14 +103,24 @@ class SimulationMode(Enum):
     BATCH = "batch"
     INTERACTIVE = "interactive"
 
-class CampaignStatus(Enum):
-    """Campaign execution status."""
-    PLANNED = "planned"
-    RUNNING = "running"
-    PAUSED = "paused"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
+class CampaignStatus(IntFlag):
+    """Campaign execution status.
+
+    Statuses are single bits so guards and bulk selections can test a set
+    of statuses with one AND, e.g. ``status & CampaignStatus.ACTIVE``.
+    """
+    PLANNED = 1
+    RUNNING = 2
+    PAUSED = 4
+    COMPLETED = 8
+    FAILED = 16
+    CANCELLED = 32
+    ACTIVE = RUNNING | PAUSED
+    
+    @property
+    def label(self) -> str:
+        """Lower-case status name used in reports and status dicts."""
+        return self.name.lower()
 
 @dataclass
 class AdversaryProfile:
@@ -59,6 +137,24 @@ class AdversaryProfile:
     operational_hours: Dict[str, Any]  # When this adversary is active
     description: str = ""
     
+    def __post_init__(self):
+        # Technique IDs come from a closed vocabulary; intern them and build
+        # frozen lookup sets once so selection code gets O(1) membership.
+        self.preferred_techniques = [sys.intern(t) for t in self.preferred_techniques]
+        self.avoided_techniques = [sys.intern(t) for t in self.avoided_techniques]
+        self._preferred_set = frozenset(self.preferred_techniques)
+        self._avoided_set = frozenset(self.avoided_techniques)
+    
+    @property
+    def preferred_technique_set(self) -> FrozenSet[str]:
+        """Preferred technique IDs as a frozenset (built at construction)."""
+        return self._preferred_set
+    
+    @property
+    def avoided_technique_set(self) -> FrozenSet[str]:
+        """Avoided technique IDs as a frozenset (built at construction)."""
+        return self._avoided_set
+    
 @dataclass
 class TargetEnvironment:
     """Target environment for simulation."""
@@ -73,6 +169,10 @@ class TargetEnvironment:
     vulnerabilities: List[Dict[str, Any]]
     description: str = ""
 
+# Field names resolved once, for shallow serialization of catalog entries
+_ADVERSARY_PROFILE_FIELDS = tuple(f.name for f in fields(AdversaryProfile))
+_TARGET_ENVIRONMENT_FIELDS = tuple(f.name for f in fields(TargetEnvironment))
+
 @dataclass
 class SimulationObjective:
     """Objective for red team simulation."""
@@ -87,6 +187,11 @@ class SimulationObjective:
     forbidden_techniques: List[str]  # Cannot use these techniques
     time_limit: Optional[timedelta] = None
     stealth_requirement: Optional[float] = None  # Required stealth level
+    
+    def __post_init__(self):
+        for technique_id in (*self.required_techniques, *self.forbidden_techniques):
+            if not _validate_technique(technique_id):
+                raise ValueError(f"Unknown ATT&CK technique: {technique_id}")
 
 @dataclass
 class CampaignConfiguration:
@@ -105,6 +210,7 @@ class CampaignConfiguration:
     detection_avoidance: float = 0.7  # How much to avoid detection
     noise_level: float = 0.3  # Amount of noise/distraction to generate
     parallel_operations: int = 1  # Number of concurrent operations
+    phases: Optional[List[Dict[str, Any]]] = None  # Template phases in dependency order
     
 @dataclass
 class CampaignState:
@@ -143,22 +249,105 @@ class CampaignState:
         if self.execution_log is None:
             self.execution_log = []
 
+def _topological_phase_order(phases: List[str],
+                             prerequisites: Dict[str, List[str]]) -> Tuple[str, ...]:
+    """Order template phases so every phase follows its prerequisites.
+
+    Uses Kahn's algorithm, breaking ties by declaration order. If the
+    dependencies contain a cycle, the remaining phase with the fewest
+    unresolved prerequisites is emitted next so an order is still produced.
+    Raises ValueError if a phase is declared more than once.
+    """
+    
+    duplicates = sorted({phase for phase in phases if phases.count(phase) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate template phases: {', '.join(duplicates)}")
+    
+    in_degree = {phase: 0 for phase in phases}
+    dependents: Dict[str, List[str]] = {phase: [] for phase in phases}
+    for phase, required in prerequisites.items():
+        if phase not in in_degree:
+            continue
+        for prerequisite in required:
+            if prerequisite in dependents:
+                dependents[prerequisite].append(phase)
+                in_degree[phase] += 1
+    
+    ready = deque(phase for phase in phases if in_degree[phase] == 0)
+    order: List[str] = []
+    emitted: Set[str] = set()
+    
+    while len(order) < len(phases):
+        if not ready:
+            # Cycle: break it at the phase with the fewest unresolved prerequisites
+            ready.append(min((p for p in phases if p not in emitted), key=in_degree.get))
+        
+        phase = ready.popleft()
+        if phase in emitted:
+            continue
+        order.append(phase)
+        emitted.add(phase)
+        
+        for dependent in dependents[phase]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0 and dependent not in emitted:
+                ready.append(dependent)
+    
+    return tuple(order)
+
 class RedTeamSimulator:
     """Main red team simulation framework."""
     
+    # Per-campaign column arrays, all indexed by _campaign_index
+    _CAMPAIGN_COLUMNS = (
+        "_start_ts", "_duration_s", "_status", "_phase", "_telemetry", "_alerts",
+        "_compromised", "_techniques", "_objectives_completed", "_objectives_total"
+    )
+    
     def __init__(self, data_dir: Optional[Path] = None):
         self.data_dir = data_dir or Path(__file__).parent / "data"
         self.data_dir.mkdir(exist_ok=True)
         
-        # Component registries
-        self.adversary_profiles: Dict[str, AdversaryProfile] = {}
-        self.target_environments: Dict[str, TargetEnvironment] = {}
+        # Component registries; mutate through add_* so the serialized
+        # caches below are invalidated
+        self._profiles: Dict[str, AdversaryProfile] = {}
+        self._environments: Dict[str, TargetEnvironment] = {}
+        self.adversary_profiles: Mapping[str, AdversaryProfile] = MappingProxyType(self._profiles)
+        self.target_environments: Mapping[str, TargetEnvironment] = MappingProxyType(self._environments)
+        self._profiles_version = 0
+        self._environments_version = 0
+        self._profiles_cache: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
+        self._environments_cache: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
         self.campaign_templates: Dict[str, Dict[str, Any]] = {}
         
-        # Active campaigns
+        # Active campaigns. Change a state through update_campaign_state so
+        # the status columns below follow; code that sets CampaignState
+        # fields directly must call sync_campaign_state afterwards, or
+        # get_campaign_status/list_campaigns report the old values
         self.active_campaigns: Dict[str, CampaignState] = {}
         self.campaign_configs: Dict[str, CampaignConfiguration] = {}
         
+        # Columnar copies of the campaign states (indexed by _campaign_index)
+        # so list_campaigns can build every row from a few array passes
+        self._campaign_index: Dict[str, int] = {}
+        self._campaign_ids: List[str] = []  # Inverse of _campaign_index
+        self._start_ts = np.zeros(16, dtype=np.float64)
+        self._duration_s = np.zeros(16, dtype=np.float64)
+        self._status = np.zeros(16, dtype=np.int8)
+        self._phase = np.zeros(16, dtype=np.int8)
+        self._telemetry = np.zeros(16, dtype=np.int64)
+        self._alerts = np.zeros(16, dtype=np.int64)
+        self._compromised = np.zeros(16, dtype=np.int32)
+        self._techniques = np.zeros(16, dtype=np.int32)
+        self._objectives_completed = np.zeros(16, dtype=np.int32)
+        self._objectives_total = np.zeros(16, dtype=np.int32)
+        
+        # Objective IDs are internal keys, so a counter is enough
+        self._objective_ids = itertools.count()
+        
+        # Process pool for CPU-bound simulation work, created on first use
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
         # Load default data
         self._load_default_profiles()
         self._load_default_environments()
@@ -254,11 +443,14 @@ class RedTeamSimulator:
             description="Employee with legitimate access abusing privileges for personal gain"
         )
         
-        self.adversary_profiles = {
-            "apt": apt_profile,
-            "ransomware": ransomware_profile,
-            "insider": insider_profile
-        }
+        # Skill levels, motivations, technique IDs etc. are closed
+        # vocabularies, so share one copy of each string
+        self._profiles.update({
+            "apt": _intern_fields(apt_profile),
+            "ransomware": _intern_fields(ransomware_profile),
+            "insider": _intern_fields(insider_profile)
+        })
+        self._profiles_version += 1
     
     def _load_default_environments(self):
         """Load default target environments."""
@@ -334,10 +526,11 @@ class RedTeamSimulator:
             description="Healthcare organization with legacy systems and compliance requirements"
         )
         
-        self.target_environments = {
-            "corporate": corporate_env,
-            "healthcare": healthcare_env
-        }
+        self._environments.update({
+            "corporate": _intern_fields(corporate_env),
+            "healthcare": _intern_fields(healthcare_env)
+        })
+        self._environments_version += 1
     
     def _load_campaign_templates(self):
         """Load campaign templates for common scenarios."""
@@ -385,6 +578,13 @@ class RedTeamSimulator:
                     "stealth_required": 0.9
                 }
             ],
+            "prerequisites": {
+                "initial_access": ["reconnaissance"],
+                "persistence": ["initial_access"],
+                "discovery": ["initial_access"],
+                "collection": ["discovery"],
+                "exfiltration": ["collection"]
+            },
             "objectives": [
                 {
                     "name": "Gain Initial Access",
@@ -435,6 +635,11 @@ class RedTeamSimulator:
                     "stealth_required": 0.2
                 }
             ],
+            "prerequisites": {
+                "discovery": ["initial_access"],
+                "lateral_movement": ["discovery"],
+                "impact": ["lateral_movement"]
+            },
             "objectives": [
                 {
                     "name": "Establish Foothold",
@@ -458,6 +663,20 @@ class RedTeamSimulator:
             "data_breach": data_breach_template,
             "ransomware": ransomware_template
         }
+        
+        # Phase dependencies are static per template, so resolve them once
+        for name, template in self.campaign_templates.items():
+            for phase in template["phases"]:
+                for technique_id in phase["techniques"]:
+                    if not _validate_technique(technique_id):
+                        raise ValueError(f"Unknown ATT&CK technique {technique_id} in template {name}")
+            try:
+                template["_phase_order"] = _topological_phase_order(
+                    [phase["phase"] for phase in template["phases"]],
+                    template.get("prerequisites", {})
+                )
+            except ValueError as e:
+                raise ValueError(f"Invalid campaign template {name}: {e}") from None
     
     def create_campaign(self, adversary_name: str, environment_name: str,
                        template_name: str = None, **kwargs) -> str:
@@ -476,15 +695,17 @@ class RedTeamSimulator:
         
         # Create objectives based on template or defaults
         objectives = []
+        phases = None
         if template_name and template_name in self.campaign_templates:
             template = self.campaign_templates[template_name]
             campaign_name = template["name"]
             description = template["description"]
             duration = timedelta(hours=template["duration_hours"])
+            phases = self.get_template_phases(template_name)
             
             for obj_template in template["objectives"]:
                 objective = SimulationObjective(
-                    objective_id=str(uuid.uuid4()),
+                    objective_id=f"o-{next(self._objective_ids):08x}",
                     name=obj_template["name"],
                     description=obj_template.get("description", ""),
                     objective_type=obj_template["type"],
@@ -502,7 +723,7 @@ class RedTeamSimulator:
             
             # Create default objective
             default_objective = SimulationObjective(
-                objective_id=str(uuid.uuid4()),
+                objective_id=f"o-{next(self._objective_ids):08x}",
                 name="Demonstrate Attack Capability",
                 description="Successfully execute attack techniques against target",
                 objective_type="general",
@@ -529,7 +750,8 @@ class RedTeamSimulator:
             realism_level=kwargs.get("realism_level", 0.8),
             detection_avoidance=kwargs.get("detection_avoidance", 0.7),
             noise_level=kwargs.get("noise_level", 0.3),
-            parallel_operations=kwargs.get("parallel_operations", 1)
+            parallel_operations=kwargs.get("parallel_operations", 1),
+            phases=phases
         )
         
         # Initialize campaign state
@@ -543,70 +765,153 @@ class RedTeamSimulator:
         self.campaign_configs[campaign_id] = config
         self.active_campaigns[campaign_id] = state
         
+        index = len(self._campaign_index)
+        if index == len(self._start_ts):
+            for name in self._CAMPAIGN_COLUMNS:
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+        self._campaign_index[campaign_id] = index
+        self._campaign_ids.append(campaign_id)
+        self._duration_s[index] = config.duration.total_seconds()
+        self._objectives_total[index] = len(config.objectives)
+        self.sync_campaign_state(campaign_id)
+        
         logger.info(f"Created campaign {campaign_id}: {campaign_name}")
         return campaign_id
     
+    def update_campaign_state(self, campaign_id: str, **changes: Any):
+        """Set fields on a campaign's state and refresh its status columns."""
+        
+        state = self.active_campaigns[campaign_id]
+        for name, value in changes.items():
+            setattr(state, name, value)
+        self.sync_campaign_state(campaign_id)
+    
+    def sync_campaign_state(self, campaign_id: str):
+        """Copy a campaign's state into the status columns.
+
+        Only needed after mutating ``active_campaigns[campaign_id]``
+        directly; update_campaign_state calls it.
+        """
+        
+        state = self.active_campaigns[campaign_id]
+        index = self._campaign_index[campaign_id]
+        self._start_ts[index] = state.start_time.timestamp()
+        self._status[index] = state.status
+        self._phase[index] = _CAMPAIGN_PHASE_CODES[state.current_phase]
+        self._telemetry[index] = state.telemetry_generated
+        self._alerts[index] = state.alerts_triggered
+        self._compromised[index] = len(state.compromised_assets)
+        self._techniques[index] = len(state.techniques_executed)
+        self._objectives_completed[index] = len(state.objectives_completed)
+    
+    def _campaign_status_rows(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """Build status dicts for the given column indices in array passes."""
+        
+        elapsed = datetime.now().timestamp() - self._start_ts[indices]
+        progress = np.minimum(1.0, elapsed / self._duration_s[indices])
+        telemetry = self._telemetry[indices]
+        alerts = self._alerts[indices]
+        detection_rate = alerts / np.maximum(telemetry, 1)
+        
+        # Unbox each column to Python scalars once rather than per element
+        elapsed, progress = elapsed.tolist(), progress.tolist()
+        telemetry, alerts, detection_rate = telemetry.tolist(), alerts.tolist(), detection_rate.tolist()
+        status = self._status[indices].tolist()
+        phase = self._phase[indices].tolist()
+        objectives_completed = self._objectives_completed[indices].tolist()
+        objectives_total = self._objectives_total[indices].tolist()
+        techniques = self._techniques[indices].tolist()
+        compromised = self._compromised[indices].tolist()
+        
+        rows = []
+        for row, index in enumerate(indices.tolist()):
+            campaign_id = self._campaign_ids[index]
+            rows.append({
+                "campaign_id": campaign_id,
+                "name": self.campaign_configs[campaign_id].name,
+                "status": CampaignStatus(status[row]).label,
+                "current_phase": _CAMPAIGN_PHASES[phase[row]].value,
+                "progress": progress[row],
+                "elapsed_time": str(timedelta(seconds=elapsed[row])),
+                "objectives_completed": objectives_completed[row],
+                "objectives_total": objectives_total[row],
+                "techniques_executed": techniques[row],
+                "telemetry_generated": telemetry[row],
+                "alerts_triggered": alerts[row],
+                "detection_rate": detection_rate[row],
+                "compromised_assets": compromised[row]
+            })
+        return rows
+    
     def get_campaign_status(self, campaign_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a campaign."""
         
         if campaign_id not in self.active_campaigns:
             return None
         
-        state = self.active_campaigns[campaign_id]
-        config = self.campaign_configs[campaign_id]
-        
-        # Calculate progress
-        elapsed_time = datetime.now() - state.start_time
-        progress = min(1.0, elapsed_time.total_seconds() / config.duration.total_seconds())
-        
-        status = {
-            "campaign_id": campaign_id,
-            "name": config.name,
-            "status": state.status.value,
-            "current_phase": state.current_phase.value,
-            "progress": progress,
-            "elapsed_time": str(elapsed_time),
-            "objectives_completed": len(state.objectives_completed),
-            "objectives_total": len(config.objectives),
-            "techniques_executed": len(state.techniques_executed),
-            "telemetry_generated": state.telemetry_generated,
-            "alerts_triggered": state.alerts_triggered,
-            "compromised_assets": len(state.compromised_assets)
-        }
-        
-        return status
+        index = self._campaign_index[campaign_id]
+        return self._campaign_status_rows(np.array([index]))[0]
     
     def list_campaigns(self) -> List[Dict[str, Any]]:
         """List all campaigns."""
         
-        campaigns = []
-        for campaign_id in self.active_campaigns:
-            status = self.get_campaign_status(campaign_id)
-            if status:
-                campaigns.append(status)
-        
-        return campaigns
+        # One vectorised pass over the status columns for every campaign
+        return self._campaign_status_rows(np.arange(len(self._campaign_ids)))
+    
+    def get_campaigns_by_status(self, statuses: CampaignStatus) -> List[str]:
+        """List IDs of campaigns whose status is any of the given status bits."""
+        return [cid for cid, state in self.active_campaigns.items() if state.status & statuses]
     
     def get_adversary_profiles(self) -> Dict[str, Dict[str, Any]]:
-        """Get available adversary profiles."""
-        return {name: asdict(profile) for name, profile in self.adversary_profiles.items()}
+        """Get available adversary profiles.
+
+        The serialized view is cached until a profile is added and shares
+        the profiles' lists and dicts; treat it as read-only.
+        """
+        if self._profiles_cache is None or self._profiles_cache[0] != self._profiles_version:
+            serialized = {
+                name: {field: getattr(profile, field) for field in _ADVERSARY_PROFILE_FIELDS}
+                for name, profile in self._profiles.items()
+            }
+            self._profiles_cache = (self._profiles_version, serialized)
+        return self._profiles_cache[1]
     
     def get_target_environments(self) -> Dict[str, Dict[str, Any]]:
-        """Get available target environments."""
-        return {name: asdict(env) for name, env in self.target_environments.items()}
+        """Get available target environments.
+
+        The serialized view is cached until an environment is added and
+        shares the environments' lists and dicts; treat it as read-only.
+        """
+        if self._environments_cache is None or self._environments_cache[0] != self._environments_version:
+            serialized = {
+                name: {field: getattr(env, field) for field in _TARGET_ENVIRONMENT_FIELDS}
+                for name, env in self._environments.items()
+            }
+            self._environments_cache = (self._environments_version, serialized)
+        return self._environments_cache[1]
     
     def get_campaign_templates(self) -> Dict[str, Dict[str, Any]]:
         """Get available campaign templates."""
         return self.campaign_templates.copy()
     
+    def get_template_phases(self, template_name: str) -> List[Dict[str, Any]]:
+        """Get a template's phases ordered so each follows its prerequisites."""
+        
+        template = self.campaign_templates[template_name]
+        phases_by_name = {phase["phase"]: phase for phase in template["phases"]}
+        return [phases_by_name[name] for name in template["_phase_order"]]
+    
     def add_adversary_profile(self, name: str, profile: AdversaryProfile):
         """Add custom adversary profile."""
-        self.adversary_profiles[name] = profile
+        self._profiles[name] = profile
+        self._profiles_version += 1
         logger.info(f"Added adversary profile: {name}")
     
     def add_target_environment(self, name: str, environment: TargetEnvironment):
         """Add custom target environment."""
-        self.target_environments[name] = environment
+        self._environments[name] = environment
+        self._environments_version += 1
         logger.info(f"Added target environment: {name}")
     
     async def start_campaign(self, campaign_id: str) -> bool:
@@ -616,11 +921,11 @@ class RedTeamSimulator:
             return False
         
         state = self.active_campaigns[campaign_id]
-        if state.status != CampaignStatus.PLANNED:
+        if not state.status & CampaignStatus.PLANNED:
             return False
         
-        state.status = CampaignStatus.RUNNING
-        state.start_time = datetime.now()
+        self.update_campaign_state(campaign_id, status=CampaignStatus.RUNNING,
+                                   start_time=datetime.now())
         
         logger.info(f"Started campaign {campaign_id}")
         return True
@@ -632,10 +937,10 @@ class RedTeamSimulator:
             return False
         
         state = self.active_campaigns[campaign_id]
-        if state.status != CampaignStatus.RUNNING:
+        if not state.status & CampaignStatus.RUNNING:
             return False
         
-        state.status = CampaignStatus.PAUSED
+        self.update_campaign_state(campaign_id, status=CampaignStatus.PAUSED)
         
         logger.info(f"Paused campaign {campaign_id}")
         return True
@@ -646,15 +951,62 @@ class RedTeamSimulator:
         if campaign_id not in self.active_campaigns:
             return False
         
-        state = self.active_campaigns[campaign_id]
-        state.status = CampaignStatus.CANCELLED
-        state.end_time = datetime.now()
+        self.update_campaign_state(campaign_id, status=CampaignStatus.CANCELLED,
+                                   end_time=datetime.now())
         
         logger.info(f"Stopped campaign {campaign_id}")
         return True
     
-    def get_campaign_report(self, campaign_id: str) -> Optional[Dict[str, Any]]:
-        """Generate comprehensive campaign report."""
+    async def _run_bulk(self, operation: Callable[[str], Awaitable[bool]],
+                        campaign_ids: List[str], max_concurrent: int) -> List[bool]:
+        """Apply a per-campaign operation concurrently, bounded by a semaphore."""
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def _one(campaign_id: str) -> bool:
+            async with semaphore:
+                return await operation(campaign_id)
+        
+        return list(await asyncio.gather(*[_one(cid) for cid in campaign_ids]))
+    
+    async def start_campaigns(self, campaign_ids: List[str], max_concurrent: int = 16) -> List[bool]:
+        """Start several campaigns concurrently; results follow input order."""
+        return await self._run_bulk(self.start_campaign, campaign_ids, max_concurrent)
+    
+    async def pause_campaigns(self, campaign_ids: List[str], max_concurrent: int = 16) -> List[bool]:
+        """Pause several campaigns concurrently; results follow input order."""
+        return await self._run_bulk(self.pause_campaign, campaign_ids, max_concurrent)
+    
+    async def stop_campaigns(self, campaign_ids: List[str], max_concurrent: int = 16) -> List[bool]:
+        """Stop several campaigns concurrently; results follow input order."""
+        return await self._run_bulk(self.stop_campaign, campaign_ids, max_concurrent)
+    
+    async def run_cpu_bound(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run CPU-bound simulation work in the process pool.
+
+        ``func`` must be a picklable top-level function taking plain
+        snapshots of campaign data rather than the simulator itself.
+        """
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    def shutdown(self):
+        """Release the simulation process pool, if one was started."""
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _campaign_report_sections(self, campaign_id: str) -> Optional[List[Tuple[str, Any]]]:
+        """Build the ordered (key, value) sections of a campaign report.
+
+        Large per-campaign collections are referenced directly from the
+        campaign state rather than copied.
+        """
         
         if campaign_id not in self.active_campaigns:
             return None
@@ -662,8 +1014,8 @@ class RedTeamSimulator:
         state = self.active_campaigns[campaign_id]
         config = self.campaign_configs[campaign_id]
         
-        report = {
-            "campaign_info": {
+        return [
+            ("campaign_info", {
                 "id": campaign_id,
                 "name": config.name,
                 "description": config.description,
@@ -671,23 +1023,66 @@ class RedTeamSimulator:
                 "target": config.target_environment.name,
                 "start_time": state.start_time.isoformat(),
                 "end_time": state.end_time.isoformat() if state.end_time else None,
-                "status": state.status.value
-            },
-            "execution_summary": {
+                "status": state.status.label
+            }),
+            ("execution_summary", {
                 "objectives_completed": state.objectives_completed,
                 "objectives_failed": state.objectives_failed,
                 "techniques_executed": state.techniques_executed,
+                "phases_planned": [phase["phase"] for phase in config.phases or ()],
                 "phases_completed": [],  # Would be populated during execution
                 "telemetry_generated": state.telemetry_generated,
                 "alerts_triggered": state.alerts_triggered,
                 "detection_rate": state.alerts_triggered / max(state.telemetry_generated, 1)
-            },
-            "assets_compromised": state.compromised_assets,
-            "credentials_acquired": state.acquired_credentials,
-            "execution_log": state.execution_log,
-            "detection_events": state.detection_events,
-            "lessons_learned": [],  # Would be populated based on execution
-            "recommendations": []   # Would be generated based on results
-        }
+            }),
+            ("assets_compromised", state.compromised_assets),
+            ("credentials_acquired", state.acquired_credentials),
+            ("execution_log", state.execution_log),
+            ("detection_events", state.detection_events),
+            ("lessons_learned", []),  # Would be populated based on execution
+            ("recommendations", [])   # Would be generated based on results
+        ]
+    
+    def get_campaign_report(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """Generate comprehensive campaign report."""
+        
+        sections = self._campaign_report_sections(campaign_id)
+        if sections is None:
+            return None
+        
+        return dict(sections)
+    
+    def get_campaign_report_bytes(self, campaign_id: str) -> Optional[bytes]:
+        """Generate the campaign report as UTF-8 JSON bytes.
+
+        Each top-level section is encoded straight into a byte buffer, so
+        the execution log and detection events are never copied into an
+        intermediate report dict.
+        """
+        
+        sections = self._campaign_report_sections(campaign_id)
+        if sections is None:
+            return None
+        
+        buffer = io.BytesIO()
+        buffer.write(b"{")
+        
+        if orjson is not None:
+            for index, (key, value) in enumerate(sections):
+                if index:
+                    buffer.write(b",")
+                buffer.write(orjson.dumps(key))
+                buffer.write(b":")
+                buffer.write(orjson.dumps(value, default=str))
+        else:
+            encoder = json.JSONEncoder(default=str, separators=(",", ":"))
+            for index, (key, value) in enumerate(sections):
+                if index:
+                    buffer.write(b",")
+                buffer.write(json.dumps(key).encode("utf-8"))
+                buffer.write(b":")
+                for chunk in encoder.iterencode(value):
+                    buffer.write(chunk.encode("utf-8"))
         
-        return report
\ No newline at end of file
+        buffer.write(b"}")
+        return buffer.getvalue()
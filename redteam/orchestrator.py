@@ -1,13 +1,31 @@
-"""Campaign Orchestrator - manages end-to-end execution of red team campaigns."""
+"""Campaign Orchestrator - manages end-to-end execution of red team campaigns.
+
+On Python 3.12+ the tasks the orchestrator creates itself (campaign runs and
+per-phase technique fan-out) start eagerly via ``asyncio.eager_task_factory``,
+so short-lived technique coroutines can finish without an extra event loop
+round-trip. The running loop's task factory is left untouched, and a custom
+factory already set on it is honoured instead.
+
+Setting ``CYBERSENTINEL_URING=1`` opts in to the io_uring-backed ``uringcore``
+event loop policy on Linux 5.11+ when the package is installed. Entry points
+apply it by calling ``install_uring_event_loop_policy()`` before
+``asyncio.run``; it only affects event loops created afterwards.
+"""
 
 import asyncio
+import contextvars
+import functools
+import itertools
 import logging
 import json
+import os
+import platform
 import uuid
 import random
-from typing import Dict, Any, List, Optional, Callable
+import time
+from typing import Dict, Any, List, Optional, Callable, Set, TextIO, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 
 from .framework import (
@@ -18,8 +36,121 @@ from .campaign_generator import ATTACKCampaignGenerator, CampaignTemplate
 from .telemetry_simulator import TelemetrySimulator, TelemetryEvent
 from .adversary_engine import AdversaryBehaviorEngine, TechniqueDecision
 
+try:
+    import uringcore
+except ImportError:
+    uringcore = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Available from Python 3.12
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+def _create_task(coro) -> asyncio.Task:
+    """Create one of the orchestrator's own tasks, starting it eagerly if supported.
+    
+    Only this task is affected: no task factory is installed on the loop,
+    and a loop that already has a custom factory keeps using it.
+    """
+    
+    loop = asyncio.get_running_loop()
+    if _EAGER_TASK_FACTORY is not None and loop.get_task_factory() is None:
+        return _EAGER_TASK_FACTORY(loop, coro)
+    return loop.create_task(coro)
+
+def _kernel_supports_uring() -> bool:
+    """Whether this is Linux 5.11 or newer, as uringcore requires."""
+    
+    if platform.system() != "Linux":
+        return False
+    try:
+        major, minor = platform.release().split("-", 1)[0].split(".")[:2]
+        return (int(major), int(minor)) >= (5, 11)
+    except ValueError:
+        return False
+
+def install_uring_event_loop_policy() -> bool:
+    """Switch to the uringcore event loop policy if opted in and available.
+
+    This sets the process-wide policy, so call it from the program entry
+    point before the event loop is created (e.g. before ``asyncio.run``).
+    Returns whether the uringcore policy is in effect.
+    """
+    
+    if os.environ.get("CYBERSENTINEL_URING") != "1":
+        return False
+    if uringcore is None or not _kernel_supports_uring():
+        logger.warning("CYBERSENTINEL_URING=1 but uringcore is unavailable; using the default event loop")
+        return False
+    
+    if not isinstance(asyncio.get_event_loop_policy(), uringcore.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+        logger.info("Installed uringcore event loop policy")
+    return True
+
+async def _fast_to_thread(func, /, *args, **kwargs):
+    """Run ``func`` in the default executor, like ``asyncio.to_thread``.
+    
+    The context is only carried over (via ``ctx.run``) when it actually
+    holds context variables.
+    """
+    
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(None, func, *args)
+    return await loop.run_in_executor(None, ctx.run, func, *args)
+
+# Security maturity tiers: index into the per-tier constants below
+_SEC_IDX = {"basic": 0, "intermediate": 1, "advanced": 2, "expert": 3}
+_ENV_RESIST = (0.8, 0.6, 0.4, 0.2)
+_DET_MULT = (0.3, 0.6, 0.9, 1.2)
+
+@functools.lru_cache(maxsize=4096)
+def _compute_probs(difficulty: float, stealth_rating: float, impact_rating: float,
+                   stealth_bucket: float, security_maturity: str) -> Tuple[float, float, float]:
+    """Return (success_rate, detection_rate, impact_rating) for a technique execution.
+    
+    Pure function of its arguments, so repeated executions of the same
+    technique at the same (bucketed) stealth level are a cache hit.
+    """
+    
+    # Calculate success probability
+    base_success_rate = 0.7  # Base 70% success rate
+    
+    # Adjust for technique difficulty
+    success_rate = base_success_rate * (1.0 - difficulty * 0.3)
+    
+    # Adjust for environment security (unknown maturity -> intermediate)
+    idx = _SEC_IDX.get(security_maturity, 1)
+    success_rate *= (1.0 + _ENV_RESIST[idx])
+    
+    # Calculate detection probability
+    base_detection_rate = 1.0 - stealth_rating
+    
+    # Adjust for stealth level
+    detection_rate = base_detection_rate * (1.0 - stealth_bucket * 0.6)
+    
+    # Adjust for environment detection capability
+    detection_rate *= _DET_MULT[idx]
+    
+    return success_rate, detection_rate, impact_rating
+
+# Plan phase name -> CampaignPhase, filled on first use of each name
+_PHASE_CACHE: Dict[str, CampaignPhase] = {}
+
+def _resolve_phase(phase_name: str) -> CampaignPhase:
+    """Map a plan phase name such as "Initial Access" to its CampaignPhase."""
+    
+    phase = _PHASE_CACHE.get(phase_name)
+    if phase is None:
+        phase = CampaignPhase(phase_name.lower().replace(" ", "_"))
+        _PHASE_CACHE[phase_name] = phase
+    return phase
+
 class ExecutionStatus(Enum):
     """Status of technique execution."""
     PENDING = "pending"
@@ -49,6 +180,36 @@ class TechniqueExecution:
         if self.telemetry_events is None:
             self.telemetry_events = []
 
+# Field names resolved once, for shallow event payloads
+_TECHNIQUE_EXECUTION_FIELDS = tuple(f.name for f in fields(TechniqueExecution))
+_TELEMETRY_EVENT_FIELDS = tuple(f.name for f in fields(TelemetryEvent))
+
+class _DataclassEncoder(json.JSONEncoder):
+    """JSON encoder that serializes record dataclasses without asdict copies.
+    
+    Dataclasses are emitted as a shallow mapping of their fields (which
+    works for ``slots=True`` classes too), enums as their value and
+    datetimes in ISO format.
+    """
+    
+    # Dataclass type -> its field names, resolved once per type
+    _field_names: Dict[type, Tuple[str, ...]] = {
+        TechniqueExecution: _TECHNIQUE_EXECUTION_FIELDS,
+        TelemetryEvent: _TELEMETRY_EVENT_FIELDS,
+    }
+    
+    def default(self, o):
+        if hasattr(o, "__dataclass_fields__"):
+            names = self._field_names.get(type(o))
+            if names is None:
+                names = self._field_names[type(o)] = tuple(f.name for f in fields(o))
+            return {name: getattr(o, name) for name in names}
+        if isinstance(o, Enum):
+            return o.value
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
 @dataclass
 class CampaignExecution:
     """Overall execution details for a campaign."""
@@ -63,18 +224,40 @@ class CampaignExecution:
     total_detections: int = 0
     overall_success_rate: float = 0.0
     stealth_effectiveness: float = 0.0
+    # Running tallies over techniques_executed, kept so status/report
+    # methods don't rescan the whole list
+    successful_count: int = 0
+    detected_count: int = 0
+    high_impact_count: int = 0
+    phases_attempted: Set[str] = None
     
     def __post_init__(self):
         if self.techniques_executed is None:
             self.techniques_executed = []
         if self.objectives_completed is None:
             self.objectives_completed = []
+        if self.phases_attempted is None:
+            self.phases_attempted = set()
+        # Monotonic clock reading at creation; elapsed-time checks use it
+        # instead of building datetimes
+        self._start_monotonic = time.monotonic()
+        # Most recently finished technique, for O(1) context lookups
+        self._last_technique_ref: Optional[TechniqueExecution] = None
+        # Per-technique outcome columns (one slot per techniques_executed
+        # record, same order) for the undetected-success scan in reports
+        self._success = bytearray()
+        self._detected = bytearray()
+        # Last get_campaign_execution_status() result; rebuilt once dirty
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_dirty = True
 
 class CampaignOrchestrator:
     """Orchestrates complete red team campaign execution."""
     
-    def __init__(self, simulator: RedTeamSimulator):
+    def __init__(self, simulator: RedTeamSimulator, max_concurrent_techniques: int = 64):
         self.simulator = simulator
+        # Upper bound on techniques in flight within one phase
+        self.max_concurrent_techniques = max(1, max_concurrent_techniques)
         self.campaign_generator = ATTACKCampaignGenerator()
         self.telemetry_simulator = TelemetrySimulator()
         
@@ -85,10 +268,23 @@ class CampaignOrchestrator:
         # Execution control
         self.execution_tasks: Dict[str, asyncio.Task] = {}
         self.event_handlers: List[Callable] = []
+        # event_handlers split into (sync, async), rebuilt when the list changes
+        self._handler_snapshot: Tuple[Callable, ...] = ()
+        self._handler_split: Tuple[Tuple[Callable, ...], Tuple[Callable, ...]] = ((), ())
+        
+        # Technique execution IDs: a per-orchestrator random prefix plus a
+        # counter, unique without a uuid4 per technique
+        self._exec_prefix = uuid.uuid4().hex[:8]
+        self._exec_counter = itertools.count()
         
         # Performance tracking
         self.execution_metrics: Dict[str, Dict[str, Any]] = {}
         
+        # Random generators for execution outcomes; campaigns get their own,
+        # seeded from their configuration, so simulations are reproducible
+        self._rng = random.Random()
+        self._campaign_rngs: Dict[str, random.Random] = {}
+        
         logger.info("Campaign orchestrator initialized")
     
     async def start_campaign(self, campaign_id: str, 
@@ -112,6 +308,7 @@ class CampaignOrchestrator:
             start_time=datetime.now()
         )
         self.active_campaigns[campaign_id] = execution
+        self._campaign_rngs[campaign_id] = random.Random(config.seed)
         
         # Generate campaign plan
         campaign_plan = await self._generate_campaign_plan(config)
@@ -127,21 +324,22 @@ class CampaignOrchestrator:
         )
         self.behavior_engines[campaign_id] = behavior_engine
         
+        # Update simulator state before the task starts, since an eager task
+        # may run to completion inside create_task
+        await self.simulator.start_campaign(campaign_id)
+        
         # Start campaign execution task
         if real_time:
-            execution_task = asyncio.create_task(
+            execution_task = _create_task(
                 self._execute_campaign_realtime(campaign_id, campaign_plan, speed_multiplier)
             )
         else:
-            execution_task = asyncio.create_task(
+            execution_task = _create_task(
                 self._execute_campaign_batch(campaign_id, campaign_plan)
             )
         
         self.execution_tasks[campaign_id] = execution_task
         
-        # Update simulator state
-        await self.simulator.start_campaign(campaign_id)
-        
         logger.info(f"Started campaign {campaign_id} execution")
         return True
     
@@ -149,8 +347,10 @@ class CampaignOrchestrator:
         """Generate a detailed campaign plan."""
         
         try:
-            # Generate campaign using the campaign generator
-            campaign_plan = self.campaign_generator.generate_campaign(
+            # Generate campaign using the campaign generator; planning is
+            # synchronous CPU work, so keep it off the event loop
+            campaign_plan = await _fast_to_thread(
+                self.campaign_generator.generate_campaign,
                 adversary_profile=config.adversary_profile,
                 target_environment=config.target_environment,
                 objectives=config.objectives,
@@ -173,7 +373,7 @@ class CampaignOrchestrator:
         """Execute campaign in real-time mode."""
         
         execution = self.active_campaigns[campaign_id]
-        behavior_engine = self.behavior_engines[campaign_id]
+        config = self.simulator.campaign_configs[campaign_id]
         
         try:
             phases = campaign_plan.get("phases", [])
@@ -181,33 +381,24 @@ class CampaignOrchestrator:
             
             for phase_data in phases:
                 phase_name = phase_data.get("name", "unknown")
-                execution.current_phase = CampaignPhase(phase_name.lower().replace(" ", "_"))
+                execution.current_phase = _resolve_phase(phase_name)
+                execution._status_dirty = True
                 
                 logger.info(f"Campaign {campaign_id} entering phase: {phase_name}")
                 
-                # Get techniques for this phase
+                # Run this phase's techniques, overlapping their execution delays
+                # up to the campaign's parallel_operations limit
                 phase_techniques = phase_data.get("techniques", [])
+                await self._execute_phase_techniques(
+                    campaign_id, phase_techniques,
+                    speed_multiplier=speed_multiplier,
+                    max_concurrent=max(1, config.parallel_operations)
+                )
                 
-                for technique_id in phase_techniques:
-                    # Check if campaign is still active
-                    if campaign_id not in self.active_campaigns:
-                        logger.info(f"Campaign {campaign_id} was stopped")
-                        return
-                    
-                    # Let behavior engine decide on technique execution
-                    decision = await behavior_engine.select_next_technique(
-                        current_phase=execution.current_phase,
-                        available_techniques=[technique_id],
-                        campaign_context=self._get_campaign_context(campaign_id)
-                    )
-                    
-                    if decision:
-                        # Wait for execution delay
-                        if decision.execution_delay:
-                            await asyncio.sleep(decision.execution_delay.total_seconds() / speed_multiplier)
-                        
-                        # Execute the technique
-                        await self._execute_technique(campaign_id, decision, None)
+                # Check if campaign is still active
+                if campaign_id not in self.active_campaigns:
+                    logger.info(f"Campaign {campaign_id} was stopped")
+                    return
                 
                 # Small delay between phases
                 await asyncio.sleep(10 / speed_multiplier)  # 10 seconds between phases
@@ -223,34 +414,24 @@ class CampaignOrchestrator:
         """Execute campaign in batch mode (no time delays)."""
         
         execution = self.active_campaigns[campaign_id]
-        behavior_engine = self.behavior_engines[campaign_id]
         
         try:
             phases = campaign_plan.get("phases", [])
             
             for phase_data in phases:
                 phase_name = phase_data.get("name", "unknown")
-                execution.current_phase = CampaignPhase(phase_name.lower().replace(" ", "_"))
+                execution.current_phase = _resolve_phase(phase_name)
+                execution._status_dirty = True
                 
                 logger.info(f"Campaign {campaign_id} executing phase: {phase_name}")
                 
                 # Get techniques for this phase
                 phase_techniques = phase_data.get("techniques", [])
+                await self._execute_phase_techniques(campaign_id, phase_techniques)
                 
-                for technique_id in phase_techniques:
-                    # Check if campaign is still active
-                    if campaign_id not in self.active_campaigns:
-                        return
-                    
-                    # Get behavior engine decision
-                    decision = await behavior_engine.select_next_technique(
-                        current_phase=execution.current_phase,
-                        available_techniques=[technique_id],
-                        campaign_context=self._get_campaign_context(campaign_id)
-                    )
-                    
-                    if decision:
-                        await self._execute_technique(campaign_id, decision, None)
+                # Check if campaign is still active
+                if campaign_id not in self.active_campaigns:
+                    return
             
             # Campaign completed
             await self._complete_campaign(campaign_id)
@@ -259,15 +440,112 @@ class CampaignOrchestrator:
             logger.error(f"Error executing campaign {campaign_id}: {e}")
             await self._fail_campaign(campaign_id, str(e))
     
-    async def _execute_technique(self, campaign_id: str, decision: TechniqueDecision, technique_step):
-        """Execute a single technique."""
+    async def _execute_phase_techniques(self, campaign_id: str, phase_techniques: List[str],
+                                      speed_multiplier: Optional[float] = None,
+                                      max_concurrent: Optional[int] = None):
+        """Execute the techniques of one phase concurrently.
+        
+        Phases still run one after another, so techniques that depend on
+        an earlier phase's results see them. At most ``max_concurrent``
+        (capped by ``max_concurrent_techniques``) run at once: every
+        technique gets a lightweight gate task up front, but its decision
+        and execution only start once it passes the semaphore.
+        
+        In real-time mode each technique records its result (counters,
+        behavior engine, handlers) itself as soon as it finishes. In batch
+        mode telemetry is deferred and generated for the whole phase with a
+        single simulator call, so results are only recorded once the phase
+        is done; completion order then decides just the order they are
+        recorded in and which decision error is raised.
+        """
+        
+        defer_telemetry = speed_multiplier is None
+        limit = self.max_concurrent_techniques
+        if max_concurrent is not None:
+            limit = min(limit, max_concurrent)
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def _gated(technique_id):
+            async with semaphore:
+                return await self._execute_technique_with_decision(
+                    campaign_id, technique_id, speed_multiplier, defer_telemetry=defer_telemetry
+                )
+        
+        tasks = [_create_task(_gated(technique_id)) for technique_id in phase_techniques]
+        
+        pending = []
+        first_error: Optional[Exception] = None
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception as e:
+                if first_error is None:
+                    first_error = e
+                continue
+            if result is not None:
+                pending.append(result)
+        
+        if defer_telemetry:
+            await self._complete_techniques_batch(campaign_id, pending)
+        
+        # Surface the first decision error so the campaign is failed as before
+        if first_error is not None:
+            raise first_error
+    
+    async def _execute_technique_with_decision(self, campaign_id: str, technique_id: str,
+                                             speed_multiplier: Optional[float] = None,
+                                             defer_telemetry: bool = False):
+        """Let the behavior engine decide on a planned technique and execute it.
+        
+        In real-time mode (``speed_multiplier`` set) the decision's execution
+        delay is honoured before executing. With ``defer_telemetry`` the
+        pending technique is returned for ``_complete_techniques_batch``.
+        """
+        
+        # Check if campaign is still active
+        if campaign_id not in self.active_campaigns:
+            return
+        
+        execution = self.active_campaigns[campaign_id]
+        behavior_engine = self.behavior_engines[campaign_id]
+        
+        # Let behavior engine decide on technique execution
+        decision = await behavior_engine.select_next_technique(
+            current_phase=execution.current_phase,
+            available_techniques=[technique_id],
+            campaign_context=self._get_campaign_context(campaign_id)
+        )
+        # Decisions move the adversary state reported in the status
+        execution._status_dirty = True
+        
+        if not decision:
+            return
+        
+        # Wait for execution delay
+        if speed_multiplier is not None and decision.execution_delay:
+            await asyncio.sleep(decision.execution_delay.total_seconds() / speed_multiplier)
+            if campaign_id not in self.active_campaigns:
+                return
+        
+        # Execute the technique
+        return await self._execute_technique(campaign_id, decision, None,
+                                             defer_telemetry=defer_telemetry)
+    
+    async def _execute_technique(self, campaign_id: str, decision: TechniqueDecision, technique_step,
+                                 defer_telemetry: bool = False):
+        """Execute a single technique.
+        
+        With ``defer_telemetry`` the technique is only simulated and an
+        ``(execution, behavior_engine, tech_execution)`` tuple is returned so
+        the caller can generate its telemetry as part of a batch.
+        """
         
         execution = self.active_campaigns[campaign_id]
         behavior_engine = self.behavior_engines[campaign_id]
         
         # Create technique execution record
         tech_execution = TechniqueExecution(
-            execution_id=str(uuid.uuid4()),
+            execution_id=f"{self._exec_prefix}-{next(self._exec_counter):08x}",
             technique_id=decision.technique_id,
             campaign_id=campaign_id,
             phase=execution.current_phase,
@@ -276,7 +554,12 @@ class CampaignOrchestrator:
             stealth_level=decision.stealth_level
         )
         
+        slot = len(execution.techniques_executed)
         execution.techniques_executed.append(tech_execution)
+        execution._success.append(0)
+        execution._detected.append(0)
+        execution.phases_attempted.add(tech_execution.phase.value)
+        execution._status_dirty = True
         
         try:
             logger.info(f"Executing technique {decision.technique_id} for campaign {campaign_id}")
@@ -294,6 +577,16 @@ class CampaignOrchestrator:
             tech_execution.success = success
             tech_execution.detected = detected
             tech_execution.impact_score = impact
+            execution.successful_count += int(success)
+            execution.detected_count += int(detected)
+            execution.high_impact_count += int(impact > 0.7)
+            execution._success[slot] = success
+            execution._detected[slot] = detected
+            execution._last_technique_ref = tech_execution
+            execution._status_dirty = True
+            
+            if defer_telemetry:
+                return execution, behavior_engine, tech_execution
             
             # Generate telemetry events
             telemetry_events = await self.telemetry_simulator.generate_technique_telemetry(
@@ -302,33 +595,91 @@ class CampaignOrchestrator:
                 stealth_level=decision.stealth_level
             )
             
-            # Store event IDs
-            tech_execution.telemetry_events = [event.event_id for event in telemetry_events]
-            execution.total_telemetry_events += len(telemetry_events)
-            
-            if detected:
-                execution.total_detections += 1
-                execution.total_alerts_triggered += 1
+            await self._record_technique_result(campaign_id, execution, behavior_engine,
+                                                tech_execution, telemetry_events)
             
-            # Notify behavior engine of result
-            await behavior_engine.process_technique_result(
-                technique_id=decision.technique_id,
-                success=success,
-                detected=detected,
-                impact=impact
+        except Exception as e:
+            self._mark_technique_failed(execution, tech_execution, e)
+    
+    async def _complete_techniques_batch(self, campaign_id: str,
+                                         pending: List[Tuple[CampaignExecution, AdversaryBehaviorEngine, TechniqueExecution]]):
+        """Generate telemetry for a phase's deferred techniques in one call and record the results."""
+        
+        if not pending:
+            return
+        
+        # One request per technique ID; repeats of an ID in the same phase
+        # fall back to their own call so each execution gets its own events
+        batch_requests = {}
+        for _, _, tech_execution in pending:
+            batch_requests.setdefault(tech_execution.technique_id, tech_execution.stealth_level)
+        
+        try:
+            telemetry_by_technique = await self.telemetry_simulator.generate_technique_telemetry_batch(
+                list(batch_requests.items()),
+                duration_minutes=60  # 1 hour of telemetry
             )
-            
-            # Fire event handlers
-            await self._fire_technique_completed_event(campaign_id, tech_execution, telemetry_events)
-            
-            logger.info(f"Technique {decision.technique_id} completed: success={success}, detected={detected}, impact={impact:.2f}")
-            
         except Exception as e:
-            tech_execution.status = ExecutionStatus.FAILED
-            tech_execution.error_message = str(e)
-            tech_execution.end_time = datetime.now()
-            
-            logger.error(f"Technique {decision.technique_id} failed: {e}")
+            for execution, _, tech_execution in pending:
+                self._mark_technique_failed(execution, tech_execution, e)
+            return
+        
+        for execution, behavior_engine, tech_execution in pending:
+            try:
+                telemetry_events = telemetry_by_technique.pop(tech_execution.technique_id, None)
+                if telemetry_events is None:
+                    telemetry_events = await self.telemetry_simulator.generate_technique_telemetry(
+                        technique_id=tech_execution.technique_id,
+                        duration_minutes=60,
+                        stealth_level=tech_execution.stealth_level
+                    )
+                
+                await self._record_technique_result(campaign_id, execution, behavior_engine,
+                                                    tech_execution, telemetry_events)
+            except Exception as e:
+                self._mark_technique_failed(execution, tech_execution, e)
+    
+    async def _record_technique_result(self, campaign_id: str, execution: CampaignExecution,
+                                       behavior_engine: AdversaryBehaviorEngine,
+                                       tech_execution: TechniqueExecution,
+                                       telemetry_events: List[TelemetryEvent]):
+        """Attach telemetry to a simulated technique, notify the behavior engine and fire handlers."""
+        
+        # Store event IDs
+        tech_execution.telemetry_events = [event.event_id for event in telemetry_events]
+        execution.total_telemetry_events += len(telemetry_events)
+        
+        if tech_execution.detected:
+            execution.total_detections += 1
+            execution.total_alerts_triggered += 1
+        
+        # Notify behavior engine of result
+        await behavior_engine.process_technique_result(
+            technique_id=tech_execution.technique_id,
+            success=tech_execution.success,
+            detected=tech_execution.detected,
+            impact=tech_execution.impact_score
+        )
+        
+        execution._status_dirty = True
+        
+        # Fire event handlers
+        await self._fire_technique_completed_event(campaign_id, tech_execution, telemetry_events)
+        
+        logger.info(f"Technique {tech_execution.technique_id} completed: success={tech_execution.success}, "
+                    f"detected={tech_execution.detected}, impact={tech_execution.impact_score:.2f}")
+    
+    def _mark_technique_failed(self, execution: CampaignExecution,
+                               tech_execution: TechniqueExecution, error: Exception):
+        """Record a technique that raised while executing."""
+        
+        tech_execution.status = ExecutionStatus.FAILED
+        tech_execution.error_message = str(error)
+        tech_execution.end_time = datetime.now()
+        execution._last_technique_ref = tech_execution
+        execution._status_dirty = True
+        
+        logger.error(f"Technique {tech_execution.technique_id} failed: {error}")
     
     async def _simulate_technique_execution(self, technique_id: str, stealth_level: float, 
                                           campaign_id: str) -> tuple[bool, bool, float]:
@@ -343,36 +694,21 @@ class CampaignOrchestrator:
         config = self.simulator.campaign_configs[campaign_id]
         environment = config.target_environment
         
-        # Calculate success probability
-        base_success_rate = 0.7  # Base 70% success rate
-        
-        # Adjust for technique difficulty
-        success_rate = base_success_rate * (1.0 - technique.difficulty * 0.3)
+        success_rate, detection_rate, impact_rating = _compute_probs(
+            technique.difficulty, technique.stealth_rating, technique.impact_rating,
+            round(stealth_level, 2), environment.security_maturity
+        )
         
-        # Adjust for environment security
-        security_levels = {"basic": 0.8, "intermediate": 0.6, "advanced": 0.4, "expert": 0.2}
-        env_resistance = security_levels.get(environment.security_maturity, 0.6)
-        success_rate *= (1.0 + env_resistance)
+        rng = self._campaign_rngs.get(campaign_id, self._rng)
         
         # Random success determination
-        success = random.random() < success_rate
-        
-        # Calculate detection probability
-        base_detection_rate = 1.0 - technique.stealth_rating
-        
-        # Adjust for stealth level
-        detection_rate = base_detection_rate * (1.0 - stealth_level * 0.6)
-        
-        # Adjust for environment detection capability
-        security_multiplier = {"basic": 0.3, "intermediate": 0.6, "advanced": 0.9, "expert": 1.2}
-        detection_multiplier = security_multiplier.get(environment.security_maturity, 0.6)
-        detection_rate *= detection_multiplier
+        success = rng.random() < success_rate
         
         # Random detection determination
-        detected = random.random() < detection_rate
+        detected = rng.random() < detection_rate
         
         # Calculate impact
-        impact = technique.impact_rating * (1.0 if success else 0.0)
+        impact = impact_rating * (1.0 if success else 0.0)
         
         return success, detected, impact
     
@@ -385,27 +721,29 @@ class CampaignOrchestrator:
         
         # Calculate campaign metrics
         total_techniques = len(execution.techniques_executed)
-        successful_techniques = sum(1 for t in execution.techniques_executed if t.success)
+        successful_techniques = execution.successful_count
         
         success_rate = successful_techniques / max(total_techniques, 1)
         detection_rate = execution.total_detections / max(total_techniques, 1)
         
-        campaign_duration = datetime.now() - execution.start_time
-        campaign_duration_hours = campaign_duration.total_seconds() / 3600
+        campaign_duration_hours = (time.monotonic() - execution._start_monotonic) / 3600
         
         # Calculate progress based on techniques executed vs planned
         config = self.simulator.campaign_configs[campaign_id]
         planned_duration = config.duration.total_seconds() / 3600
         progress = min(1.0, campaign_duration_hours / planned_duration)
         
+        last_technique = execution._last_technique_ref
+        last_success = last_technique is not None and last_technique.success
+        
         return {
             "campaign_duration_hours": campaign_duration_hours,
             "campaign_progress": progress,
             "recent_success_rate": success_rate,
             "recent_detection_rate": detection_rate,
             "recent_detections": execution.total_detections,
-            "last_technique_success": execution.techniques_executed[-1].success if execution.techniques_executed else False,
-            "last_technique_failure": not execution.techniques_executed[-1].success if execution.techniques_executed else False,
+            "last_technique_success": last_success,
+            "last_technique_failure": last_technique is not None and not last_success,
             "campaign_start": total_techniques == 0
         }
     
@@ -417,66 +755,74 @@ class CampaignOrchestrator:
         
         # Calculate final metrics
         total_techniques = len(execution.techniques_executed)
-        successful_techniques = sum(1 for t in execution.techniques_executed if t.success)
+        successful_techniques = execution.successful_count
         
         execution.overall_success_rate = successful_techniques / max(total_techniques, 1)
         
         # Calculate stealth effectiveness
-        undetected_techniques = sum(1 for t in execution.techniques_executed if not t.detected)
+        undetected_techniques = total_techniques - execution.detected_count
         execution.stealth_effectiveness = undetected_techniques / max(total_techniques, 1)
+        execution._status_dirty = True
         
         # Update simulator state
-        simulator_state = self.simulator.active_campaigns[campaign_id]
-        simulator_state.status = CampaignStatus.COMPLETED
-        simulator_state.end_time = execution.end_time
-        simulator_state.techniques_executed = [t.technique_id for t in execution.techniques_executed]
-        simulator_state.telemetry_generated = execution.total_telemetry_events
-        simulator_state.alerts_triggered = execution.total_alerts_triggered
+        self.simulator.update_campaign_state(
+            campaign_id,
+            status=CampaignStatus.COMPLETED,
+            end_time=execution.end_time,
+            techniques_executed=[t.technique_id for t in execution.techniques_executed],
+            telemetry_generated=execution.total_telemetry_events,
+            alerts_triggered=execution.total_alerts_triggered
+        )
         
         logger.info(f"Campaign {campaign_id} completed with {execution.overall_success_rate:.1%} success rate")
         
-        # Fire completion event
-        await self._fire_campaign_completed_event(campaign_id)
+        # Fire completion event with the final status, built once
+        if self.event_handlers:
+            await self._fire_campaign_completed_event(
+                campaign_id, self.get_campaign_execution_status(campaign_id)
+            )
     
     async def _fail_campaign(self, campaign_id: str, error_message: str):
         """Mark campaign as failed."""
         
         execution = self.active_campaigns[campaign_id]
         execution.end_time = datetime.now()
+        execution._status_dirty = True
         
         # Update simulator state
-        simulator_state = self.simulator.active_campaigns[campaign_id]
-        simulator_state.status = CampaignStatus.FAILED
-        simulator_state.end_time = execution.end_time
+        self.simulator.update_campaign_state(
+            campaign_id, status=CampaignStatus.FAILED, end_time=execution.end_time
+        )
         
         logger.error(f"Campaign {campaign_id} failed: {error_message}")
         
-        # Fire failure event
-        await self._fire_campaign_failed_event(campaign_id, error_message)
+        # Fire failure event with the final status, built once
+        if self.event_handlers:
+            await self._fire_campaign_failed_event(
+                campaign_id, error_message, self.get_campaign_execution_status(campaign_id)
+            )
     
     async def stop_campaign(self, campaign_id: str) -> bool:
         """Stop a running campaign."""
         
-        if campaign_id not in self.active_campaigns:
+        execution = self.active_campaigns.pop(campaign_id, None)
+        if execution is None:
             return False
         
         # Cancel execution task
-        if campaign_id in self.execution_tasks:
-            self.execution_tasks[campaign_id].cancel()
-            del self.execution_tasks[campaign_id]
+        task = self.execution_tasks.pop(campaign_id, None)
+        if task is not None:
+            task.cancel()
         
         # Clean up resources
-        if campaign_id in self.behavior_engines:
-            del self.behavior_engines[campaign_id]
+        self.behavior_engines.pop(campaign_id, None)
+        self._campaign_rngs.pop(campaign_id, None)
         
         # Update state
-        execution = self.active_campaigns[campaign_id]
         execution.end_time = datetime.now()
         
         await self.simulator.stop_campaign(campaign_id)
         
-        del self.active_campaigns[campaign_id]
-        
         logger.info(f"Stopped campaign {campaign_id}")
         return True
     
@@ -496,18 +842,25 @@ class CampaignOrchestrator:
         return True
     
     def get_campaign_execution_status(self, campaign_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed execution status for a campaign."""
+        """Get detailed execution status for a campaign.
+        
+        The dict is cached until the campaign's state changes, so repeated
+        calls return the same object; treat it as read-only.
+        """
         
         if campaign_id not in self.active_campaigns:
             return None
         
         execution = self.active_campaigns[campaign_id]
+        if not execution._status_dirty:
+            return execution._status_cache
+        
         behavior_engine = self.behavior_engines.get(campaign_id)
         
         # Calculate metrics
         total_techniques = len(execution.techniques_executed)
-        successful_techniques = sum(1 for t in execution.techniques_executed if t.success)
-        detected_techniques = sum(1 for t in execution.techniques_executed if t.detected)
+        successful_techniques = execution.successful_count
+        detected_techniques = execution.detected_count
         
         status = {
             "campaign_id": campaign_id,
@@ -526,6 +879,8 @@ class CampaignOrchestrator:
             "adversary_status": behavior_engine.get_adversary_status() if behavior_engine else None
         }
         
+        execution._status_cache = status
+        execution._status_dirty = False
         return status
     
     def list_active_campaigns(self) -> List[str]:
@@ -536,66 +891,104 @@ class CampaignOrchestrator:
         """Add an event handler for campaign events."""
         self.event_handlers.append(handler)
     
+    def _split_handlers(self) -> Tuple[Tuple[Callable, ...], Tuple[Callable, ...]]:
+        """Return ``event_handlers`` as (sync, async) handlers, re-splitting only after changes."""
+        
+        snapshot = tuple(self.event_handlers)
+        if snapshot != self._handler_snapshot:
+            self._handler_snapshot = snapshot
+            self._handler_split = (
+                tuple(h for h in snapshot if not asyncio.iscoroutinefunction(h)),
+                tuple(h for h in snapshot if asyncio.iscoroutinefunction(h)),
+            )
+        return self._handler_split
+    
+    async def _dispatch_event(self, event_data: Dict[str, Any]):
+        """Deliver an event to all handlers in ``event_handlers``.
+        
+        Sync handlers run inline first, in registration order; async
+        handlers then run concurrently. Sync handlers therefore always run
+        before async ones, whatever order they were registered in. Handler
+        errors are logged and never propagate.
+        """
+        
+        sync_handlers, async_handlers = self._split_handlers()
+        for handler in sync_handlers:
+            try:
+                handler(event_data)
+            except Exception as e:
+                logger.error(f"Error in event handler: {e}")
+        
+        if async_handlers:
+            results = await asyncio.gather(
+                *(handler(event_data) for handler in async_handlers),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in event handler: {result}")
+    
     async def _fire_technique_completed_event(self, campaign_id: str, 
                                             technique_execution: TechniqueExecution,
                                             telemetry_events: List[TelemetryEvent]):
-        """Fire event when technique completes."""
+        """Fire event when technique completes.
+        
+        The payload dicts are shallow: nested lists and dicts are shared with
+        the execution and telemetry records, so handlers must not mutate them.
+        """
+        
+        # Skip building the payload when nobody is listening
+        if not self.event_handlers:
+            return
         
         event_data = {
             "type": "technique_completed",
             "campaign_id": campaign_id,
-            "technique_execution": asdict(technique_execution),
-            "telemetry_events": [asdict(event) for event in telemetry_events]
+            "technique_execution": {
+                name: getattr(technique_execution, name) for name in _TECHNIQUE_EXECUTION_FIELDS
+            },
+            "telemetry_events": [
+                {name: getattr(event, name) for name in _TELEMETRY_EVENT_FIELDS}
+                for event in telemetry_events
+            ]
         }
         
-        for handler in self.event_handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event_data)
-                else:
-                    handler(event_data)
-            except Exception as e:
-                logger.error(f"Error in event handler: {e}")
+        await self._dispatch_event(event_data)
     
-    async def _fire_campaign_completed_event(self, campaign_id: str):
+    async def _fire_campaign_completed_event(self, campaign_id: str,
+                                           execution_summary: Optional[Dict[str, Any]]):
         """Fire event when campaign completes."""
         
+        if not self.event_handlers:
+            return
+        
         event_data = {
             "type": "campaign_completed",
             "campaign_id": campaign_id,
-            "execution_summary": self.get_campaign_execution_status(campaign_id)
+            "execution_summary": execution_summary
         }
         
-        for handler in self.event_handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event_data)
-                else:
-                    handler(event_data)
-            except Exception as e:
-                logger.error(f"Error in event handler: {e}")
+        await self._dispatch_event(event_data)
     
-    async def _fire_campaign_failed_event(self, campaign_id: str, error_message: str):
+    async def _fire_campaign_failed_event(self, campaign_id: str, error_message: str,
+                                        execution_summary: Optional[Dict[str, Any]]):
         """Fire event when campaign fails."""
         
+        if not self.event_handlers:
+            return
+        
         event_data = {
             "type": "campaign_failed",
             "campaign_id": campaign_id,
             "error_message": error_message,
-            "execution_summary": self.get_campaign_execution_status(campaign_id)
+            "execution_summary": execution_summary
         }
         
-        for handler in self.event_handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event_data)
-                else:
-                    handler(event_data)
-            except Exception as e:
-                logger.error(f"Error in event handler: {e}")
+        await self._dispatch_event(event_data)
     
-    def export_campaign_report(self, campaign_id: str) -> Optional[Dict[str, Any]]:
-        """Export comprehensive campaign report."""
+    def _campaign_report_sections(self, campaign_id: str,
+                                  technique_details: List[Any]) -> Optional[List[Tuple[str, Any]]]:
+        """Build the campaign report as ordered (section, value) pairs."""
         
         if campaign_id not in self.active_campaigns:
             return None
@@ -604,15 +997,8 @@ class CampaignOrchestrator:
         config = self.simulator.campaign_configs[campaign_id]
         behavior_engine = self.behavior_engines.get(campaign_id)
         
-        # Collect all telemetry events
-        all_telemetry = []
-        for tech_exec in execution.techniques_executed:
-            # Would need to retrieve actual telemetry events by ID
-            # For now, just include event IDs
-            all_telemetry.extend(tech_exec.telemetry_events)
-        
-        report = {
-            "campaign_info": {
+        return [
+            ("campaign_info", {
                 "campaign_id": campaign_id,
                 "name": config.name,
                 "adversary_profile": config.adversary_profile.name,
@@ -621,28 +1007,63 @@ class CampaignOrchestrator:
                 "end_time": execution.end_time.isoformat() if execution.end_time else None,
                 "duration_planned": str(config.duration),
                 "duration_actual": str(execution.end_time - execution.start_time) if execution.end_time else None
-            },
-            "execution_summary": {
-                "phases_completed": list(set(t.phase.value for t in execution.techniques_executed)),
+            }),
+            ("execution_summary", {
+                "phases_completed": list(execution.phases_attempted),
                 "techniques_executed": len(execution.techniques_executed),
-                "techniques_successful": sum(1 for t in execution.techniques_executed if t.success),
-                "techniques_detected": sum(1 for t in execution.techniques_executed if t.detected),
+                "techniques_successful": execution.successful_count,
+                "techniques_detected": execution.detected_count,
                 "success_rate": execution.overall_success_rate,
                 "stealth_effectiveness": execution.stealth_effectiveness,
                 "objectives_completed": execution.objectives_completed
-            },
-            "technique_details": [asdict(t) for t in execution.techniques_executed],
-            "telemetry_summary": {
+            }),
+            ("technique_details", technique_details),
+            ("telemetry_summary", {
                 "total_events": execution.total_telemetry_events,
                 "alerts_triggered": execution.total_alerts_triggered,
-                "detection_opportunities": len([t for t in execution.techniques_executed if t.detected])
-            },
-            "adversary_behavior": behavior_engine.export_behavior_log() if behavior_engine else [],
-            "lessons_learned": self._generate_lessons_learned(execution),
-            "recommendations": self._generate_recommendations(execution)
-        }
+                "detection_opportunities": execution.detected_count
+            }),
+            ("adversary_behavior", behavior_engine.export_behavior_log() if behavior_engine else []),
+            ("lessons_learned", self._generate_lessons_learned(execution)),
+            ("recommendations", self._generate_recommendations(execution))
+        ]
+    
+    def export_campaign_report(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """Export comprehensive campaign report."""
+        
+        execution = self.active_campaigns.get(campaign_id)
+        if execution is None:
+            return None
         
-        return report
+        sections = self._campaign_report_sections(
+            campaign_id, [asdict(t) for t in execution.techniques_executed]
+        )
+        return dict(sections)
+    
+    def export_campaign_report_stream(self, campaign_id: str, fp: TextIO) -> bool:
+        """Write the campaign report as JSON to a text file object.
+        
+        Technique records are encoded straight from the dataclasses rather
+        than copied into dicts first. Returns False for unknown campaigns.
+        """
+        
+        execution = self.active_campaigns.get(campaign_id)
+        if execution is None:
+            return False
+        
+        sections = self._campaign_report_sections(campaign_id, execution.techniques_executed)
+        encoder = _DataclassEncoder()
+        
+        fp.write("{")
+        for index, (key, value) in enumerate(sections):
+            if index:
+                fp.write(", ")
+            fp.write(json.dumps(key))
+            fp.write(": ")
+            for chunk in encoder.iterencode(value):
+                fp.write(chunk)
+        fp.write("}")
+        return True
     
     def _generate_lessons_learned(self, execution: CampaignExecution) -> List[str]:
         """Generate lessons learned from campaign execution."""
@@ -662,8 +1083,7 @@ class CampaignOrchestrator:
             lessons.append("Low stealth effectiveness shows good detection coverage")
         
         # Phase analysis
-        phases_attempted = set(t.phase.value for t in execution.techniques_executed)
-        if CampaignPhase.INITIAL_ACCESS.value not in phases_attempted:
+        if CampaignPhase.INITIAL_ACCESS.value not in execution.phases_attempted:
             lessons.append("Campaign did not achieve initial access - perimeter defenses effective")
         
         return lessons
@@ -674,19 +1094,22 @@ class CampaignOrchestrator:
         recommendations = []
         
         # Detection improvements
-        undetected_techniques = [t for t in execution.techniques_executed if t.success and not t.detected]
-        if undetected_techniques:
-            techniques = set(t.technique_id for t in undetected_techniques)
+        executed = execution.techniques_executed
+        undetected = [
+            i for i, (success, detected) in enumerate(zip(execution._success, execution._detected))
+            if success and not detected
+        ]
+        if undetected:
+            techniques = dict.fromkeys(executed[i].technique_id for i in undetected)
             recommendations.append(f"Improve detection for techniques: {', '.join(techniques)}")
         
         # High-impact techniques
-        high_impact_techniques = [t for t in execution.techniques_executed if t.impact_score > 0.7]
-        if high_impact_techniques:
+        if execution.high_impact_count:
             recommendations.append("Focus protection on high-impact attack vectors")
         
         # Common failure points
-        failed_techniques = [t for t in execution.techniques_executed if not t.success]
-        if len(failed_techniques) > len(execution.techniques_executed) * 0.5:
+        total_techniques = len(execution.techniques_executed)
+        if total_techniques - execution.successful_count > total_techniques * 0.5:
             recommendations.append("Current defenses are effective - maintain security posture")
         
         return recommendations
\ No newline at end of file
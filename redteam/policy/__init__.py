@@ -1,12 +1,13 @@
 """Policy modules for RL adversary training."""
 
-from .simple_pg import SimplePolicyGradient, PolicyNetwork, random_policy_action
+from .simple_pg import SimplePolicyGradient, PolicyNetwork, random_policy_action, random_policy_actions
 from .ppo import PPO, ActorCriticNetwork
 
 __all__ = [
     "SimplePolicyGradient",
     "PolicyNetwork",
     "random_policy_action",
+    "random_policy_actions",
     "PPO",
     "ActorCriticNetwork",
 ]
@@ -4,6 +4,8 @@ Proximal Policy Optimization (PPO) implementation.
 Supports both PyTorch (preferred) and pure NumPy fallback.
 """
 
+import contextlib
+import math
 import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 from pathlib import Path
@@ -14,17 +16,221 @@ try:
     import torch
     import torch.nn as nn
     import torch.optim as optim
-    from torch.distributions import Categorical
     TORCH_AVAILABLE = True
 except (ImportError, AttributeError, Exception):
     TORCH_AVAILABLE = False
     torch = None
     nn = None
     optim = None
-    Categorical = None
 
+# Try to import numba
+NUMBA_AVAILABLE = False
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+
+def log_softmax(x: np.ndarray, mask: Optional[np.ndarray] = None, axis: int = -1) -> np.ndarray:
+    """
+    Numerically stable log-softmax.
+
+    Args:
+        x: Logits
+        mask: Optional boolean mask; masked-out entries get a logit of -1e9
+        axis: Axis to normalize over
+
+    Returns:
+        Log-probabilities with the same shape as ``x``
+    """
+    if mask is not None:
+        x = np.where(mask, x, -1e9)
+    shifted = x - x.max(axis=axis, keepdims=True)
+    return shifted - np.log(np.exp(shifted).sum(axis=axis, keepdims=True))
+
+
+def _log_softmax_row(logits, mask, log_out, prob_out):
+    """
+    Fused masked log-softmax and softmax for one row of logits.
+
+    One pass for the max, one for exp and the sum, and one that applies a
+    single reciprocal instead of dividing every entry. Only used when Numba
+    can compile it; NumPy's per-call overhead dominates at this size.
+    """
+    # Seed the max from the first entry: fastmath assumes no infinities
+    m = logits[0] if mask[0] else -1e9
+    log_out[0] = m
+    for i in range(1, logits.shape[0]):
+        v = logits[i] if mask[i] else -1e9
+        log_out[i] = v
+        if v > m:
+            m = v
+    total = 0.0
+    for i in range(logits.shape[0]):
+        e = math.exp(log_out[i] - m)
+        prob_out[i] = e
+        total += e
+    inv_total = 1.0 / total
+    log_total = m + math.log(total)
+    for i in range(logits.shape[0]):
+        prob_out[i] *= inv_total
+        log_out[i] -= log_total
+
+
+def _discounted_scan(deltas, discounts, out):
+    """Backward recurrence ``out[t] = deltas[t] + discounts[t] * out[t + 1]``."""
+    acc = 0.0
+    for t in range(len(deltas) - 1, -1, -1):
+        acc = deltas[t] + discounts[t] * acc
+        out[t] = acc
+
+
+if NUMBA_AVAILABLE:
+    _discounted_scan = numba.njit(cache=True)(_discounted_scan)
+    _log_softmax_row = numba.njit(cache=True, fastmath=True, boundscheck=False)(_log_softmax_row)
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False)
+    def _ppo_step_numba(obs, actions, advantages, returns, old_log_probs, masks,
+                        w1, b1, w2, b2, w_policy, b_policy, w_value, b_value,
+                        clip_ratio, lr):
+        """
+        One full-batch NumPy-path PPO epoch, compiled with Numba.
+
+        Runs the forward pass sample by sample with fused loops, accumulates
+        the same gradients as ``PPO._update_numpy`` and updates ``w_policy``
+        and ``w_value`` in place.
+
+        Returns:
+            Tuple of summed (policy_loss, value_loss, entropy) over the batch
+        """
+        n, obs_dim = obs.shape
+        hidden_dim = w1.shape[1]
+        n_actions = w_policy.shape[1]
+
+        h1 = np.empty(hidden_dim, dtype=np.float32)
+        h2 = np.empty(hidden_dim, dtype=np.float32)
+        logits = np.empty(n_actions, dtype=np.float32)
+        dlogits = np.empty(n_actions, dtype=np.float32)
+        grad_policy = np.zeros(w_policy.shape, dtype=np.float32)
+        grad_value = np.zeros(hidden_dim, dtype=np.float32)
+
+        policy_loss = 0.0
+        value_loss = 0.0
+        entropy = 0.0
+
+        for i in range(n):
+            # Shared layers with tanh
+            h1[:] = b1
+            for j in range(obs_dim):
+                x = obs[i, j]
+                for k in range(hidden_dim):
+                    h1[k] += x * w1[j, k]
+            for k in range(hidden_dim):
+                h1[k] = np.tanh(h1[k])
+
+            h2[:] = b2
+            for j in range(hidden_dim):
+                x = h1[j]
+                for k in range(hidden_dim):
+                    h2[k] += x * w2[j, k]
+            for k in range(hidden_dim):
+                h2[k] = np.tanh(h2[k])
+
+            # Masked policy logits and log-sum-exp
+            logits[:] = b_policy
+            for k in range(hidden_dim):
+                x = h2[k]
+                for a in range(n_actions):
+                    logits[a] += x * w_policy[k, a]
+            for a in range(n_actions):
+                if not masks[i, a]:
+                    logits[a] = -1e9
+            max_logit = logits[0]
+            for a in range(1, n_actions):
+                if logits[a] > max_logit:
+                    max_logit = logits[a]
+            sum_exp = 0.0
+            for a in range(n_actions):
+                logits[a] -= max_logit
+                sum_exp += np.exp(logits[a])
+            lse = np.log(sum_exp)
+
+            # Value
+            value = b_value[0]
+            for k in range(hidden_dim):
+                value += h2[k] * w_value[k, 0]
+
+            # Clipped surrogate and value losses
+            advantage = advantages[i]
+            action = actions[i]
+            ratio = np.exp(logits[action] - lse - old_log_probs[i])
+            clipped = min(max(ratio, 1.0 - clip_ratio), 1.0 + clip_ratio)
+            policy_loss -= min(ratio * advantage, clipped * advantage)
+            value_error = returns[i] - value
+            value_loss += 0.5 * value_error * value_error
+
+            # Entropy and policy gradient (probs - onehot(action)) * advantage
+            for a in range(n_actions):
+                log_prob = logits[a] - lse
+                prob = np.exp(log_prob)
+                entropy -= prob * log_prob
+                dlogits[a] = prob * advantage
+            dlogits[action] -= advantage
+            for k in range(hidden_dim):
+                x = h2[k]
+                for a in range(n_actions):
+                    grad_policy[k, a] += x * dlogits[a]
+                grad_value[k] += x * value_error
+
+        scale = lr / n
+        for k in range(hidden_dim):
+            for a in range(n_actions):
+                w_policy[k, a] -= scale * grad_policy[k, a]
+            w_value[k, 0] += scale * grad_value[k]
+
+        return policy_loss, value_loss, entropy
+
+
+class RunningMeanStd:
+    """
+    Running mean and variance of a stream of batches.
+
+    Batches are merged with the parallel form of Welford's algorithm, so
+    each update is one mean/var pass over the new batch only.
+    """
+
+    def __init__(self, epsilon: float = 1e-4):
+        self.mean = 0.0
+        self.var = 1.0
+        self.count = epsilon
+
+    def update(self, x: np.ndarray):
+        """Fold a batch of samples into the running statistics."""
+        batch_count = x.shape[0]
+        if batch_count == 0:
+            return
+        batch_mean = float(x.mean())
+        batch_var = float(x.var())
+
+        delta = batch_mean - self.mean
+        total = self.count + batch_count
+        self.mean += delta * batch_count / total
+        m2 = self.var * self.count + batch_var * batch_count + delta ** 2 * self.count * batch_count / total
+        self.var = m2 / total
+        self.count = total
+
+    def normalize(self, x: np.ndarray) -> np.ndarray:
+        """Standardize ``x`` with the running statistics."""
+        return (x - self.mean) / (np.sqrt(self.var) + 1e-8)
+
+
+# nn.Module when torch is importable, so sub-networks register themselves
+_ModuleBase = nn.Module if TORCH_AVAILABLE else object
 
-class ActorCriticNetwork:
+
+class ActorCriticNetwork(_ModuleBase):
     """
     Actor-Critic network for PPO.
 
@@ -32,13 +238,19 @@ class ActorCriticNetwork:
     """
 
     def __init__(self, obs_dim: int, n_actions: int, hidden_dim: int = 64,
-                 learning_rate: float = 3e-4, use_torch: Optional[bool] = None):
+                 learning_rate: float = 3e-4, use_torch: Optional[bool] = None,
+                 rollout_bf16: bool = False):
+        super().__init__()
         self.obs_dim = obs_dim
         self.n_actions = n_actions
         self.hidden_dim = hidden_dim
         self.learning_rate = learning_rate
+        # Run torch rollout forwards under bfloat16 autocast; updates stay fp32
+        self.rollout_bf16 = rollout_bf16
 
         self.use_torch = use_torch if use_torch is not None else TORCH_AVAILABLE
+        self._all_actions = np.ones(n_actions, dtype=bool)
+        self._rng = np.random.default_rng()
 
         if self.use_torch and TORCH_AVAILABLE:
             self._init_torch()
@@ -59,13 +271,7 @@ class ActorCriticNetwork:
         # Value head
         self.value_head = nn.Linear(self.hidden_dim, 1)
 
-        # Combined parameters for optimizer
-        self.optimizer = optim.Adam(
-            list(self.shared.parameters()) +
-            list(self.policy_head.parameters()) +
-            list(self.value_head.parameters()),
-            lr=self.learning_rate
-        )
+        self.optimizer = optim.Adam(self.parameters(), lr=self.learning_rate)
 
     def _init_numpy(self):
         """Initialize NumPy network weights."""
@@ -90,6 +296,13 @@ class ActorCriticNetwork:
         # Value head
         self.w_value = xavier(self.hidden_dim, 1)
         self.b_value = np.zeros(1, dtype=np.float32)
+        self._cache_value_head()
+
+    def _cache_value_head(self):
+        """Cache a 1-D view of the value weights and a scalar bias for per-step dots."""
+        # A view, so in-place updates to w_value are picked up
+        self.w_value_1d = self.w_value.reshape(-1)
+        self.b_value_scalar = float(self.b_value[0])
 
     def forward(self, obs: np.ndarray, mask: Optional[np.ndarray] = None
                 ) -> Tuple[np.ndarray, float]:
@@ -107,10 +320,16 @@ class ActorCriticNetwork:
             return self._forward_torch(obs, mask)
         return self._forward_numpy(obs, mask)
 
+    def _rollout_context(self):
+        """Inference context for torch rollout forwards."""
+        if self.rollout_bf16:
+            return torch.autocast(device_type="cpu", dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+
     def _forward_torch(self, obs: np.ndarray, mask: Optional[np.ndarray] = None
                        ) -> Tuple[np.ndarray, float]:
         """PyTorch forward pass."""
-        with torch.no_grad():
+        with torch.no_grad(), self._rollout_context():
             obs_t = torch.from_numpy(obs).float()
             if obs_t.dim() == 1:
                 obs_t = obs_t.unsqueeze(0)
@@ -122,37 +341,111 @@ class ActorCriticNetwork:
             # Apply mask
             if mask is not None:
                 mask_t = torch.from_numpy(mask).bool()
-                logits = torch.where(mask_t, logits, torch.tensor(-1e9))
+                logits.masked_fill_(~mask_t, -1e9)
 
-            probs = torch.softmax(logits, dim=-1)
+            probs = torch.softmax(logits.float(), dim=-1)
             return probs.squeeze(0).numpy(), float(value.squeeze().item())
 
     def _forward_numpy(self, obs: np.ndarray, mask: Optional[np.ndarray] = None
                        ) -> Tuple[np.ndarray, float]:
         """NumPy forward pass."""
+        _, probs, value = self._policy_numpy(obs, mask)
+        return probs, value
+
+    def _policy_numpy(self, obs: np.ndarray, mask: Optional[np.ndarray] = None
+                      ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """NumPy forward pass returning (log_probs, probs, value)."""
         # Shared layers with tanh
         h1 = np.tanh(obs @ self.w1 + self.b1)
         h2 = np.tanh(h1 @ self.w2 + self.b2)
 
-        # Policy logits
+        # Policy log-probabilities
         logits = h2 @ self.w_policy + self.b_policy
-        if mask is not None:
-            logits = np.where(mask, logits, -1e9)
-
-        # Softmax
-        exp_logits = np.exp(logits - np.max(logits))
-        probs = exp_logits / np.sum(exp_logits)
+        if NUMBA_AVAILABLE and logits.ndim == 1:
+            log_probs = np.empty_like(logits)
+            probs = np.empty_like(logits)
+            if mask is None:
+                mask = self._all_actions
+            _log_softmax_row(logits, np.asarray(mask, dtype=bool), log_probs, probs)
+        else:
+            log_probs = log_softmax(logits, mask)
+            probs = np.exp(log_probs)
 
         # Value
-        value = float((h2 @ self.w_value + self.b_value)[0])
+        value = float(h2 @ self.w_value_1d) + self.b_value_scalar
 
-        return probs, value
+        return log_probs, probs, value
+
+    def forward_batch(self, obs: np.ndarray, masks: Optional[np.ndarray] = None
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Forward pass for a batch of observations, e.g. from N parallel envs.
+
+        Args:
+            obs: Observations, shape (N, obs_dim)
+            masks: Optional boolean action masks, shape (N, n_actions)
+
+        Returns:
+            Tuple of (action_probs, values) with shapes (N, n_actions) and (N,)
+        """
+        if self.use_torch and TORCH_AVAILABLE:
+            with torch.no_grad(), self._rollout_context():
+                obs_t = torch.from_numpy(np.asarray(obs, dtype=np.float32))
+                hidden = self.shared(obs_t)
+                logits = self.policy_head(hidden)
+                values = self.value_head(hidden).squeeze(-1)
+
+                if masks is not None:
+                    masks_t = torch.from_numpy(np.asarray(masks, dtype=bool))
+                    logits.masked_fill_(~masks_t, -1e9)
+
+                probs = torch.log_softmax(logits.float(), dim=-1).exp()
+                return probs.numpy(), values.float().numpy()
+
+        _, _, probs, values = self._forward_numpy_batch(obs, masks)
+        return probs, values
+
+    def _forward_numpy_batch(self, obs: np.ndarray, masks: Optional[np.ndarray] = None
+                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Batched NumPy forward pass.
+
+        Args:
+            obs: Observations, shape (N, obs_dim)
+            masks: Optional boolean action masks, shape (N, n_actions)
+
+        Returns:
+            Tuple of (hidden, action_log_probs, action_probs, values) with
+            shapes (N, hidden_dim), (N, n_actions), (N, n_actions) and (N,)
+        """
+        h2 = self._trunk_numpy(obs)
+        log_probs, probs, values = self._heads_numpy(h2, masks)
+        return h2, log_probs, probs, values
+
+    def _trunk_numpy(self, obs: np.ndarray) -> np.ndarray:
+        """Shared tanh layers; returns the hidden features fed to both heads."""
+        h1 = np.tanh(obs @ self.w1 + self.b1)
+        return np.tanh(h1 @ self.w2 + self.b2)
+
+    def _heads_numpy(self, h2: np.ndarray, masks: Optional[np.ndarray] = None
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Policy and value heads over batched hidden features."""
+        log_probs = log_softmax(h2 @ self.w_policy + self.b_policy, masks)
+        probs = np.exp(log_probs)
+        values = (h2 @ self.w_value + self.b_value)[:, 0]
+        return log_probs, probs, values
 
     def get_value(self, obs: np.ndarray) -> float:
         """Get value estimate only."""
         _, value = self.forward(obs)
         return value
 
+    @staticmethod
+    def _sample_index(probs: np.ndarray, rng: np.random.Generator) -> int:
+        """Inverse-CDF draw; skips the validation ``rng.choice(p=...)`` does per call."""
+        cdf = np.cumsum(probs, dtype=np.float64)
+        return int(np.searchsorted(cdf[:-1], rng.random() * cdf[-1], side="right"))
+
     def sample_action(self, obs: np.ndarray, mask: Optional[np.ndarray] = None,
                       rng: Optional[np.random.Generator] = None
                       ) -> Tuple[int, float, float]:
@@ -162,14 +455,59 @@ class ActorCriticNetwork:
         Returns:
             Tuple of (action, log_prob, value)
         """
-        probs, value = self.forward(obs, mask)
-        rng = rng or np.random.default_rng()
-        action = rng.choice(self.n_actions, p=probs)
-        log_prob = np.log(probs[action] + 1e-10)
+        rng = rng if rng is not None else self._rng
+        if self.use_torch and TORCH_AVAILABLE:
+            probs, value = self._forward_torch(obs, mask)
+            action = self._sample_index(probs, rng)
+            log_prob = np.log(probs[action] + 1e-10)
+        else:
+            log_probs, probs, value = self._policy_numpy(obs, mask)
+            action = self._sample_index(probs, rng)
+            log_prob = log_probs[action]
         return action, log_prob, value
 
+    def sample_actions_batch(self, obs: np.ndarray, masks: Optional[np.ndarray] = None,
+                             rng: Optional[np.random.Generator] = None
+                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample one action per row from a single batched forward pass.
+
+        Returns:
+            Tuple of (actions, log_probs, values), each of shape (N,)
+        """
+        rng = rng if rng is not None else self._rng
+        probs, values = self.forward_batch(obs, masks)
+
+        # Inverse-CDF sampling per row; scaling by the row total keeps
+        # zero-probability (masked) actions unreachable under rounding
+        cdf = np.cumsum(probs, axis=1)
+        u = rng.random(len(probs))[:, None] * cdf[:, -1:]
+        actions = np.minimum((cdf < u).sum(axis=1), self.n_actions - 1)
+
+        log_probs = np.log(probs[np.arange(len(probs)), actions] + 1e-10)
+        return actions, log_probs, values
+
+    def _numpy_param_shapes(self) -> List[Tuple[str, Tuple[int, ...]]]:
+        """NumPy parameter names and shapes, in flat checkpoint order."""
+        return [
+            ("w1", (self.obs_dim, self.hidden_dim)),
+            ("b1", (self.hidden_dim,)),
+            ("w2", (self.hidden_dim, self.hidden_dim)),
+            ("b2", (self.hidden_dim,)),
+            ("w_policy", (self.hidden_dim, self.n_actions)),
+            ("b_policy", (self.n_actions,)),
+            ("w_value", (self.hidden_dim, 1)),
+            ("b_value", (1,)),
+        ]
+
     def save(self, path: str):
-        """Save network to file."""
+        """
+        Save network to file.
+
+        NumPy networks are written as ``.npz`` unless ``path`` ends in
+        ``.npy``, which stores all weights as one flat array for cheap
+        frequent checkpoints.
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -181,7 +519,12 @@ class ActorCriticNetwork:
                 "obs_dim": self.obs_dim,
                 "n_actions": self.n_actions,
                 "hidden_dim": self.hidden_dim,
-            }, path)
+            }, path, _use_new_zipfile_serialization=False)
+        elif path.suffix == ".npy":
+            # Single raw array in a fixed parameter order; no zip container
+            np.save(path, np.concatenate([
+                getattr(self, name).ravel() for name, _ in self._numpy_param_shapes()
+            ]))
         else:
             np.savez(path.with_suffix(".npz"),
                      w1=self.w1, b1=self.b1,
@@ -201,6 +544,15 @@ class ActorCriticNetwork:
             self.shared.load_state_dict(checkpoint["shared"])
             self.policy_head.load_state_dict(checkpoint["policy_head"])
             self.value_head.load_state_dict(checkpoint["value_head"])
+        elif path.suffix == ".npy":
+            flat = np.load(path)
+            offset = 0
+            for name, shape in self._numpy_param_shapes():
+                size = int(np.prod(shape))
+                setattr(self, name, flat[offset:offset + size].reshape(shape))
+                offset += size
+            self._cache_value_head()
+            self.use_torch = False
         else:
             npz_path = path.with_suffix(".npz") if path.suffix != ".npz" else path
             if npz_path.exists():
@@ -213,6 +565,7 @@ class ActorCriticNetwork:
                 self.b_policy = data["b_policy"]
                 self.w_value = data["w_value"]
                 self.b_value = data["b_value"]
+                self._cache_value_head()
                 self.use_torch = False
 
 
@@ -234,7 +587,10 @@ class PPO:
                  entropy_coef: float = 0.01,
                  value_coef: float = 0.5,
                  n_epochs: int = 4,
-                 minibatch_size: int = 32):
+                 minibatch_size: int = 32,
+                 use_numba: bool = False,
+                 buffer_size: int = 2048,
+                 compile_loss: bool = False):
         self.network = network
         self.clip_ratio = clip_ratio
         self.gamma = gamma
@@ -243,27 +599,102 @@ class PPO:
         self.value_coef = value_coef
         self.n_epochs = n_epochs
         self.minibatch_size = minibatch_size
+        # Opt-in: NumPy's SIMD tanh/exp usually beat Numba's scalar libm
+        # calls unless Numba is built with SVML
+        self.use_numba = use_numba and NUMBA_AVAILABLE
+
+        # Opt-in: torch.compile fuses the minibatch loss graph, but its
+        # warm-up only pays off over long training runs
+        self._params = list(self.network.parameters()) if self.network.use_torch else []
+        self._compiled_loss = self._ppo_loss
+        if compile_loss and self.network.use_torch and TORCH_AVAILABLE:
+            try:
+                self._compiled_loss = torch.compile(self._ppo_loss, dynamic=False)
+            except (AttributeError, RuntimeError):
+                # PyTorch < 2.0 has no torch.compile; stay eager
+                self._compiled_loss = self._ppo_loss
+
+        self._adv_rms = RunningMeanStd()
+        # Whether any stored transition carried an action mask
+        self._any_mask = False
+
+        # Trajectory buffers: preallocated arrays filled up to self.idx,
+        # doubled in size if a rollout outgrows them
+        self.idx = 0
+        self._allocate_buffers(max(1, buffer_size))
+
+    def _allocate_buffers(self, capacity: int):
+        """Allocate trajectory buffers, keeping the first ``self.idx`` transitions."""
+        obs_dim = self.network.obs_dim
+        n_actions = self.network.n_actions
+        buffers = {
+            "obs_buf": np.empty((capacity, obs_dim), dtype=np.float32),
+            "act_buf": np.empty(capacity, dtype=np.int64),
+            "rew_buf": np.empty(capacity, dtype=np.float32),
+            "val_buf": np.empty(capacity, dtype=np.float32),
+            "lp_buf": np.empty(capacity, dtype=np.float32),
+            "done_buf": np.empty(capacity, dtype=bool),
+            "mask_buf": np.empty((capacity, n_actions), dtype=bool),
+        }
+        for name, buf in buffers.items():
+            if self.idx:
+                buf[:self.idx] = getattr(self, name)[:self.idx]
+            setattr(self, name, buf)
+        self.buffer_size = capacity
 
-        # Trajectory buffers
-        self.obs_buffer: List[np.ndarray] = []
-        self.action_buffer: List[int] = []
-        self.reward_buffer: List[float] = []
-        self.value_buffer: List[float] = []
-        self.log_prob_buffer: List[float] = []
-        self.mask_buffer: List[Optional[np.ndarray]] = []
-        self.done_buffer: List[bool] = []
+        self._indices = np.empty(capacity, dtype=np.int64)
+
+        # Zero-copy tensor views over the buffers, rebuilt only on growth
+        self._buf_tensors = {}
+        if self.network.use_torch and TORCH_AVAILABLE:
+            self._buf_tensors = {
+                name: torch.from_numpy(getattr(self, name))
+                for name in ("obs_buf", "act_buf", "lp_buf", "mask_buf")
+            }
+            self._indices_t = torch.from_numpy(self._indices)
 
     def store_transition(self, obs: np.ndarray, action: int, reward: float,
                          value: float, log_prob: float, done: bool,
                          mask: Optional[np.ndarray] = None):
         """Store a transition."""
-        self.obs_buffer.append(obs.copy())
-        self.action_buffer.append(action)
-        self.reward_buffer.append(reward)
-        self.value_buffer.append(value)
-        self.log_prob_buffer.append(log_prob)
-        self.done_buffer.append(done)
-        self.mask_buffer.append(mask.copy() if mask is not None else None)
+        if self.idx == self.buffer_size:
+            self._allocate_buffers(2 * self.buffer_size)
+
+        i = self.idx
+        self.obs_buf[i] = obs
+        self.act_buf[i] = action
+        self.rew_buf[i] = reward
+        self.val_buf[i] = value
+        self.lp_buf[i] = log_prob
+        self.done_buf[i] = done
+        if mask is not None:
+            self.mask_buf[i] = mask
+            self._any_mask = True
+        else:
+            self.mask_buf[i] = True
+        self.idx = i + 1
+
+    def store_transitions(self, obs: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                          values: np.ndarray, log_probs: np.ndarray, dones: np.ndarray,
+                          masks: Optional[np.ndarray] = None):
+        """Store a contiguous block of transitions, e.g. one env's trajectory."""
+        n = len(actions)
+        while self.idx + n > self.buffer_size:
+            self._allocate_buffers(2 * self.buffer_size)
+
+        rows = slice(self.idx, self.idx + n)
+        self.obs_buf[rows] = obs
+        self.act_buf[rows] = actions
+        self.rew_buf[rows] = rewards
+        self.val_buf[rows] = values
+        self.lp_buf[rows] = log_probs
+        self.done_buf[rows] = dones
+        if masks is not None:
+            self.mask_buf[rows] = masks
+            self._any_mask = True
+        else:
+            self.mask_buf[rows] = True
+        self.idx += n
 
     def compute_gae(self, last_value: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -275,27 +706,26 @@ class PPO:
         Returns:
             Tuple of (advantages, returns)
         """
-        n = len(self.reward_buffer)
-        advantages = np.zeros(n, dtype=np.float32)
-        returns = np.zeros(n, dtype=np.float32)
-
-        # GAE computation
-        last_gae = 0.0
-        for t in reversed(range(n)):
-            if t == n - 1:
-                next_value = last_value
-                next_non_terminal = 1.0 - float(self.done_buffer[t])
-            else:
-                next_value = self.value_buffer[t + 1]
-                next_non_terminal = 1.0 - float(self.done_buffer[t])
-
-            delta = (self.reward_buffer[t] +
-                     self.gamma * next_value * next_non_terminal -
-                     self.value_buffer[t])
-            last_gae = delta + self.gamma * self.gae_lambda * next_non_terminal * last_gae
-            advantages[t] = last_gae
-
-        returns = advantages + np.array(self.value_buffer, dtype=np.float32)
+        n = self.idx
+        rewards = self.rew_buf[:n].astype(np.float64)
+        values = self.val_buf[:n]
+        non_terminal = 1.0 - self.done_buf[:n]
+
+        # TD residuals as vector ops; only the GAE accumulation is sequential
+        next_values = np.empty(n, dtype=np.float64)
+        next_values[:-1] = values[1:]
+        next_values[n - 1:] = last_value
+        deltas = rewards + self.gamma * next_values * non_terminal - values
+        discounts = self.gamma * self.gae_lambda * non_terminal
+
+        advantages = np.empty(n, dtype=np.float32)
+        if NUMBA_AVAILABLE:
+            _discounted_scan(deltas, discounts, advantages)
+        else:
+            # Python floats index faster than NumPy scalars
+            _discounted_scan(deltas.tolist(), discounts.tolist(), advantages)
+
+        returns = advantages + values
         return advantages, returns
 
     def update(self, last_value: float = 0.0) -> Dict[str, float]:
@@ -305,14 +735,15 @@ class PPO:
         Returns:
             Dictionary with policy_loss, value_loss, entropy, and total_loss
         """
-        if len(self.obs_buffer) == 0:
+        if self.idx == 0:
             return {"policy_loss": 0.0, "value_loss": 0.0, "entropy": 0.0, "total_loss": 0.0}
 
         # Compute advantages
         advantages, returns = self.compute_gae(last_value)
 
-        # Normalize advantages
-        advantages = (advantages - np.mean(advantages)) / (np.std(advantages) + 1e-8)
+        # Normalize advantages with statistics carried across updates
+        self._adv_rms.update(advantages)
+        advantages = self._adv_rms.normalize(advantages).astype(np.float32)
 
         if self.network.use_torch and TORCH_AVAILABLE:
             stats = self._update_torch(advantages, returns)
@@ -320,87 +751,99 @@ class PPO:
             stats = self._update_numpy(advantages, returns)
 
         # Clear buffers
-        self.obs_buffer.clear()
-        self.action_buffer.clear()
-        self.reward_buffer.clear()
-        self.value_buffer.clear()
-        self.log_prob_buffer.clear()
-        self.mask_buffer.clear()
-        self.done_buffer.clear()
+        self.idx = 0
+        self._any_mask = False
 
         return stats
 
+    def _ppo_loss(self, batch_obs, batch_actions, batch_old_log_probs,
+                  batch_advantages, batch_returns, batch_masks):
+        """
+        Clipped-surrogate PPO loss for one minibatch of tensors.
+
+        Returns:
+            Tuple of (loss, policy_loss, value_loss, entropy) tensors
+        """
+        # Forward pass
+        hidden = self.network.shared(batch_obs)
+        logits = self.network.policy_head(hidden)
+        values = self.network.value_head(hidden).squeeze(-1)
+
+        # Apply masks; the fill value is a Python float, so no scalar
+        # tensor is allocated per minibatch
+        if batch_masks is not None:
+            logits = logits.masked_fill(~batch_masks, -1e9)
+
+        # Policy log-probabilities and entropy from a single log-softmax
+        log_probs = torch.log_softmax(logits, dim=-1)
+        new_log_probs = log_probs.gather(1, batch_actions.unsqueeze(1)).squeeze(1)
+        entropy = -(log_probs.exp() * log_probs).sum(-1).mean()
+
+        # Policy loss (clipped surrogate)
+        ratio = torch.exp(new_log_probs - batch_old_log_probs)
+        surr1 = ratio * batch_advantages
+        surr2 = torch.clamp(ratio, 1 - self.clip_ratio, 1 + self.clip_ratio) * batch_advantages
+        policy_loss = -torch.min(surr1, surr2).mean()
+
+        # Value loss
+        value_loss = 0.5 * ((values - batch_returns) ** 2).mean()
+
+        # Total loss
+        loss = policy_loss + self.value_coef * value_loss - self.entropy_coef * entropy
+        return loss, policy_loss, value_loss, entropy
+
     def _update_torch(self, advantages: np.ndarray, returns: np.ndarray) -> Dict[str, float]:
         """PyTorch PPO update."""
-        obs_t = torch.from_numpy(np.array(self.obs_buffer)).float()
-        actions_t = torch.tensor(self.action_buffer, dtype=torch.long)
-        old_log_probs_t = torch.tensor(self.log_prob_buffer, dtype=torch.float32)
+        n = self.idx
+        obs_t = self._buf_tensors["obs_buf"][:n]
+        actions_t = self._buf_tensors["act_buf"][:n]
+        old_log_probs_t = self._buf_tensors["lp_buf"][:n]
         advantages_t = torch.from_numpy(advantages).float()
         returns_t = torch.from_numpy(returns).float()
-
-        # Handle masks
-        masks_t = []
-        for m in self.mask_buffer:
-            if m is not None:
-                masks_t.append(torch.from_numpy(m).bool())
-            else:
-                masks_t.append(torch.ones(self.network.n_actions, dtype=torch.bool))
-        masks_t = torch.stack(masks_t)
+        masks_t = self._buf_tensors["mask_buf"][:n] if self._any_mask else None
 
         total_policy_loss = 0.0
         total_value_loss = 0.0
         total_entropy = 0.0
         n_updates = 0
 
-        for _ in range(self.n_epochs):
-            # Shuffle data
-            indices = np.random.permutation(len(self.obs_buffer))
-
-            for start in range(0, len(indices), self.minibatch_size):
-                end = start + self.minibatch_size
-                batch_indices = indices[start:end]
-
-                batch_obs = obs_t[batch_indices]
-                batch_actions = actions_t[batch_indices]
-                batch_old_log_probs = old_log_probs_t[batch_indices]
-                batch_advantages = advantages_t[batch_indices]
-                batch_returns = returns_t[batch_indices]
-                batch_masks = masks_t[batch_indices]
+        # Shuffle a preallocated index buffer in place; the tensor view
+        # shares its memory, so minibatches are zero-copy slices of it
+        indices = self._indices[:n]
+        indices[:] = np.arange(n)
+        indices_t = self._indices_t[:n]
 
-                # Forward pass
-                hidden = self.network.shared(batch_obs)
-                logits = self.network.policy_head(hidden)
-                values = self.network.value_head(hidden).squeeze(-1)
-
-                # Apply masks
-                logits = torch.where(batch_masks, logits, torch.tensor(-1e9))
-
-                # Policy distribution
-                dist = Categorical(logits=logits)
-                new_log_probs = dist.log_prob(batch_actions)
-                entropy = dist.entropy().mean()
-
-                # Policy loss (clipped surrogate)
-                ratio = torch.exp(new_log_probs - batch_old_log_probs)
-                surr1 = ratio * batch_advantages
-                surr2 = torch.clamp(ratio, 1 - self.clip_ratio, 1 + self.clip_ratio) * batch_advantages
-                policy_loss = -torch.min(surr1, surr2).mean()
-
-                # Value loss
-                value_loss = 0.5 * ((values - batch_returns) ** 2).mean()
-
-                # Total loss
-                loss = policy_loss + self.value_coef * value_loss - self.entropy_coef * entropy
+        for _ in range(self.n_epochs):
+            np.random.shuffle(indices)
+
+            for batch_indices in indices_t.split(self.minibatch_size):
+                batch_obs = obs_t.index_select(0, batch_indices)
+                batch_actions = actions_t.index_select(0, batch_indices)
+                batch_old_log_probs = old_log_probs_t.index_select(0, batch_indices)
+                batch_advantages = advantages_t.index_select(0, batch_indices)
+                batch_returns = returns_t.index_select(0, batch_indices)
+                batch_masks = masks_t.index_select(0, batch_indices) if masks_t is not None else None
+
+                try:
+                    loss, policy_loss, value_loss, entropy = self._compiled_loss(
+                        batch_obs, batch_actions, batch_old_log_probs,
+                        batch_advantages, batch_returns, batch_masks
+                    )
+                except Exception:
+                    if self._compiled_loss is self._ppo_loss:
+                        raise
+                    # Compilation failed at first call (e.g. no backend
+                    # compiler); fall back to eager for the rest of training
+                    self._compiled_loss = self._ppo_loss
+                    loss, policy_loss, value_loss, entropy = self._ppo_loss(
+                        batch_obs, batch_actions, batch_old_log_probs,
+                        batch_advantages, batch_returns, batch_masks
+                    )
 
                 # Backward pass
                 self.network.optimizer.zero_grad()
                 loss.backward()
-                torch.nn.utils.clip_grad_norm_(
-                    list(self.network.shared.parameters()) +
-                    list(self.network.policy_head.parameters()) +
-                    list(self.network.value_head.parameters()),
-                    max_norm=0.5
-                )
+                torch.nn.utils.clip_grad_norm_(self._params, max_norm=0.5)
                 self.network.optimizer.step()
 
                 total_policy_loss += policy_loss.item()
@@ -416,71 +859,85 @@ class PPO:
         }
 
     def _update_numpy(self, advantages: np.ndarray, returns: np.ndarray) -> Dict[str, float]:
-        """NumPy PPO update (simplified gradient descent)."""
+        """NumPy PPO update (simplified gradient descent).
+
+        Each epoch runs one batched forward pass over the whole trajectory
+        and applies a single gradient step averaged over the batch. With
+        ``use_numba`` the epoch runs in ``_ppo_step_numba`` instead.
+        """
+        network = self.network
+        n = self.idx
+        rows = np.arange(n)
+
+        obs = self.obs_buf[:n]
+        actions = self.act_buf[:n]
+        old_log_probs = self.lp_buf[:n]
+        masks = self.mask_buf[:n]
+
         total_policy_loss = 0.0
         total_value_loss = 0.0
         total_entropy = 0.0
 
-        for _ in range(self.n_epochs):
-            for i in range(len(self.obs_buffer)):
-                obs = self.obs_buffer[i]
-                action = self.action_buffer[i]
-                old_log_prob = self.log_prob_buffer[i]
-                advantage = advantages[i]
-                target_return = returns[i]
-                mask = self.mask_buffer[i]
-
-                # Forward pass
-                probs, value = self.network.forward(obs, mask)
-                new_log_prob = np.log(probs[action] + 1e-10)
-
-                # Ratio and clipped surrogate
-                ratio = np.exp(new_log_prob - old_log_prob)
-                surr1 = ratio * advantage
-                surr2 = np.clip(ratio, 1 - self.clip_ratio, 1 + self.clip_ratio) * advantage
-                policy_loss = -min(surr1, surr2)
-
-                # Value loss
-                value_loss = 0.5 * (value - target_return) ** 2
-
-                # Entropy
-                entropy = -np.sum(probs * np.log(probs + 1e-10))
-
+        if self.use_numba:
+            advantages = np.ascontiguousarray(advantages, dtype=np.float32)
+            returns = np.ascontiguousarray(returns, dtype=np.float32)
+            for _ in range(self.n_epochs):
+                policy_loss, value_loss, entropy = _ppo_step_numba(
+                    obs, actions, advantages, returns, old_log_probs, masks,
+                    network.w1, network.b1, network.w2, network.b2,
+                    network.w_policy, network.b_policy, network.w_value, network.b_value,
+                    self.clip_ratio, network.learning_rate,
+                )
                 total_policy_loss += policy_loss
                 total_value_loss += value_loss
                 total_entropy += entropy
+            return self._numpy_stats(total_policy_loss, total_value_loss, total_entropy, n)
 
-                # Simple gradient update on policy weights
-                grad = np.zeros_like(self.network.w_policy)
-                h1 = np.tanh(obs @ self.network.w1 + self.network.b1)
-                h2 = np.tanh(h1 @ self.network.w2 + self.network.b2)
-
-                for j in range(self.network.n_actions):
-                    if j == action:
-                        grad[:, j] += (1 - probs[j]) * advantage * h2
-                    else:
-                        grad[:, j] -= probs[j] * advantage * h2
+        # Only the heads are trained here, so the shared trunk is the same
+        # in every epoch; compute it once
+        h2 = network._trunk_numpy(obs)
 
-                self.network.w_policy += self.network.learning_rate * grad
-
-                # Update value weights
-                value_grad = (target_return - value) * h2
-                self.network.w_value += self.network.learning_rate * value_grad.reshape(-1, 1)
-
-        n = len(self.obs_buffer) * self.n_epochs
+        for _ in range(self.n_epochs):
+            # Forward pass
+            log_probs, probs, values = network._heads_numpy(h2, masks if self._any_mask else None)
+            new_log_probs = log_probs[rows, actions]
+
+            # Ratio and clipped surrogate
+            ratio = np.exp(new_log_probs - old_log_probs)
+            surr1 = ratio * advantages
+            surr2 = np.clip(ratio, 1 - self.clip_ratio, 1 + self.clip_ratio) * advantages
+            total_policy_loss += float(-np.minimum(surr1, surr2).sum())
+
+            # Value loss
+            value_errors = returns - values
+            total_value_loss += float(0.5 * (value_errors ** 2).sum())
+
+            # Entropy
+            total_entropy += float(-(probs * log_probs).sum())
+
+            # Policy gradient on the logits: (probs - onehot(action)) * advantage
+            dlogits = probs
+            dlogits[rows, actions] -= 1.0
+            dlogits *= advantages[:, None]
+            network.w_policy -= network.learning_rate * (h2.T @ dlogits) / n
+
+            # Update value weights
+            network.w_value += network.learning_rate * (h2.T @ value_errors[:, None]) / n
+
+        return self._numpy_stats(total_policy_loss, total_value_loss, total_entropy, n)
+
+    def _numpy_stats(self, total_policy_loss: float, total_value_loss: float,
+                     total_entropy: float, n: int) -> Dict[str, float]:
+        """Average summed NumPy-path losses over all samples and epochs."""
+        n_total = n * self.n_epochs
         return {
-            "policy_loss": total_policy_loss / max(1, n),
-            "value_loss": total_value_loss / max(1, n),
-            "entropy": total_entropy / max(1, n),
-            "total_loss": (total_policy_loss + total_value_loss) / max(1, n),
+            "policy_loss": total_policy_loss / max(1, n_total),
+            "value_loss": total_value_loss / max(1, n_total),
+            "entropy": total_entropy / max(1, n_total),
+            "total_loss": (total_policy_loss + total_value_loss) / max(1, n_total),
         }
 
     def clear_buffers(self):
         """Clear all trajectory buffers."""
-        self.obs_buffer.clear()
-        self.action_buffer.clear()
-        self.reward_buffer.clear()
-        self.value_buffer.clear()
-        self.log_prob_buffer.clear()
-        self.mask_buffer.clear()
-        self.done_buffer.clear()
+        self.idx = 0
+        self._any_mask = False
@@ -6,10 +6,13 @@ Supports both PyTorch (preferred) and pure NumPy fallback.
 
 import os
 import json
+import math
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
 
+from .ppo import _discounted_scan, log_softmax
+
 # Try to import torch, fall back to numpy-only implementation
 TORCH_AVAILABLE = False
 try:
@@ -26,6 +29,100 @@ except (ImportError, AttributeError, Exception):
     optim = None
     Categorical = None
 
+# Try to import numba
+NUMBA_AVAILABLE = False
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+
+def _mlp_forward_row(obs, w1, b1, w2, b2, w3, b3):
+    """
+    Single-observation ReLU MLP forward pass returning (h1, h2, logits).
+
+    Bias-add and ReLU are fused into the accumulation loops, and rows of
+    zero activations are skipped. Compiled with Numba when available; at
+    these sizes it avoids NumPy's per-op dispatch and temporaries.
+    """
+    hidden = w1.shape[1]
+    h1 = np.empty(hidden)
+    for k in range(hidden):
+        h1[k] = b1[k]
+    for j in range(obs.shape[0]):
+        x = obs[j]
+        for k in range(hidden):
+            h1[k] += x * w1[j, k]
+    for k in range(hidden):
+        if h1[k] < 0.0:
+            h1[k] = 0.0
+
+    h2 = np.empty(hidden)
+    for k in range(hidden):
+        h2[k] = b2[k]
+    for j in range(hidden):
+        x = h1[j]
+        if x != 0.0:
+            for k in range(hidden):
+                h2[k] += x * w2[j, k]
+    for k in range(hidden):
+        if h2[k] < 0.0:
+            h2[k] = 0.0
+
+    logits = np.empty(w3.shape[1])
+    for a in range(w3.shape[1]):
+        logits[a] = b3[a]
+    for j in range(hidden):
+        x = h2[j]
+        if x != 0.0:
+            for a in range(w3.shape[1]):
+                logits[a] += x * w3[j, a]
+    return h1, h2, logits
+
+
+def _sample_logits_row(logits, mask, u):
+    """
+    Sample an action from masked logits and return (action, log_prob).
+
+    Fuses the masked log-softmax with the inverse-CDF draw: one pass for the
+    max, one for the exponentials and their sum, and a scan that stops at
+    the sampled action. ``u`` is a uniform draw in [0, 1); masked entries
+    get a logit of -1e9, as in ``log_softmax``.
+    """
+    n = logits.shape[0]
+    # Seed the max from the first entry: fastmath assumes no infinities
+    m = logits[0] if mask[0] else -1e9
+    for i in range(1, n):
+        v = logits[i] if mask[i] else -1e9
+        if v > m:
+            m = v
+    exps = np.empty(n)
+    total = 0.0
+    for i in range(n):
+        e = math.exp((logits[i] if mask[i] else -1e9) - m)
+        exps[i] = e
+        total += e
+
+    # First index whose running sum exceeds the target; the last action
+    # absorbs any rounding shortfall
+    target = u * total
+    action = n - 1
+    acc = 0.0
+    for i in range(n - 1):
+        acc += exps[i]
+        if acc > target:
+            action = i
+            break
+    log_prob = (logits[action] if mask[action] else -1e9) - m - math.log(total)
+    return action, log_prob
+
+
+if NUMBA_AVAILABLE:
+    _mlp_forward_row = numba.njit(cache=True, fastmath=True, boundscheck=False)(_mlp_forward_row)
+    _sample_logits_row = numba.njit(cache=True, fastmath=True, boundscheck=False)(_sample_logits_row)
+
 
 class PolicyNetwork:
     """
@@ -34,14 +131,26 @@ class PolicyNetwork:
     Supports both PyTorch and pure NumPy implementations.
     """
 
+    _PARAM_NAMES = ("w1", "b1", "w2", "b2", "w3", "b3")
+
     def __init__(self, obs_dim: int, n_actions: int, hidden_dim: int = 64,
                  learning_rate: float = 1e-3, entropy_coef: float = 0.01,
-                 use_torch: Optional[bool] = None):
+                 use_torch: Optional[bool] = None, compile_inference: bool = False,
+                 quantize_inference: bool = False, seed: Optional[int] = None):
         self.obs_dim = obs_dim
         self.n_actions = n_actions
         self.hidden_dim = hidden_dim
         self.learning_rate = learning_rate
         self.entropy_coef = entropy_coef
+        # Opt-in torch.compile for the rollout forward; see _init_torch
+        self.compile_inference = compile_inference
+        # Opt-in dynamic int8 copy of the network for torch rollout forwards
+        self.quantize_inference = quantize_inference
+        self.seed = seed
+        self._all_actions = np.ones(n_actions, dtype=bool)
+        # Hidden-activation scratch keyed by batch size (None for one row);
+        # created here so a torch policy that loads .npz weights has it too
+        self._fwd_scratch: Dict[Optional[int], Tuple[np.ndarray, np.ndarray]] = {}
 
         # Decide whether to use torch
         self.use_torch = use_torch if use_torch is not None else TORCH_AVAILABLE
@@ -62,20 +171,109 @@ class PolicyNetwork:
         )
         self.optimizer = optim.Adam(self.net.parameters(), lr=self.learning_rate)
 
+        # Rollout forwards reuse one input tensor and, optionally, a compiled
+        # module sharing the same parameters
+        self._obs_scratch = torch.empty(1, self.obs_dim, dtype=torch.float32)
+        self._inference_net = self.net
+        if self.quantize_inference:
+            self._refresh_inference_net()
+        elif self.compile_inference:
+            try:
+                self._inference_net = torch.compile(self.net, mode="reduce-overhead")
+            except (AttributeError, RuntimeError):
+                # PyTorch < 2.0 has no torch.compile; stay eager
+                self._inference_net = self.net
+
+    def _refresh_inference_net(self):
+        """
+        Rebuild the int8 rollout module from the current fp32 weights.
+
+        Dynamic quantization snapshots the weights, so the trainer calls
+        this after every optimizer step. Falls back to the fp32 network if
+        the quantized CPU kernels are unavailable.
+        """
+        if not self.quantize_inference:
+            return
+        try:
+            self._inference_net = torch.ao.quantization.quantize_dynamic(
+                self.net, {nn.Linear}, dtype=torch.qint8)
+        except (AttributeError, RuntimeError):
+            self._inference_net = self.net
+
     def _init_numpy(self):
         """Initialize NumPy network weights."""
         self.use_torch = False
-        # Xavier initialization
-        scale1 = np.sqrt(2.0 / (self.obs_dim + self.hidden_dim))
-        scale2 = np.sqrt(2.0 / (self.hidden_dim + self.hidden_dim))
-        scale3 = np.sqrt(2.0 / (self.hidden_dim + self.n_actions))
-
-        self.w1 = np.random.randn(self.obs_dim, self.hidden_dim).astype(np.float32) * scale1
+        # Without an explicit seed, draw one from the legacy global RNG so
+        # np.random.seed() before construction still fixes the weights
+        seed = self.seed if self.seed is not None else np.random.randint(2**31)
+        rng = np.random.default_rng(seed)
+
+        # Xavier initialization, sampled straight into float32 weights
+        def xavier(in_dim, out_dim):
+            w = np.empty((in_dim, out_dim), dtype=np.float32)
+            rng.standard_normal(dtype=np.float32, out=w)
+            w *= np.sqrt(2.0 / (in_dim + out_dim))
+            return w
+
+        self.w1 = xavier(self.obs_dim, self.hidden_dim)
         self.b1 = np.zeros(self.hidden_dim, dtype=np.float32)
-        self.w2 = np.random.randn(self.hidden_dim, self.hidden_dim).astype(np.float32) * scale2
+        self.w2 = xavier(self.hidden_dim, self.hidden_dim)
         self.b2 = np.zeros(self.hidden_dim, dtype=np.float32)
-        self.w3 = np.random.randn(self.hidden_dim, self.n_actions).astype(np.float32) * scale3
+        self.w3 = xavier(self.hidden_dim, self.n_actions)
         self.b3 = np.zeros(self.n_actions, dtype=np.float32)
+        self._init_adam()
+
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) now rather than on the first rollout step
+            self._forward_numpy(np.zeros(self.obs_dim, dtype=np.float32))
+
+    def _init_adam(self):
+        """Reset the NumPy Adam moment estimates."""
+        self._adam_t = 0
+        self._adam_m = {name: np.zeros_like(getattr(self, name)) for name in self._PARAM_NAMES}
+        self._adam_v = {name: np.zeros_like(getattr(self, name)) for name in self._PARAM_NAMES}
+
+    def _backward(self, obs: np.ndarray, h1: np.ndarray, h2: np.ndarray,
+                  dlogits: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Backpropagate logit gradients through the MLP.
+
+        Args:
+            obs: Observations, shape (T, obs_dim)
+            h1, h2: Hidden activations from the forward pass, shape (T, hidden_dim)
+            dlogits: Loss gradient w.r.t. the logits, shape (T, n_actions)
+
+        Returns:
+            Gradients keyed by parameter name
+        """
+        dh2 = dlogits @ self.w3.T
+        dh2[h2 <= 0] = 0.0
+        dh1 = dh2 @ self.w2.T
+        dh1[h1 <= 0] = 0.0
+        return {
+            "w3": h2.T @ dlogits, "b3": dlogits.sum(axis=0),
+            "w2": h1.T @ dh2, "b2": dh2.sum(axis=0),
+            "w1": obs.T @ dh1, "b1": dh1.sum(axis=0),
+        }
+
+    def _adam_step(self, grads: Dict[str, np.ndarray], max_grad_norm: float = 0.5,
+                   betas: Tuple[float, float] = (0.9, 0.999), eps: float = 1e-8):
+        """Clip gradients by global norm and apply one Adam step, like the torch path."""
+        norm = np.sqrt(sum(float(np.vdot(g, g)) for g in grads.values()))
+        scale = min(1.0, max_grad_norm / (norm + 1e-6))
+
+        beta1, beta2 = betas
+        self._adam_t += 1
+        step_size = self.learning_rate * np.sqrt(1 - beta2 ** self._adam_t) / (1 - beta1 ** self._adam_t)
+        for name, grad in grads.items():
+            grad = grad * scale
+            m = self._adam_m[name]
+            v = self._adam_v[name]
+            m *= beta1
+            m += (1 - beta1) * grad
+            v *= beta2
+            v += (1 - beta2) * grad * grad
+            getattr(self, name)[...] -= step_size * m / (np.sqrt(v) + eps)
 
     def forward(self, obs: np.ndarray) -> np.ndarray:
         """
@@ -88,24 +286,78 @@ class PolicyNetwork:
             Logits array of shape (n_actions,) or (batch, n_actions)
         """
         if self.use_torch and TORCH_AVAILABLE:
-            with torch.no_grad():
-                obs_t = torch.from_numpy(obs).float()
-                if obs_t.dim() == 1:
-                    obs_t = obs_t.unsqueeze(0)
-                logits = self.net(obs_t)
-                return logits.squeeze(0).numpy()
+            return self._forward_torch(obs)
         else:
             return self._forward_numpy(obs)
 
+    def _forward_torch(self, obs: np.ndarray) -> np.ndarray:
+        """PyTorch inference forward pass."""
+        with torch.inference_mode():
+            if obs.ndim == 1:
+                self._obs_scratch[0].copy_(torch.from_numpy(obs))
+                obs_t = self._obs_scratch
+            else:
+                obs_t = torch.from_numpy(obs).float()
+            try:
+                logits = self._inference_net(obs_t)
+            except Exception:
+                if self._inference_net is self.net:
+                    raise
+                # Compilation failed at first call; fall back to eager
+                self._inference_net = self.net
+                logits = self.net(obs_t)
+            return logits.squeeze(0).numpy() if obs.ndim == 1 else logits.numpy()
+
     def _forward_numpy(self, obs: np.ndarray) -> np.ndarray:
         """NumPy forward pass."""
-        # Layer 1
-        h1 = np.maximum(0, obs @ self.w1 + self.b1)  # ReLU
-        # Layer 2
-        h2 = np.maximum(0, h1 @ self.w2 + self.b2)  # ReLU
-        # Output layer
-        logits = h2 @ self.w3 + self.b3
-        return logits
+        return self._forward_numpy_hidden(obs)[2]
+
+    def _forward_numpy_hidden(self, obs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """NumPy forward pass returning (h1, h2, logits)."""
+        if NUMBA_AVAILABLE and obs.ndim == 1:
+            return _mlp_forward_row(obs, self.w1, self.b1, self.w2, self.b2,
+                                    self.w3, self.b3)
+
+        return self._forward_batch(obs)
+
+    def _hidden_scratch(self, obs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Reusable (h1, h2) output buffers for a forward pass over ``obs``."""
+        key = None if obs.ndim == 1 else len(obs)
+        scratch = self._fwd_scratch.get(key)
+        if scratch is None:
+            if len(self._fwd_scratch) >= 8:
+                # Trajectory lengths vary; don't keep a buffer for every one
+                self._fwd_scratch.clear()
+            shape = obs.shape[:-1] + (self.hidden_dim,)
+            scratch = (np.empty(shape, dtype=np.float32), np.empty(shape, dtype=np.float32))
+            self._fwd_scratch[key] = scratch
+        return scratch
+
+    def _forward_batch(self, obs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Batched NumPy forward pass.
+
+        Matmul, bias-add and ReLU write into per-shape scratch buffers, so
+        the returned ``h1``/``h2`` are overwritten by the next call with the
+        same batch size.
+
+        Args:
+            obs: Observations, shape (T, obs_dim)
+
+        Returns:
+            Tuple of (h1, h2, logits) with shapes (T, hidden_dim),
+            (T, hidden_dim) and (T, n_actions)
+        """
+        h1, h2 = self._hidden_scratch(obs)
+        np.matmul(obs, self.w1, out=h1)
+        h1 += self.b1
+        np.maximum(h1, 0, out=h1)
+        np.matmul(h1, self.w2, out=h2)
+        h2 += self.b2
+        np.maximum(h2, 0, out=h2)
+        logits = h2 @ self.w3
+        logits += self.b3
+        return h1, h2, logits
 
     def get_action_probs(self, obs: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
         """
@@ -118,19 +370,24 @@ class PolicyNetwork:
         Returns:
             Probability distribution over actions
         """
-        logits = self.forward(obs)
+        return np.exp(self.get_action_log_probs(obs, mask))
 
-        # Apply mask if provided
-        if mask is not None:
-            logits = np.where(mask, logits, -1e9)
+    def get_action_log_probs(self, obs: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get action log-probabilities via a stable log-softmax.
 
-        # Softmax
-        exp_logits = np.exp(logits - np.max(logits))
-        probs = exp_logits / np.sum(exp_logits)
-        return probs
+        Args:
+            obs: Observation array
+            mask: Optional boolean mask for valid actions
+
+        Returns:
+            Log-probabilities over actions
+        """
+        return log_softmax(self.forward(obs), mask)
 
     def sample_action(self, obs: np.ndarray, mask: Optional[np.ndarray] = None,
-                      rng: Optional[np.random.Generator] = None) -> Tuple[int, float]:
+                      rng: Optional[np.random.Generator] = None,
+                      return_hidden: bool = False) -> Tuple:
         """
         Sample an action from the policy.
 
@@ -138,20 +395,56 @@ class PolicyNetwork:
             obs: Observation array
             mask: Optional boolean mask for valid actions
             rng: Random number generator
+            return_hidden: Also return the hidden activations as (h1, h2)
+                (NumPy path only, None under torch) so the trainer can
+                reuse them
+
+        Returns:
+            Tuple of (action_index, log_probability), plus hidden
+            activations if ``return_hidden``
+        """
+        hidden = None
+        if return_hidden and not (self.use_torch and TORCH_AVAILABLE):
+            h1, h2, logits = self._forward_numpy_hidden(obs)
+            hidden = (h1, h2)
+        else:
+            logits = self.forward(obs)
+        rng = rng or np.random.default_rng()
+
+        if NUMBA_AVAILABLE:
+            action, log_prob = _sample_logits_row(
+                logits, self._all_actions if mask is None else mask, rng.random())
+        else:
+            log_probs = log_softmax(logits, mask)
+            # Inverse-CDF draw; rng.choice(p=...) re-validates probs on every
+            # call. Searching only the first n-1 entries keeps the index in range.
+            cdf = np.cumsum(np.exp(log_probs), dtype=np.float64)
+            action = int(np.searchsorted(cdf[:-1], rng.random() * cdf[-1], side="right"))
+            log_prob = log_probs[action]
+        if return_hidden:
+            return int(action), float(log_prob), hidden
+        return int(action), float(log_prob)
+
+    def sample_actions_batch(self, obs: np.ndarray, masks: Optional[np.ndarray] = None,
+                             rng: Optional[np.random.Generator] = None
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample one action per row from a single batched forward pass.
 
         Returns:
-            Tuple of (action_index, log_probability)
+            Tuple of (actions, log_probs), each of shape (N,)
         """
-        probs = self.get_action_probs(obs, mask)
         rng = rng or np.random.default_rng()
-        action = rng.choice(self.n_actions, p=probs)
-        log_prob = np.log(probs[action] + 1e-10)
-        return action, log_prob
+        log_probs = log_softmax(self.forward(obs), masks)
+        cdf = np.cumsum(np.exp(log_probs), axis=1, dtype=np.float64)
+        u = rng.random(len(cdf))[:, None] * cdf[:, -1:]
+        actions = np.minimum((cdf <= u).sum(axis=1), self.n_actions - 1)
+        return actions, log_probs[np.arange(len(actions)), actions]
 
     def compute_entropy(self, obs: np.ndarray, mask: Optional[np.ndarray] = None) -> float:
         """Compute entropy of action distribution."""
-        probs = self.get_action_probs(obs, mask)
-        entropy = -np.sum(probs * np.log(probs + 1e-10))
+        log_probs = self.get_action_log_probs(obs, mask)
+        entropy = -np.sum(np.exp(log_probs) * log_probs)
         return entropy
 
     def save(self, path: str):
@@ -186,6 +479,7 @@ class PolicyNetwork:
         if self.use_torch and TORCH_AVAILABLE and path.suffix == ".pt":
             checkpoint = torch.load(path, weights_only=False)
             self.net.load_state_dict(checkpoint["state_dict"])
+            self._refresh_inference_net()
         else:
             # Try numpy format
             npz_path = path.with_suffix(".npz") if path.suffix != ".npz" else path
@@ -198,6 +492,8 @@ class PolicyNetwork:
                 self.w3 = data["w3"]
                 self.b3 = data["b3"]
                 self.use_torch = False
+                self._init_adam()
+                self._fwd_scratch.clear()
 
 
 class SimplePolicyGradient:
@@ -211,38 +507,146 @@ class SimplePolicyGradient:
     """
 
     def __init__(self, policy: PolicyNetwork, gamma: float = 0.99,
-                 baseline_decay: float = 0.99):
+                 baseline_decay: float = 0.99, capacity: int = 1024):
         self.policy = policy
         self.gamma = gamma
         self.baseline_decay = baseline_decay
         self.baseline = 0.0
 
-        # Trajectory buffers
-        self.obs_buffer: List[np.ndarray] = []
-        self.action_buffer: List[int] = []
-        self.reward_buffer: List[float] = []
-        self.log_prob_buffer: List[float] = []
-        self.mask_buffer: List[Optional[np.ndarray]] = []
+        # Trajectory buffers: preallocated arrays filled up to self._n,
+        # doubled in size if a trajectory outgrows them
+        self._n = 0
+        self._any_mask = False
+        # Whether every stored transition came with its hidden activations
+        self._all_hidden = True
+        self._allocate_buffers(max(1, capacity))
+
+    def _allocate_buffers(self, capacity: int):
+        """Allocate trajectory buffers, keeping the first ``self._n`` transitions."""
+        buffers = {
+            "obs_buf": self._empty_pinned((capacity, self.policy.obs_dim), np.float32),
+            "act_buf": self._empty_pinned((capacity,), np.int64),
+            "rew_buf": np.empty(capacity, dtype=np.float32),
+            "lp_buf": np.empty(capacity, dtype=np.float32),
+            "mask_buf": np.empty((capacity, self.policy.n_actions), dtype=bool),
+            "done_buf": np.zeros(capacity, dtype=bool),
+            "h1_buf": np.empty((capacity, self.policy.hidden_dim)),
+            "h2_buf": np.empty((capacity, self.policy.hidden_dim)),
+        }
+        for name, buf in buffers.items():
+            if self._n:
+                buf[:self._n] = getattr(self, name)[:self._n]
+            setattr(self, name, buf)
+        self.capacity = capacity
+
+    def _empty_pinned(self, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        Empty array for data the torch update consumes.
+
+        Backed by page-locked memory when a CUDA device is present, so a
+        later ``.to("cuda", non_blocking=True)`` can overlap the next rollout.
+        """
+        if self.policy.use_torch and TORCH_AVAILABLE and torch.cuda.is_available():
+            torch_dtype = torch.float32 if dtype == np.float32 else torch.int64
+            return torch.empty(shape, dtype=torch_dtype, pin_memory=True).numpy()
+        return np.empty(shape, dtype=dtype)
+
+    @property
+    def obs_buffer(self) -> np.ndarray:
+        """Stored observations, shape (n, obs_dim)."""
+        return self.obs_buf[:self._n]
+
+    @property
+    def action_buffer(self) -> np.ndarray:
+        """Stored actions, shape (n,)."""
+        return self.act_buf[:self._n]
+
+    @property
+    def reward_buffer(self) -> np.ndarray:
+        """Stored rewards, shape (n,)."""
+        return self.rew_buf[:self._n]
+
+    @property
+    def log_prob_buffer(self) -> np.ndarray:
+        """Stored log-probabilities, shape (n,)."""
+        return self.lp_buf[:self._n]
+
+    @property
+    def mask_buffer(self) -> np.ndarray:
+        """Stored action masks, shape (n, n_actions); all-True rows for no mask."""
+        return self.mask_buf[:self._n]
 
     def store_transition(self, obs: np.ndarray, action: int, reward: float,
-                         log_prob: float, mask: Optional[np.ndarray] = None):
-        """Store a transition in the buffer."""
-        self.obs_buffer.append(obs.copy())
-        self.action_buffer.append(action)
-        self.reward_buffer.append(reward)
-        self.log_prob_buffer.append(log_prob)
-        self.mask_buffer.append(mask.copy() if mask is not None else None)
+                         log_prob: float, mask: Optional[np.ndarray] = None,
+                         hidden: Optional[Tuple[np.ndarray, np.ndarray]] = None):
+        """
+        Store a transition in the buffer.
 
-    def compute_returns(self) -> np.ndarray:
-        """Compute discounted returns (reward-to-go)."""
-        returns = []
-        running_return = 0.0
+        ``hidden`` is the policy's (h1, h2) activations for ``obs`` from
+        ``sample_action(..., return_hidden=True)``. If every transition in
+        a trajectory has them, the NumPy update skips recomputing the
+        hidden layers.
+        """
+        if self._n == self.capacity:
+            self._allocate_buffers(2 * self.capacity)
+
+        i = self._n
+        self.obs_buf[i] = obs
+        self.act_buf[i] = action
+        self.rew_buf[i] = reward
+        self.lp_buf[i] = log_prob
+        if mask is not None:
+            self.mask_buf[i] = mask
+            self._any_mask = True
+        else:
+            self.mask_buf[i] = True
+        if hidden is not None:
+            self.h1_buf[i], self.h2_buf[i] = hidden
+        else:
+            self._all_hidden = False
+        self.done_buf[i] = False
+        self._n = i + 1
 
-        for reward in reversed(self.reward_buffer):
-            running_return = reward + self.gamma * running_return
-            returns.insert(0, running_return)
+    def store_transitions(self, obs: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                          log_probs: np.ndarray, masks: Optional[np.ndarray] = None):
+        """
+        Store one complete episode as a contiguous block.
 
-        return np.array(returns, dtype=np.float32)
+        The block's last transition is marked terminal, so several episodes
+        (e.g. from a vectorized rollout) can share one update without their
+        returns leaking into each other.
+        """
+        n = len(actions)
+        if n == 0:
+            return
+        while self._n + n > self.capacity:
+            self._allocate_buffers(2 * self.capacity)
+
+        rows = slice(self._n, self._n + n)
+        self.obs_buf[rows] = obs
+        self.act_buf[rows] = actions
+        self.rew_buf[rows] = rewards
+        self.lp_buf[rows] = log_probs
+        if masks is not None:
+            self.mask_buf[rows] = masks
+            self._any_mask = True
+        else:
+            self.mask_buf[rows] = True
+        self.done_buf[rows] = False
+        self.done_buf[self._n + n - 1] = True
+        self._all_hidden = False
+        self._n += n
+
+    def compute_returns(self) -> np.ndarray:
+        """Compute discounted returns (reward-to-go), restarting after terminal transitions."""
+        n = self._n
+        returns = np.empty(n, dtype=np.float32)
+        discounts = np.where(self.done_buf[:n], 0.0, self.gamma)
+        if NUMBA_AVAILABLE:
+            _discounted_scan(self.reward_buffer.astype(np.float64), discounts, returns)
+        else:
+            _discounted_scan(self.reward_buffer.tolist(), discounts.tolist(), returns)
+        return returns
 
     def update(self) -> Dict[str, float]:
         """
@@ -251,7 +655,7 @@ class SimplePolicyGradient:
         Returns:
             Dictionary with loss, mean_return, and entropy
         """
-        if len(self.obs_buffer) == 0:
+        if self._n == 0:
             return {"loss": 0.0, "mean_return": 0.0, "entropy": 0.0}
 
         returns = self.compute_returns()
@@ -273,11 +677,9 @@ class SimplePolicyGradient:
             loss, entropy = self._update_numpy(advantages)
 
         # Clear buffers
-        self.obs_buffer.clear()
-        self.action_buffer.clear()
-        self.reward_buffer.clear()
-        self.log_prob_buffer.clear()
-        self.mask_buffer.clear()
+        self._n = 0
+        self._any_mask = False
+        self._all_hidden = True
 
         return {
             "loss": loss,
@@ -287,8 +689,9 @@ class SimplePolicyGradient:
 
     def _update_torch(self, advantages: np.ndarray) -> Tuple[float, float]:
         """PyTorch policy gradient update."""
-        obs_t = torch.from_numpy(np.array(self.obs_buffer)).float()
-        actions_t = torch.tensor(self.action_buffer, dtype=torch.long)
+        # Zero-copy views over the filled rows of the trajectory buffers
+        obs_t = torch.from_numpy(self.obs_buffer)
+        actions_t = torch.from_numpy(self.action_buffer)
         advantages_t = torch.from_numpy(advantages).float()
 
         # Forward pass
@@ -308,52 +711,53 @@ class SimplePolicyGradient:
         loss.backward()
         torch.nn.utils.clip_grad_norm_(self.policy.net.parameters(), max_norm=0.5)
         self.policy.optimizer.step()
+        self.policy._refresh_inference_net()
 
         return float(loss.item()), float(entropy.item())
 
     def _update_numpy(self, advantages: np.ndarray) -> Tuple[float, float]:
-        """NumPy policy gradient update (simple gradient descent)."""
-        total_loss = 0.0
-        total_entropy = 0.0
-
-        # Compute gradients via finite differences (simplified)
-        # For production, use proper backprop or autograd
-        eps = 1e-4
-
-        for i, (obs, action, advantage) in enumerate(zip(
-            self.obs_buffer, self.action_buffer, advantages
-        )):
-            probs = self.policy.get_action_probs(obs, self.mask_buffer[i])
-            log_prob = np.log(probs[action] + 1e-10)
-
-            # Policy gradient: -log_prob * advantage
-            total_loss -= log_prob * advantage
-
-            # Entropy
-            entropy = -np.sum(probs * np.log(probs + 1e-10))
-            total_entropy += entropy
-
-            # Simple parameter update using finite differences
-            # Update w3 (output layer) - most impact
-            grad_w3 = np.zeros_like(self.policy.w3)
-            for j in range(self.policy.n_actions):
-                # Approximate gradient
-                if j == action:
-                    # Gradient of log softmax w.r.t. logits
-                    grad_w3[:, j] += (1 - probs[j]) * advantage * self._get_hidden(obs)
-                else:
-                    grad_w3[:, j] -= probs[j] * advantage * self._get_hidden(obs)
-
-            self.policy.w3 += self.policy.learning_rate * grad_w3
-
-        n = len(self.obs_buffer)
-        return total_loss / n, total_entropy / n
-
-    def _get_hidden(self, obs: np.ndarray) -> np.ndarray:
-        """Get hidden layer activation for gradient computation."""
-        h1 = np.maximum(0, obs @ self.policy.w1 + self.policy.b1)
-        h2 = np.maximum(0, h1 @ self.policy.w2 + self.policy.b2)
-        return h2
+        """
+        NumPy policy gradient update.
+
+        Minimizes the same loss as the torch path (mean policy-gradient loss
+        minus the entropy bonus) by backpropagating through all three layers
+        and taking one clipped Adam step.
+        """
+        n = self._n
+        rows = np.arange(n)
+        obs = self.obs_buffer
+        actions = self.action_buffer
+        masks = self.mask_buffer if self._any_mask else None
+
+        if self._all_hidden:
+            # Weights are unchanged since sampling; only the output layer
+            # has to be recomputed
+            h1 = self.h1_buf[:n]
+            h2 = self.h2_buf[:n]
+            logits = h2 @ self.policy.w3 + self.policy.b3
+        else:
+            h1, h2, logits = self.policy._forward_batch(obs)
+        log_probs = log_softmax(logits, masks)
+        probs = np.exp(log_probs)
+
+        # Policy gradient: -log_prob * advantage
+        policy_loss = -float(log_probs[rows, actions] @ advantages) / n
+        row_entropy = -np.einsum("ij,ij->i", probs, log_probs)
+        entropy = float(row_entropy.mean())
+
+        # d loss / d logits, averaged over the batch:
+        #   policy term   (probs - onehot(a)) * adv
+        #   entropy term  coef * probs * (log_probs + H)
+        # Masked actions have zero probability and contribute nothing
+        dlogits = probs * (advantages[:, None]
+                           + self.policy.entropy_coef * (log_probs + row_entropy[:, None]))
+        dlogits[rows, actions] -= advantages
+        dlogits /= n
+
+        grads = self.policy._backward(obs, h1, h2, dlogits)
+        self.policy._adam_step(grads)
+
+        return policy_loss - self.policy.entropy_coef * entropy, entropy
 
     def reset_baseline(self):
         """Reset the baseline to zero."""
@@ -365,8 +769,46 @@ def random_policy_action(n_actions: int, mask: Optional[np.ndarray] = None,
     """Sample a random action (for baseline comparison)."""
     rng = rng or np.random.default_rng()
     if mask is not None:
-        valid_actions = np.where(mask)[0]
+        # Rejection sampling is O(1) expected for dense masks; fall back to
+        # scanning for valid actions if a few draws miss
+        for _ in range(4):
+            action = int(rng.integers(0, n_actions))
+            if mask[action]:
+                return action
+        valid_actions = np.flatnonzero(mask)
         if len(valid_actions) == 0:
             return rng.integers(0, n_actions)
         return rng.choice(valid_actions)
     return rng.integers(0, n_actions)
+
+
+def random_policy_actions(n_actions: int, masks: Optional[np.ndarray] = None,
+                          rng: Optional[np.random.Generator] = None,
+                          batch_size: Optional[int] = None) -> np.ndarray:
+    """
+    Sample one uniformly random valid action per row (batched baseline).
+
+    Args:
+        n_actions: Number of actions
+        masks: Optional boolean masks, shape (B, n_actions)
+        rng: Random number generator
+        batch_size: Number of actions to draw when ``masks`` is None
+
+    Returns:
+        Actions, shape (B,)
+    """
+    rng = rng or np.random.default_rng()
+    if masks is None:
+        return rng.integers(0, n_actions, size=batch_size)
+
+    cdf = masks.cumsum(axis=1, dtype=np.float64)
+    counts = cdf[:, -1:]
+    u = rng.random(len(masks))[:, None] * counts
+    # First index whose CDF exceeds u is always a valid (mask-increasing) one
+    actions = (cdf <= u).sum(axis=1)
+
+    # Rows with nothing valid fall back to any action, like the scalar version
+    empty = counts[:, 0] == 0
+    if empty.any():
+        actions[empty] = rng.integers(0, n_actions, size=int(empty.sum()))
+    return actions
@@ -1,22 +1,235 @@
 """Realistic Telemetry Simulator - generates authentic log data for red team campaigns."""
 
 import asyncio
+import heapq
 import logging
 import json
+import os
 import random
 import ipaddress
 import string
-import uuid
-from typing import Dict, Any, List, Optional, Generator, Tuple
+from typing import Dict, Any, List, Optional, Generator, Iterator, Tuple
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 import base64
 import hashlib
 import time
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Events materialized at a time per template by the streaming generators
+_STREAM_CHUNK_SIZE = 1024
+
+# Non-public IPv4 space: everything ipaddress reports as private, plus
+# shared, multicast and broadcast blocks
+_NON_PUBLIC_IPV4_NETWORKS = (
+    "0.0.0.0/8", "10.0.0.0/8", "100.64.0.0/10", "127.0.0.0/8", "169.254.0.0/16",
+    "172.16.0.0/12", "192.0.0.0/24", "192.0.2.0/24", "192.168.0.0/16", "198.18.0.0/15",
+    "198.51.100.0/24", "203.0.113.0/24", "224.0.0.0/4", "240.0.0.0/4",
+)
+
+def _public_ipv4_ranges() -> Tuple[Tuple[int, int], ...]:
+    """(start, size) integer ranges covering the public IPv4 space."""
+    blocked = sorted(
+        (int(net.network_address), int(net.broadcast_address) + 1)
+        for net in map(ipaddress.IPv4Network, _NON_PUBLIC_IPV4_NETWORKS)
+    )
+    ranges, start = [], 0
+    for lo, hi in blocked:
+        if lo > start:
+            ranges.append((start, lo - start))
+        start = max(start, hi)
+    if start < 2**32:
+        ranges.append((start, 2**32 - start))
+    return tuple(ranges)
+
+_PUBLIC_IPV4_RANGES = _public_ipv4_ranges()
+_PUBLIC_IPV4_TOTAL = sum(size for _, size in _PUBLIC_IPV4_RANGES)
+# Array form for batched sampling: a global offset falls in the first range
+# whose cumulative end exceeds it, and maps to that range's base + offset
+_PUBLIC_IPV4_CUMSIZE = np.cumsum([size for _, size in _PUBLIC_IPV4_RANGES], dtype=np.int64)
+_PUBLIC_IPV4_BASE = (np.array([start for start, _ in _PUBLIC_IPV4_RANGES], dtype=np.int64)
+                     - (_PUBLIC_IPV4_CUMSIZE - [size for _, size in _PUBLIC_IPV4_RANGES]))
+
+def _ipv4_str(ip: int) -> str:
+    """Dotted-quad string for an integer IPv4 address."""
+    return f"{ip >> 24}.{(ip >> 16) & 0xff}.{(ip >> 8) & 0xff}.{ip & 0xff}"
+
+_FILENAME_PREFIXES = ("document", "report", "data", "backup", "temp", "file")
+_FILENAME_CHARS = string.ascii_lowercase + string.digits
+_FILENAME_CHAR_CODES = np.frombuffer(_FILENAME_CHARS.encode("ascii"), dtype=np.uint8)
+_RANSOM_EXTENSIONS = ("encrypted", "locked", "cry")
+_DOCUMENT_EXTENSIONS = ("docx", "xlsx", "pdf", "txt")
+
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+def _log_timestamp(dt: datetime) -> str:
+    """``%Y-%m-%d %H:%M:%S`` via isoformat, avoiding strftime's locale machinery."""
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt.isoformat(" ", "seconds")
+
+def _syslog_timestamp(dt: datetime) -> str:
+    """RFC 3164 ``%b %d %H:%M:%S`` timestamp."""
+    return f"{_MONTH_ABBR[dt.month]} {_log_timestamp(dt)[8:]}"
+
+_json_str = json.encoder.encode_basestring_ascii
+_json_scalar = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+def _events_json_indented(events: List["TelemetryEvent"], indent) -> str:
+    """Same text as ``json.dumps`` of the exported event dicts with ``indent``.
+    
+    CPython only uses its C encoder for compact output, so indented export
+    is assembled from fragments built once per call (keys, separators,
+    enum values) around C-escaped per-event strings.
+    """
+    
+    if not events:
+        return "[]"
+    
+    i1 = " " * indent if isinstance(indent, int) else indent
+    i2, i3 = i1 * 2, i1 * 3
+    sep = ",\n" + i2
+    item_sep = ",\n" + i3
+    close = "\n" + i2 + "}"
+    key_fragments: Dict[str, str] = {}
+    
+    def dumps_nested(value: Any, prefix: str) -> str:
+        return json.dumps(value, indent=indent, default=str).replace("\n", "\n" + prefix)
+    
+    def dumps_fields(fields: Dict[str, Any]) -> str:
+        if not fields:
+            return "{}"
+        items = []
+        for key, value in fields.items():
+            key_fragment = key_fragments.get(key)
+            if key_fragment is None:
+                if type(key) is not str:
+                    return dumps_nested(fields, i2)
+                key_fragment = key_fragments[key] = _json_str(key) + ": "
+            if type(value) is str:
+                items.append(key_fragment + _json_str(value))
+            elif isinstance(value, (dict, list, tuple)):
+                items.append(key_fragment + dumps_nested(value, i3))
+            else:
+                items.append(key_fragment + _json_scalar(value))
+        return "{\n" + i3 + item_sep.join(items) + close
+    
+    timestamp_key = f'{sep}"timestamp": "'
+    event_type_keys = {
+        event_type: f'"{sep}"event_type": {_json_str(event_type.value)}{sep}"source_host": '
+        for event_type in TelemetryType
+    }
+    log_level_keys = {
+        log_level: f'{sep}"log_level": {_json_str(log_level.value)}{sep}"technique_id": '
+        for log_level in LogLevel
+    }
+    raw_log_key = f'{sep}"raw_log": '
+    parsed_fields_key = f'{sep}"parsed_fields": '
+    metadata_key = f'{sep}"metadata": '
+    
+    body = ("\n" + i1 + "},\n" + i1 + "{\n" + i2).join([
+        '"event_id": ' + _json_str(event.event_id)
+        + timestamp_key + event.timestamp.isoformat() + event_type_keys[event.event_type]
+        + _json_str(event.source_host) + log_level_keys[event.log_level]
+        + ("null" if event.technique_id is None else _json_str(event.technique_id))
+        + raw_log_key + _json_str(event.raw_log)
+        + parsed_fields_key + dumps_fields(event.parsed_fields)
+        + metadata_key + dumps_fields(event.metadata)
+        for event in events
+    ])
+    return "[\n" + i1 + "{\n" + i2 + body + "\n" + i1 + "}\n]"
+
+# IPv4 blocks ipaddress.IPv4Address.is_private reports as private, as
+# (network, mask) integer pairs
+_PRIVATE_IPV4_BLOCKS = tuple(
+    (int(net.network_address), int(net.netmask))
+    for net in map(ipaddress.IPv4Network, (
+        "0.0.0.0/8", "10.0.0.0/8", "127.0.0.0/8", "169.254.0.0/16", "172.16.0.0/12",
+        "192.0.0.0/29", "192.0.0.170/31", "192.0.2.0/24", "192.168.0.0/16", "198.18.0.0/15",
+        "198.51.100.0/24", "203.0.113.0/24", "240.0.0.0/4", "255.255.255.255/32",
+    ))
+)
+
+def _ipv4_to_u32(ips: List[str]) -> np.ndarray:
+    """Pack dotted-quad strings into a uint32 array."""
+    octets = np.array([ip.split(".") for ip in ips], dtype=np.uint32).reshape(-1, 4)
+    return (octets[:, 0] << 24) | (octets[:, 1] << 16) | (octets[:, 2] << 8) | octets[:, 3]
+
+def _is_private_u32(ips: np.ndarray) -> np.ndarray:
+    """Vectorized ``is_private`` over packed IPv4 addresses."""
+    private = np.zeros(ips.shape, dtype=bool)
+    for network, mask in _PRIVATE_IPV4_BLOCKS:
+        private |= (ips & np.uint32(mask)) == np.uint32(network)
+    return private
+
+class _Choice:
+    """Field generator drawing uniformly from a fixed pool."""
+    
+    def __init__(self, pool):
+        self.pool = tuple(pool)
+        self._array = np.empty(len(self.pool), dtype=object)
+        self._array[:] = self.pool
+    
+    def __call__(self, rng=random):
+        return rng.choice(self.pool)
+    
+    def sample(self, rng: np.random.Generator, n: int) -> List[Any]:
+        """Draw ``n`` values in one call."""
+        return self._array[rng.integers(len(self.pool), size=n)].tolist()
+
+class _RandInt:
+    """Field generator drawing an integer from ``[low, high]``, like ``random.randint``."""
+    
+    def __init__(self, low: int, high: int):
+        self.low = low
+        self.high = high
+    
+    def __call__(self, rng=random):
+        return rng.randint(self.low, self.high)
+    
+    def sample(self, rng: np.random.Generator, n: int) -> List[int]:
+        """Draw ``n`` values in one call."""
+        return rng.integers(self.low, self.high + 1, size=n).tolist()
+
+class _Batched:
+    """Field generator pairing a scalar function with a batched ``(rng, n)`` one."""
+    
+    def __init__(self, scalar, batch):
+        self._scalar = scalar
+        self._batch = batch
+    
+    def __call__(self, rng=random):
+        return self._scalar(rng)
+    
+    def sample(self, rng: np.random.Generator, n: int) -> List[Any]:
+        """Draw ``n`` values in one call."""
+        return self._batch(rng, n)
+
+class _Constant:
+    """Field generator that always returns the same value."""
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def __call__(self, rng=random):
+        return self.value
+    
+    def sample(self, rng: np.random.Generator, n: int) -> List[Any]:
+        """Return ``n`` copies of the value."""
+        return [self.value] * n
+
 class TelemetryType(Enum):
     """Types of telemetry data that can be generated."""
     WINDOWS_EVENT = "windows_event"
@@ -38,7 +251,7 @@ class LogLevel(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryEvent:
     """Single telemetry event."""
     event_id: str
@@ -49,13 +262,13 @@ class TelemetryEvent:
     technique_id: Optional[str]  # ATT&CK technique if applicable
     raw_log: str
     parsed_fields: Dict[str, Any]
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryTemplate:
     """Template for generating telemetry events."""
     template_id: str
@@ -67,14 +280,107 @@ class TelemetryTemplate:
     noise_ratio: float  # Ratio of noise events to signal events
     stealth_indicators: List[str]  # Indicators that make this stealthier
     detection_indicators: List[str]  # Strong indicators for detection
+    # Stream for field draws; None uses the simulator's shared generator
+    rng: Optional[np.random.Generator] = field(default=None, repr=False, compare=False)
+    # Compiled at construction: (field name, generator) pairs and log_format
+    # rewritten as a %-format over its placeholders in order
+    _generators: Tuple[Tuple[str, Any], ...] = field(init=False, repr=False, compare=False)
+    _percent_format: Optional[str] = field(init=False, repr=False, compare=False)
+    _format_fields: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._generators = tuple(self.field_generators.items())
+        
+        literals, names = [], []
+        for literal, name, spec, conversion in string.Formatter().parse(self.log_format):
+            literals.append(literal.replace("%", "%%"))
+            if name is None:
+                continue
+            if spec or conversion or not name.isidentifier():
+                # Keep str.format for anything beyond plain {name} fields
+                self._percent_format, self._format_fields = None, ()
+                return
+            literals.append("%s")
+            names.append(name)
+        self._percent_format = "".join(literals)
+        self._format_fields = tuple(names)
+    
+    def render(self, field_values: Dict[str, Any]) -> str:
+        """Render ``log_format`` with ``field_values``."""
+        if self._percent_format is None:
+            return self.log_format.format(**field_values)
+        return self._percent_format % tuple([field_values[name] for name in self._format_fields])
 
-class TelemetrySimulator:
-    """Generates realistic telemetry data for red team simulations."""
+class TelemetryEventBuffer:
+    """Append-only event store with columnar views for scan-style analysis.
+    
+    Behaves like a list of ``TelemetryEvent`` (len, iteration, indexing)
+    and additionally keeps each event's technique, interned to a small
+    integer code (0 for none), and detection score as columns. Columns are
+    captured when events are added, so events should not be modified after.
+    """
     
     def __init__(self):
+        self._events: List[TelemetryEvent] = []
+        self._technique_codes: List[int] = []
+        self._scores: List[float] = []
+        self._code_by_technique: Dict[str, int] = {}
+        self.technique_ids: List[Optional[str]] = [None]  # code -> technique ID
+        self._columns: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    
+    def append(self, event: TelemetryEvent):
+        self.extend((event,))
+    
+    def extend(self, events):
+        codes = self._code_by_technique
+        for event in events:
+            technique_id = event.technique_id
+            if technique_id:
+                code = codes.get(technique_id)
+                if code is None:
+                    code = codes[technique_id] = len(self.technique_ids)
+                    self.technique_ids.append(technique_id)
+            else:
+                code = 0
+            self._events.append(event)
+            self._technique_codes.append(code)
+            self._scores.append(event.metadata.get("detection_score", 0))
+        self._columns = None
+    
+    def clear(self):
+        self._events.clear()
+        self._technique_codes.clear()
+        self._scores.clear()
+        self._columns = None
+    
+    def columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(technique_codes[int32], detection_scores[float64]) for all events."""
+        if self._columns is None:
+            self._columns = (np.array(self._technique_codes, dtype=np.int32),
+                             np.array(self._scores, dtype=np.float64))
+        return self._columns
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def __iter__(self):
+        return iter(self._events)
+    
+    def __getitem__(self, index):
+        return self._events[index]
+
+class TelemetrySimulator:
+    """Generates realistic telemetry data for red team simulations.
+    
+    Pass ``seed`` for reproducible output: field values, event times and
+    event IDs then replay exactly (start times still follow the clock).
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
         self.event_templates: Dict[str, TelemetryTemplate] = {}
         self.background_noise_templates: Dict[str, TelemetryTemplate] = {}
-        self.generated_events: List[TelemetryEvent] = []
+        self._templates_by_technique: Dict[str, List[TelemetryTemplate]] = {}
+        self.generated_events = TelemetryEventBuffer()
         
         # Network and system context
         self.network_context = {
@@ -85,7 +391,28 @@ class TelemetrySimulator:
             "common_processes": ["explorer.exe", "chrome.exe", "outlook.exe", "winlogon.exe"]
         }
         
+        # Internal networks as (network address, size) integers
+        self._internal_networks = tuple(
+            (int(net.network_address), net.num_addresses)
+            for net in map(ipaddress.IPv4Network, self.network_context["internal_networks"])
+        )
+        
+        # Random streams. A seed makes generation reproducible; without one
+        # they are seeded from ``random`` so random.seed() before
+        # construction still does
+        self._seed = seed
+        self._rng = random.Random(random.getrandbits(64) if seed is None else seed)
+        self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        
+        # Pre-formatted random event IDs, refilled in blocks
+        self._event_ids: List[str] = []
+        
         self._initialize_templates()
+        
+        # Each template draws its fields from its own stream
+        for template in (*self.event_templates.values(), *self.background_noise_templates.values()):
+            template.rng = np.random.default_rng(self._rng.getrandbits(64))
+        
         logger.info("Telemetry simulator initialized")
     
     def _initialize_templates(self):
@@ -98,10 +425,10 @@ class TelemetrySimulator:
             event_type=TelemetryType.EMAIL_LOG,
             log_format="[{timestamp}] SMTP: From={sender} To={recipient} Subject={subject} Attachment={attachment}",
             field_generators={
-                "sender": lambda: random.choice(["attacker@evil.com", "noreply@bank.com", "admin@company.com"]),
-                "recipient": lambda: random.choice(self.network_context["user_accounts"]) + "@company.com",
-                "subject": lambda: random.choice(["Urgent: Account Verification", "Invoice #12345", "IT Security Update"]),
-                "attachment": lambda: random.choice(["invoice.pdf.exe", "document.docm", "update.zip"])
+                "sender": _Choice(["attacker@evil.com", "noreply@bank.com", "admin@company.com"]),
+                "recipient": _Choice(user + "@company.com" for user in self.network_context["user_accounts"]),
+                "subject": _Choice(["Urgent: Account Verification", "Invoice #12345", "IT Security Update"]),
+                "attachment": _Choice(["invoice.pdf.exe", "document.docm", "update.zip"])
             },
             frequency_per_hour=0.1,
             noise_ratio=5.0,
@@ -116,11 +443,11 @@ class TelemetrySimulator:
             event_type=TelemetryType.PROCESS_ACTIVITY,
             log_format="Process {source_process} (PID: {source_pid}) accessed {target_process} (PID: {target_pid}) with {access_rights}",
             field_generators={
-                "source_process": lambda: random.choice(["powershell.exe", "cmd.exe", "malware.exe"]),
-                "source_pid": lambda: random.randint(1000, 9999),
-                "target_process": lambda: random.choice(["explorer.exe", "notepad.exe", "winlogon.exe"]),
-                "target_pid": lambda: random.randint(1000, 9999),
-                "access_rights": lambda: "PROCESS_ALL_ACCESS"
+                "source_process": _Choice(["powershell.exe", "cmd.exe", "malware.exe"]),
+                "source_pid": _RandInt(1000, 9999),
+                "target_process": _Choice(["explorer.exe", "notepad.exe", "winlogon.exe"]),
+                "target_pid": _RandInt(1000, 9999),
+                "access_rights": _Constant("PROCESS_ALL_ACCESS")
             },
             frequency_per_hour=0.05,
             noise_ratio=20.0,
@@ -135,9 +462,9 @@ class TelemetrySimulator:
             event_type=TelemetryType.AUTHENTICATION,
             log_format="RDP: User {username} logged in from {source_ip} to {target_host}",
             field_generators={
-                "username": lambda: random.choice(self.network_context["user_accounts"]),
-                "source_ip": lambda: self._generate_external_ip(),
-                "target_host": lambda: random.choice(self.network_context["common_hostnames"])
+                "username": _Choice(self.network_context["user_accounts"]),
+                "source_ip": _Batched(self._generate_external_ip, self._generate_external_ips),
+                "target_host": _Choice(self.network_context["common_hostnames"])
             },
             frequency_per_hour=0.2,
             noise_ratio=10.0,
@@ -152,9 +479,9 @@ class TelemetrySimulator:
             event_type=TelemetryType.PROCESS_ACTIVITY,
             log_format="Process {process_name} (PID: {pid}) accessed LSASS memory with {access_type}",
             field_generators={
-                "process_name": lambda: random.choice(["mimikatz.exe", "procdump.exe", "powershell.exe"]),
-                "pid": lambda: random.randint(1000, 9999),
-                "access_type": lambda: "PROCESS_VM_READ"
+                "process_name": _Choice(["mimikatz.exe", "procdump.exe", "powershell.exe"]),
+                "pid": _RandInt(1000, 9999),
+                "access_type": _Constant("PROCESS_VM_READ")
             },
             frequency_per_hour=0.02,
             noise_ratio=50.0,
@@ -169,11 +496,11 @@ class TelemetrySimulator:
             event_type=TelemetryType.NETWORK_FLOW,
             log_format="Outbound connection: {src_host}:{src_port} -> {dst_ip}:{dst_port} [{bytes_out} bytes]",
             field_generators={
-                "src_host": lambda: random.choice(self.network_context["common_hostnames"]),
-                "src_port": lambda: random.randint(49152, 65535),
-                "dst_ip": lambda: self._generate_external_ip(),
-                "dst_port": lambda: random.choice([80, 443, 8080, 53]),
-                "bytes_out": lambda: random.randint(1000000, 50000000)  # 1MB - 50MB
+                "src_host": _Choice(self.network_context["common_hostnames"]),
+                "src_port": _RandInt(49152, 65535),
+                "dst_ip": _Batched(self._generate_external_ip, self._generate_external_ips),
+                "dst_port": _Choice([80, 443, 8080, 53]),
+                "bytes_out": _RandInt(1000000, 50000000)  # 1MB - 50MB
             },
             frequency_per_hour=0.1,
             noise_ratio=100.0,
@@ -188,10 +515,10 @@ class TelemetrySimulator:
             event_type=TelemetryType.FILE_ACTIVITY,
             log_format="File {operation}: {file_path} by process {process_name} (PID: {pid})",
             field_generators={
-                "operation": lambda: random.choice(["WRITE", "DELETE", "RENAME"]),
-                "file_path": lambda: f"C:\\Users\\{random.choice(self.network_context['user_accounts'])}\\Documents\\{self._generate_filename()}.{random.choice(['encrypted', 'locked', 'cry'])}",
-                "process_name": lambda: random.choice(["ransomware.exe", "locker.exe", "encrypt.exe"]),
-                "pid": lambda: random.randint(1000, 9999)
+                "operation": _Choice(["WRITE", "DELETE", "RENAME"]),
+                "file_path": self._user_file_path_generator(_RANSOM_EXTENSIONS),
+                "process_name": _Choice(["ransomware.exe", "locker.exe", "encrypt.exe"]),
+                "pid": _RandInt(1000, 9999)
             },
             frequency_per_hour=50.0,  # Ransomware is very active
             noise_ratio=1.0,
@@ -206,14 +533,14 @@ class TelemetrySimulator:
             event_type=TelemetryType.PROCESS_ACTIVITY,
             log_format="Process Created: {process_name} CommandLine: {command_line} Parent: {parent_process}",
             field_generators={
-                "process_name": lambda: "cmd.exe",
-                "command_line": lambda: random.choice([
+                "process_name": _Constant("cmd.exe"),
+                "command_line": _Choice([
                     "cmd.exe /c whoami",
                     "cmd.exe /c net user administrator /active:yes",
                     "cmd.exe /c reg add HKLM\\Software\\Microsoft\\Windows\\CurrentVersion\\Run /v Backdoor /d malware.exe",
                     "cmd.exe /c powershell.exe -ExecutionPolicy Bypass -File malware.ps1"
                 ]),
-                "parent_process": lambda: random.choice(["explorer.exe", "winlogon.exe", "powershell.exe"])
+                "parent_process": _Choice(["explorer.exe", "winlogon.exe", "powershell.exe"])
             },
             frequency_per_hour=2.0,
             noise_ratio=10.0,
@@ -221,6 +548,10 @@ class TelemetrySimulator:
             detection_indicators=["suspicious_commands", "privilege_escalation", "persistence"]
         )
         
+        # Index templates by technique so lookups skip the scan
+        for template in self.event_templates.values():
+            self._templates_by_technique.setdefault(template.technique_id, []).append(template)
+        
         # Initialize background noise templates
         self._initialize_noise_templates()
     
@@ -234,8 +565,8 @@ class TelemetrySimulator:
             event_type=TelemetryType.AUTHENTICATION,
             log_format="User {username} successfully logged in from {source_ip}",
             field_generators={
-                "username": lambda: random.choice(self.network_context["user_accounts"]),
-                "source_ip": lambda: self._generate_internal_ip()
+                "username": _Choice(self.network_context["user_accounts"]),
+                "source_ip": _Batched(self._generate_internal_ip, self._generate_internal_ips)
             },
             frequency_per_hour=50.0,
             noise_ratio=0.0,
@@ -250,9 +581,9 @@ class TelemetrySimulator:
             event_type=TelemetryType.DNS_LOG,
             log_format="DNS Query: {hostname} -> {ip_address} (Type: {record_type})",
             field_generators={
-                "hostname": lambda: random.choice(["www.google.com", "outlook.com", "github.com", "stackoverflow.com"]),
-                "ip_address": lambda: self._generate_external_ip(),
-                "record_type": lambda: random.choice(["A", "AAAA", "CNAME"])
+                "hostname": _Choice(["www.google.com", "outlook.com", "github.com", "stackoverflow.com"]),
+                "ip_address": _Batched(self._generate_external_ip, self._generate_external_ips),
+                "record_type": _Choice(["A", "AAAA", "CNAME"])
             },
             frequency_per_hour=200.0,
             noise_ratio=0.0,
@@ -267,9 +598,9 @@ class TelemetrySimulator:
             event_type=TelemetryType.FILE_ACTIVITY,
             log_format="File {operation}: {file_path} by {username}",
             field_generators={
-                "operation": lambda: random.choice(["READ", "WRITE", "OPEN"]),
-                "file_path": lambda: f"C:\\Users\\{random.choice(self.network_context['user_accounts'])}\\Documents\\{self._generate_filename()}.{random.choice(['docx', 'xlsx', 'pdf', 'txt'])}",
-                "username": lambda: random.choice(self.network_context["user_accounts"])
+                "operation": _Choice(["READ", "WRITE", "OPEN"]),
+                "file_path": self._user_file_path_generator(_DOCUMENT_EXTENSIONS),
+                "username": _Choice(self.network_context["user_accounts"])
             },
             frequency_per_hour=100.0,
             noise_ratio=0.0,
@@ -277,101 +608,327 @@ class TelemetrySimulator:
             detection_indicators=[]
         )
     
-    def _generate_internal_ip(self) -> str:
-        """Generate a random internal IP address."""
-        network = random.choice(self.network_context["internal_networks"])
-        net = ipaddress.IPv4Network(network)
-        return str(list(net.hosts())[random.randint(0, min(1000, net.num_addresses - 2))])
+    def _generate_internal_ip(self, rng=random) -> str:
+        """Generate a random internal IP address among the first hosts of a network."""
+        network, size = rng.choice(self._internal_networks)
+        return _ipv4_str(network + 1 + rng.randint(0, min(1000, size - 2)))
     
-    def _generate_external_ip(self) -> str:
+    def _generate_internal_ips(self, rng: np.random.Generator, n: int) -> List[str]:
+        """Generate ``n`` random internal IP addresses."""
+        networks = np.array([network for network, _ in self._internal_networks], dtype=np.int64)
+        spans = np.array([min(1000, size - 2) + 1 for _, size in self._internal_networks], dtype=np.int64)
+        which = rng.integers(len(networks), size=n)
+        ips = networks[which] + 1 + (rng.random(n) * spans[which]).astype(np.int64)
+        return [_ipv4_str(ip) for ip in ips.tolist()]
+    
+    def _generate_external_ip(self, rng=random) -> str:
         """Generate a random external IP address."""
-        while True:
-            ip = ipaddress.IPv4Address(random.randint(1, 2**32 - 1))
-            # Ensure it's not in private ranges
-            if not ip.is_private:
-                return str(ip)
+        # Uniform over public space: pick an offset, then walk the ranges
+        offset = rng.randrange(_PUBLIC_IPV4_TOTAL)
+        for start, size in _PUBLIC_IPV4_RANGES:
+            if offset < size:
+                return _ipv4_str(start + offset)
+            offset -= size
+    
+    def _generate_external_ips(self, rng: np.random.Generator, n: int) -> List[str]:
+        """Generate ``n`` random external IP addresses."""
+        offsets = rng.integers(_PUBLIC_IPV4_TOTAL, size=n)
+        ranges = np.searchsorted(_PUBLIC_IPV4_CUMSIZE, offsets, side="right")
+        ips = _PUBLIC_IPV4_BASE[ranges] + offsets
+        return [_ipv4_str(ip) for ip in ips.tolist()]
     
-    def _generate_filename(self) -> str:
+    def _next_event_id(self) -> str:
+        """Return a random UUID4 string, drawing entropy in blocks of 4096 IDs.
+        
+        IDs come from OS entropy, or from the simulator's stream when it
+        was given a seed.
+        """
+        if not self._event_ids:
+            count = 4096
+            entropy = os.urandom(16 * count) if self._seed is None else self._rng.randbytes(16 * count)
+            raw = np.frombuffer(entropy, dtype=np.uint8).reshape(count, 16).copy()
+            # Set the version (4) and RFC 4122 variant bits, as uuid.uuid4() does
+            raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+            raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+            h = raw.tobytes().hex()
+            self._event_ids = [
+                f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+                for i in range(0, 32 * count, 32)
+            ]
+        return self._event_ids.pop()
+    
+    def _generate_filename(self, rng=random) -> str:
         """Generate a random filename."""
-        prefixes = ["document", "report", "data", "backup", "temp", "file"]
-        suffixes = ["".join(random.choices(string.ascii_lowercase + string.digits, k=6))]
-        return f"{random.choice(prefixes)}_{random.choice(suffixes)}"
+        suffix = "".join(rng.choices(_FILENAME_CHARS, k=6))
+        return f"{rng.choice(_FILENAME_PREFIXES)}_{suffix}"
+    
+    def _user_file_path_generator(self, extensions: Tuple[str, ...]) -> "_Batched":
+        """Field generator for a file in a random user's Documents folder."""
+        users = tuple(self.network_context["user_accounts"])
+        
+        def scalar(rng=random):
+            return f"C:\\Users\\{rng.choice(users)}\\Documents\\{self._generate_filename(rng)}.{rng.choice(extensions)}"
+        
+        def batch(rng: np.random.Generator, n: int) -> List[str]:
+            user = rng.integers(len(users), size=n).tolist()
+            prefix = rng.integers(len(_FILENAME_PREFIXES), size=n).tolist()
+            extension = rng.integers(len(extensions), size=n).tolist()
+            # All 6-character suffixes as one ASCII block, sliced per event
+            chars = _FILENAME_CHAR_CODES[rng.integers(len(_FILENAME_CHARS), size=6 * n)].tobytes().decode("ascii")
+            return [
+                f"C:\\Users\\{users[u]}\\Documents\\{_FILENAME_PREFIXES[p]}_{chars[6 * i:6 * i + 6]}.{extensions[e]}"
+                for i, (u, p, e) in enumerate(zip(user, prefix, extension))
+            ]
+        
+        return _Batched(scalar, batch)
     
     async def generate_technique_telemetry(self, technique_id: str, 
                                          duration_minutes: int = 60,
                                          stealth_level: float = 0.5) -> List[TelemetryEvent]:
         """Generate telemetry for a specific ATT&CK technique."""
         
-        events = []
+        events, _ = self._generate_technique_events(
+            technique_id, self._technique_templates(technique_id),
+            datetime.now(), duration_minutes, stealth_level
+        )
+        return events
+    
+    def _technique_templates(self, technique_id: str) -> List[TelemetryTemplate]:
+        """Templates that emit telemetry for ``technique_id``."""
+        return self._templates_by_technique.get(technique_id, [])
+    
+    async def generate_technique_telemetry_batch(self, requests: List[Tuple[str, float]],
+                                               duration_minutes: int = 60) -> Dict[str, List[TelemetryEvent]]:
+        """Generate telemetry for several techniques in one call.
+        
+        ``requests`` holds ``(technique_id, stealth_level)`` pairs; the result
+        maps each technique ID to the events generated for it. The start time
+        is captured once for the whole batch.
+        """
+        
         start_time = datetime.now()
         
-        # Find templates for this technique
-        technique_templates = [
-            template for template in self.event_templates.values()
-            if template.technique_id == technique_id
-        ]
+        results: Dict[str, List[TelemetryEvent]] = {}
+        for technique_id, stealth_level in requests:
+            events, _ = self._generate_technique_events(
+                technique_id, self._technique_templates(technique_id),
+                start_time, duration_minutes, stealth_level
+            )
+            results.setdefault(technique_id, []).extend(events)
+        
+        return results
+    
+    def _generate_technique_events(self, technique_id: str,
+                                   technique_templates: List[TelemetryTemplate],
+                                   start_time: datetime, duration_minutes: int,
+                                   stealth_level: float) -> Tuple[List[TelemetryEvent], np.ndarray]:
+        """Generate and time-sort the events for one technique's templates.
+        
+        Returns the events and their sorted microsecond offsets from
+        ``start_time``.
+        """
+        
+        events = []
+        # Each event's offset from start_time in microseconds, for sorting
+        offsets_us = []
         
         if not technique_templates:
             logger.warning(f"No templates found for technique {technique_id}")
-            return events
+            return events, np.empty(0, dtype=np.int64)
         
         for template in technique_templates:
-            # Calculate number of events based on frequency and duration
-            expected_events = (template.frequency_per_hour * duration_minutes) / 60.0
-            
-            # Adjust for stealth level (higher stealth = fewer events)
-            stealth_factor = 1.0 - (stealth_level * 0.7)  # Reduce by up to 70%
-            actual_events = max(1, int(expected_events * stealth_factor))
+            actual_events = self._signal_event_count(template, duration_minutes, stealth_level)
             
             logger.debug(f"Generating {actual_events} events for {technique_id} using template {template.template_id}")
             
             # Generate events spread over the duration
-            for i in range(actual_events):
-                event_time = start_time + timedelta(
-                    minutes=random.uniform(0, duration_minutes)
-                )
-                
-                event = self._generate_event_from_template(template, event_time, stealth_level)
-                events.append(event)
-                
-                # Generate noise events
-                noise_events = self._generate_noise_events(template, event_time, stealth_level)
-                events.extend(noise_events)
+            signal_us = self._minute_offsets_us(0, duration_minutes, actual_events)
+            event_times = self._offset_times(start_time, signal_us)
+            events.extend(self._generate_events_batch(template, event_times, stealth_level))
+            offsets_us.append(signal_us)
+            
+            # Generate noise events
+            noise_events, noise_us = self._generate_noise_events(
+                template, start_time, signal_us, stealth_level
+            )
+            events.extend(noise_events)
+            offsets_us.append(noise_us)
         
-        # Sort events by timestamp
-        events.sort(key=lambda x: x.timestamp)
+        # Sort events by timestamp: every event is start_time plus an exact
+        # integer offset, so argsort the offsets instead of comparing datetimes
+        offsets_us = np.concatenate(offsets_us)
+        order = np.argsort(offsets_us, kind="stable")
+        events = [events[i] for i in order.tolist()]
         
         logger.info(f"Generated {len(events)} telemetry events for technique {technique_id}")
-        return events
+        return events, offsets_us[order]
+    
+    @staticmethod
+    def _signal_event_count(template: TelemetryTemplate, duration_minutes: int,
+                            stealth_level: float) -> int:
+        """Number of signal events a template emits over ``duration_minutes``."""
+        
+        # Calculate number of events based on frequency and duration
+        expected_events = (template.frequency_per_hour * duration_minutes) / 60.0
+        
+        # Adjust for stealth level (higher stealth = fewer events)
+        stealth_factor = 1.0 - (stealth_level * 0.7)  # Reduce by up to 70%
+        return max(1, int(expected_events * stealth_factor))
+    
+    def iter_technique_telemetry(self, technique_id: str, duration_minutes: int = 60,
+                                 stealth_level: float = 0.5,
+                                 start_time: Optional[datetime] = None) -> Iterator[TelemetryEvent]:
+        """Yield telemetry for a technique in timestamp order.
+        
+        Streaming counterpart of ``generate_technique_telemetry``: event
+        times are drawn up front, but events are built in chunks as the
+        iterator advances and merged across templates, so memory holds the
+        time arrays rather than every event. Streamed events are not added
+        to ``generated_events``.
+        """
+        
+        if start_time is None:
+            start_time = datetime.now()
+        return heapq.merge(
+            *self._technique_streams(technique_id, start_time, duration_minutes, stealth_level),
+            key=attrgetter("timestamp")
+        )
+    
+    def iter_campaign_telemetry(self, technique_sequence: List[str],
+                                total_duration_hours: int = 24,
+                                stealth_level: float = 0.5) -> Iterator[TelemetryEvent]:
+        """Yield campaign telemetry in timestamp order.
+        
+        Streaming counterpart of ``generate_campaign_telemetry`` with the
+        same timeline and background noise; see ``iter_technique_telemetry``.
+        """
+        
+        campaign_start = datetime.now()
+        technique_duration = (total_duration_hours * 60) // len(technique_sequence)
+        
+        streams = []
+        for technique_id, start_us in zip(
+                technique_sequence, self._technique_start_offsets_us(len(technique_sequence), technique_duration)):
+            streams.extend(self._technique_streams(
+                technique_id, campaign_start + timedelta(microseconds=start_us),
+                technique_duration, stealth_level
+            ))
+        
+        for template in self.background_noise_templates.values():
+            events_count = int(template.frequency_per_hour * total_duration_hours)
+            offsets_us = np.sort(self._minute_offsets_us(0, total_duration_hours * 60, events_count))
+            streams.append(self._template_stream(template, campaign_start, offsets_us, 0.0))
+        
+        return heapq.merge(*streams, key=attrgetter("timestamp"))
     
-    def _generate_event_from_template(self, template: TelemetryTemplate, 
-                                    timestamp: datetime, stealth_level: float) -> TelemetryEvent:
-        """Generate a single event from a template."""
+    def _technique_streams(self, technique_id: str, start_time: datetime,
+                           duration_minutes: int, stealth_level: float) -> List[Iterator[TelemetryEvent]]:
+        """Time-ordered signal and noise streams for each of a technique's templates."""
         
-        # Generate field values
-        field_values = {}
-        for field_name, generator in template.field_generators.items():
-            field_values[field_name] = generator()
+        technique_templates = self._technique_templates(technique_id)
+        if not technique_templates:
+            logger.warning(f"No templates found for technique {technique_id}")
+        
+        streams = []
+        for template in technique_templates:
+            actual_events = self._signal_event_count(template, duration_minutes, stealth_level)
+            signal_us = np.sort(self._minute_offsets_us(0, duration_minutes, actual_events))
+            streams.append(self._template_stream(template, start_time, signal_us, stealth_level))
+            
+            template_index, noise_us = self._noise_offsets(template, signal_us, stealth_level)
+            streams.append(self._noise_stream(start_time, template_index, noise_us))
+        return streams
+    
+    def _template_stream(self, template: TelemetryTemplate, start_time: datetime,
+                         offsets_us: np.ndarray, stealth_level: float) -> Iterator[TelemetryEvent]:
+        """Generate a template's events at sorted ``offsets_us``, one chunk at a time."""
+        
+        for lo in range(0, len(offsets_us), _STREAM_CHUNK_SIZE):
+            event_times = self._offset_times(start_time, offsets_us[lo:lo + _STREAM_CHUNK_SIZE])
+            yield from self._generate_events_batch(template, event_times, stealth_level)
+    
+    def _noise_stream(self, start_time: datetime, template_index: np.ndarray,
+                      offsets_us: np.ndarray) -> Iterator[TelemetryEvent]:
+        """Generate noise events in offset order, one chunk at a time."""
+        
+        noise_templates = list(self.background_noise_templates.values())
+        order = np.argsort(offsets_us, kind="stable")
+        for lo in range(0, len(order), _STREAM_CHUNK_SIZE):
+            selected = order[lo:lo + _STREAM_CHUNK_SIZE]
+            chunk_index = template_index[selected]
+            chunk_events: List[Optional[TelemetryEvent]] = [None] * len(selected)
+            for index in np.unique(chunk_index).tolist():
+                positions = np.flatnonzero(chunk_index == index)
+                noise_times = self._offset_times(start_time, offsets_us[selected[positions]])
+                noise_events = self._generate_events_batch(noise_templates[index], noise_times, 0.0)
+                for position, noise_event in zip(positions.tolist(), noise_events):
+                    noise_event.technique_id = None  # Noise events don't map to techniques
+                    chunk_events[position] = noise_event
+            yield from chunk_events
+    
+    def _minute_offsets_us(self, low: float, high: float, n: int) -> np.ndarray:
+        """Draw ``n`` uniform offsets in ``[low, high)`` minutes, as int64 microseconds."""
+        return np.rint(self._np_rng.uniform(low, high, size=n) * 60e6).astype(np.int64)
+    
+    @staticmethod
+    def _offset_times(base: datetime, offsets_us: np.ndarray) -> List[datetime]:
+        """Timestamps ``base + offset`` for an array of microsecond offsets."""
+        return [base + timedelta(microseconds=us) for us in offsets_us.tolist()]
+    
+    def _sample_template_batch(self, template: TelemetryTemplate, n: int) -> List[Dict[str, Any]]:
+        """Draw field values for ``n`` events, one batched call per field where possible."""
+        names = [name for name, _ in template._generators]
+        rng = self._np_rng if template.rng is None else template.rng
+        columns = [
+            generator.sample(rng, n) if hasattr(generator, "sample")
+            else [generator() for _ in range(n)]
+            for _, generator in template._generators
+        ]
+        if not columns:
+            return [{} for _ in range(n)]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+    
+    def _generate_events_batch(self, template: TelemetryTemplate, timestamps: List[datetime],
+                               stealth_level: float) -> List[TelemetryEvent]:
+        """Generate one event per timestamp from a template, scoring them as a batch."""
+        field_values_list = [
+            self._finalize_fields(template, timestamp, stealth_level, field_values)
+            for timestamp, field_values in zip(
+                timestamps, self._sample_template_batch(template, len(timestamps))
+            )
+        ]
+        scores = self._calculate_detection_scores(template, field_values_list, stealth_level)
+        return [
+            self._build_event(template, timestamp, stealth_level, field_values, score)
+            for timestamp, field_values, score in zip(timestamps, field_values_list, scores)
+        ]
+    
+    def _finalize_fields(self, template: TelemetryTemplate, timestamp: datetime,
+                         stealth_level: float, field_values: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the log timestamp to sampled field values and apply stealth modifications."""
         
         # Add timestamp
-        field_values["timestamp"] = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        field_values["timestamp"] = _log_timestamp(timestamp)
         
         # Apply stealth modifications
         if stealth_level > 0.7:
             field_values = self._apply_stealth_modifications(field_values, template)
         
+        return field_values
+    
+    def _build_event(self, template: TelemetryTemplate, timestamp: datetime, stealth_level: float,
+                     field_values: Dict[str, Any], detection_score: float) -> TelemetryEvent:
+        """Render and package one event from its final field values."""
+        
         # Generate raw log
-        raw_log = template.log_format.format(**field_values)
+        raw_log = template.render(field_values)
         
         # Create parsed fields
         parsed_fields = field_values.copy()
         parsed_fields.pop("timestamp", None)  # Remove timestamp from parsed fields
         
-        # Add detection indicators
-        detection_score = self._calculate_detection_score(template, field_values, stealth_level)
-        
         event = TelemetryEvent(
-            event_id=str(uuid.uuid4()),
+            event_id=self._next_event_id(),
             timestamp=timestamp,
             event_type=template.event_type,
             source_host=field_values.get("src_host", field_values.get("target_host", "UNKNOWN")),
@@ -402,40 +959,56 @@ class TelemetrySimulator:
                 modified_values["sender"] = f"{username}@company.com"
             
             elif indicator == "internal_source_ip" and "source_ip" in modified_values:
-                modified_values["source_ip"] = self._generate_internal_ip()
+                modified_values["source_ip"] = self._generate_internal_ip(self._rng)
             
             elif indicator == "business_hours" and "timestamp" in modified_values:
-                # Adjust to business hours (9 AM - 5 PM)
-                dt = datetime.strptime(modified_values["timestamp"], "%Y-%m-%d %H:%M:%S")
-                business_hour = random.randint(9, 17)
-                dt = dt.replace(hour=business_hour)
-                modified_values["timestamp"] = dt.strftime("%Y-%m-%d %H:%M:%S")
+                # Adjust to business hours (9 AM - 5 PM) by swapping the
+                # hour digits of "YYYY-MM-DD HH:MM:SS"
+                timestamp_str = modified_values["timestamp"]
+                business_hour = self._rng.randint(9, 17)
+                modified_values["timestamp"] = f"{timestamp_str[:11]}{business_hour:02d}{timestamp_str[13:]}"
             
             elif indicator == "legitimate_process_name" and "process_name" in modified_values:
                 # Use common legitimate process names
-                modified_values["process_name"] = random.choice(self.network_context["common_processes"])
+                modified_values["process_name"] = self._rng.choice(self.network_context["common_processes"])
         
         return modified_values
     
-    def _calculate_detection_score(self, template: TelemetryTemplate, 
-                                 field_values: Dict[str, Any], stealth_level: float) -> float:
-        """Calculate how likely this event is to be detected."""
+    def _calculate_detection_scores(self, template: TelemetryTemplate,
+                                    field_values_list: List[Dict[str, Any]],
+                                    stealth_level: float) -> List[float]:
+        """Calculate detection scores for a batch of one template's events.
         
-        base_score = 0.5  # Baseline detection probability
+        Each indicator is evaluated as a vector operation over its field's
+        column. Events from one template share the same field names.
+        """
+        
+        n = len(field_values_list)
+        if n == 0:
+            return []
+        fields = field_values_list[0]
+        base_score = np.full(n, 0.5)  # Baseline detection probability
         
         # Increase score for detection indicators
         for indicator in template.detection_indicators:
-            if indicator == "external_source_ip" and "source_ip" in field_values:
-                if not ipaddress.IPv4Address(field_values["source_ip"]).is_private:
-                    base_score += 0.2
+            if indicator == "external_source_ip" and "source_ip" in fields:
+                ips = _ipv4_to_u32([values["source_ip"] for values in field_values_list])
+                base_score += np.where(_is_private_u32(ips), 0.0, 0.2)
             
-            elif indicator == "suspicious_attachment" and "attachment" in field_values:
-                if any(ext in field_values["attachment"] for ext in [".exe", ".scr", ".bat"]):
-                    base_score += 0.3
+            elif indicator == "suspicious_attachment" and "attachment" in fields:
+                # Few distinct attachment names; test each once
+                suspicious = {}
+                for values in field_values_list:
+                    name = values["attachment"]
+                    if name not in suspicious:
+                        suspicious[name] = any(ext in name for ext in [".exe", ".scr", ".bat"])
+                base_score += 0.3 * np.fromiter(
+                    (suspicious[values["attachment"]] for values in field_values_list), dtype=bool, count=n
+                )
             
-            elif indicator == "large_outbound_transfer" and "bytes_out" in field_values:
-                if field_values["bytes_out"] > 10000000:  # > 10MB
-                    base_score += 0.25
+            elif indicator == "large_outbound_transfer" and "bytes_out" in fields:
+                bytes_out = np.array([values["bytes_out"] for values in field_values_list])
+                base_score += np.where(bytes_out > 10000000, 0.25, 0.0)  # > 10MB
             
             elif indicator == "mass_file_encryption" and template.technique_id == "T1486":
                 base_score += 0.4  # Ransomware is usually very detectable
@@ -443,118 +1016,198 @@ class TelemetrySimulator:
         # Reduce score based on stealth level
         final_score = base_score * (1.0 - stealth_level * 0.6)
         
-        return max(0.0, min(1.0, final_score))
+        return np.clip(final_score, 0.0, 1.0).tolist()
     
-    def _generate_noise_events(self, signal_template: TelemetryTemplate, 
-                             timestamp: datetime, stealth_level: float) -> List[TelemetryEvent]:
-        """Generate background noise events around a signal event."""
+    def _generate_noise_events(self, signal_template: TelemetryTemplate, start_time: datetime,
+                             signal_offsets_us: np.ndarray, stealth_level: float
+                             ) -> Tuple[List[TelemetryEvent], np.ndarray]:
+        """Generate background noise events around each of a template's signal events.
+        
+        Signal events sit at ``start_time + signal_offsets_us``. Returns the
+        noise events and their microsecond offsets from ``start_time``.
+        """
         
         noise_events = []
         
-        # Calculate number of noise events
+        # Draw every noise event's template and offset up front
+        template_index, offsets_us = self._noise_offsets(signal_template, signal_offsets_us, stealth_level)
+        if len(offsets_us) == 0:
+            return noise_events, offsets_us
+        
+        # Generate per noise template, then report offsets in that order
+        noise_templates = list(self.background_noise_templates.values())
+        order = np.argsort(template_index, kind="stable")
+        counts = np.bincount(template_index, minlength=len(noise_templates))
+        for noise_template, selected in zip(noise_templates, np.split(order, np.cumsum(counts)[:-1])):
+            if len(selected) == 0:
+                continue
+            noise_times = self._offset_times(start_time, offsets_us[selected])
+            for noise_event in self._generate_events_batch(noise_template, noise_times, 0.0):
+                noise_event.technique_id = None  # Noise events don't map to techniques
+                noise_events.append(noise_event)
+        
+        return noise_events, offsets_us[order]
+    
+    def _noise_offsets(self, signal_template: TelemetryTemplate, signal_offsets_us: np.ndarray,
+                       stealth_level: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw each noise event's background template index and microsecond offset."""
+        
+        # Calculate number of noise events per signal event
         noise_count = int(signal_template.noise_ratio * (1.0 + stealth_level))
+        total = noise_count * len(signal_offsets_us)
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
         
         # Generate noise events in time window around the signal
-        time_window = timedelta(minutes=30)
+        window_minutes = 30.0
         
-        for _ in range(noise_count):
-            # Random noise template
-            noise_template = random.choice(list(self.background_noise_templates.values()))
-            
-            # Random time within window
-            noise_time = timestamp + timedelta(
-                minutes=random.uniform(-time_window.total_seconds()/60, time_window.total_seconds()/60)
-            )
-            
-            noise_event = self._generate_event_from_template(noise_template, noise_time, 0.0)
-            noise_event.technique_id = None  # Noise events don't map to techniques
-            noise_events.append(noise_event)
-        
-        return noise_events
+        template_index = self._np_rng.integers(len(self.background_noise_templates), size=total)
+        offsets_us = (np.repeat(signal_offsets_us, noise_count)
+                      + self._minute_offsets_us(-window_minutes, window_minutes, total))
+        return template_index, offsets_us
     
     async def generate_campaign_telemetry(self, technique_sequence: List[str],
                                         total_duration_hours: int = 24,
-                                        stealth_level: float = 0.5) -> List[TelemetryEvent]:
-        """Generate telemetry for an entire campaign with multiple techniques."""
+                                        stealth_level: float = 0.5,
+                                        executor: Optional[Executor] = None) -> List[TelemetryEvent]:
+        """Generate telemetry for an entire campaign with multiple techniques.
         
-        all_events = []
+        With ``executor`` (normally a ``ProcessPoolExecutor``), each technique
+        is generated as an independent task on the pool with its own seed;
+        otherwise techniques are generated in-process one after another.
+        """
         
         # Calculate time allocation for each technique
         technique_duration = (total_duration_hours * 60) // len(technique_sequence)
         
         logger.info(f"Generating campaign telemetry for {len(technique_sequence)} techniques over {total_duration_hours} hours")
         
-        for i, technique_id in enumerate(technique_sequence):
-            # Calculate start time for this technique
-            start_offset = timedelta(minutes=i * technique_duration)
-            
-            # Add some randomness to make it more realistic
-            jitter = timedelta(minutes=random.uniform(-30, 30))
-            technique_start = datetime.now() + start_offset + jitter
-            
-            # Generate events for this technique
-            technique_events = await self.generate_technique_telemetry(
-                technique_id=technique_id,
-                duration_minutes=technique_duration,
-                stealth_level=stealth_level
+        # Every event is campaign_start plus an integer microsecond offset;
+        # techniques are generated at their final times, so nothing is
+        # re-aligned afterwards and the merge sorts on offsets
+        campaign_start = datetime.now()
+        start_offsets_us = self._technique_start_offsets_us(len(technique_sequence), technique_duration)
+        
+        if executor is not None:
+            results = await self._generate_campaign_techniques_in_pool(
+                executor, technique_sequence, campaign_start, start_offsets_us,
+                technique_duration, stealth_level
             )
-            
-            # Adjust timestamps to align with campaign timeline
-            time_offset = technique_start - datetime.now()
-            for event in technique_events:
-                event.timestamp += time_offset
-            
+        else:
+            results = [
+                self._generate_technique_events(
+                    technique_id, self._technique_templates(technique_id),
+                    campaign_start + timedelta(microseconds=start_us),
+                    technique_duration, stealth_level
+                )
+                for technique_id, start_us in zip(technique_sequence, start_offsets_us)
+            ]
+        
+        all_events = []
+        offsets_us = []
+        for start_us, (technique_events, technique_us) in zip(start_offsets_us, results):
             all_events.extend(technique_events)
+            offsets_us.append(technique_us + start_us)
         
         # Generate additional background noise throughout campaign
-        background_events = await self._generate_campaign_background(total_duration_hours)
+        background_events, background_us = self._generate_campaign_background(
+            total_duration_hours, campaign_start
+        )
         all_events.extend(background_events)
+        offsets_us.append(background_us)
         
         # Sort all events by timestamp
-        all_events.sort(key=lambda x: x.timestamp)
+        order = np.argsort(np.concatenate(offsets_us), kind="stable")
+        all_events = [all_events[i] for i in order.tolist()]
         
         self.generated_events.extend(all_events)
         
         logger.info(f"Generated {len(all_events)} total telemetry events for campaign")
         return all_events
     
-    async def _generate_campaign_background(self, duration_hours: int) -> List[TelemetryEvent]:
-        """Generate background noise for entire campaign duration."""
+    def _technique_start_offsets_us(self, count: int, technique_duration: int) -> List[int]:
+        """Start of each technique's slot in microseconds, with up to 30 minutes of jitter."""
+        slot_us = technique_duration * 60_000_000
+        return [i * slot_us + self._rng.randint(-1_800_000_000, 1_800_000_000) for i in range(count)]
+    
+    async def _generate_campaign_techniques_in_pool(self, executor: Executor,
+                                                    technique_sequence: List[str],
+                                                    campaign_start: datetime,
+                                                    start_offsets_us: List[int],
+                                                    technique_duration: int,
+                                                    stealth_level: float
+                                                    ) -> List[Tuple[List[TelemetryEvent], np.ndarray]]:
+        """Generate each campaign technique as a separate task on ``executor``."""
+        
+        seeds = self._np_rng.integers(2**63, size=len(technique_sequence)).tolist()
+        
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.run_in_executor(
+                executor, _generate_technique_in_worker, technique_id,
+                campaign_start + timedelta(microseconds=start_us),
+                technique_duration, stealth_level, seed
+            )
+            for technique_id, start_us, seed in zip(technique_sequence, start_offsets_us, seeds)
+        ]
+        return await asyncio.gather(*tasks)
+    
+    def _generate_campaign_background(self, duration_hours: int, start_time: datetime
+                                      ) -> Tuple[List[TelemetryEvent], np.ndarray]:
+        """Generate background noise for entire campaign duration.
+        
+        Returns the events and their microsecond offsets from ``start_time``.
+        """
         
         background_events = []
+        offsets_us = []
         
         # Generate continuous background activity
         for template in self.background_noise_templates.values():
             events_count = int(template.frequency_per_hour * duration_hours)
             
-            for _ in range(events_count):
-                # Random time during campaign
-                event_time = datetime.now() + timedelta(
-                    hours=random.uniform(0, duration_hours)
-                )
-                
-                event = self._generate_event_from_template(template, event_time, 0.0)
-                background_events.append(event)
+            # Random times during campaign
+            template_us = self._minute_offsets_us(0, duration_hours * 60, events_count)
+            event_times = self._offset_times(start_time, template_us)
+            background_events.extend(self._generate_events_batch(template, event_times, 0.0))
+            offsets_us.append(template_us)
         
-        return background_events
+        return background_events, np.concatenate(offsets_us)
     
     def export_events_json(self, events: List[TelemetryEvent] = None, 
-                          file_path: str = None) -> str:
-        """Export events to JSON format."""
+                          file_path: str = None, indent: Optional[int] = 2) -> str:
+        """Export events to JSON format.
+        
+        Pass ``indent=None`` for compact output, which uses orjson when it
+        is installed.
+        """
         
         if events is None:
             events = self.generated_events
         
-        # Convert events to serializable format
-        events_data = []
-        for event in events:
-            event_dict = asdict(event)
-            event_dict["timestamp"] = event.timestamp.isoformat()
-            event_dict["event_type"] = event.event_type.value
-            event_dict["log_level"] = event.log_level.value
-            events_data.append(event_dict)
-        
-        json_data = json.dumps(events_data, indent=2, default=str)
+        if indent is not None:
+            json_data = _events_json_indented(events, indent)
+        else:
+            # Convert events to serializable format; parsed_fields and metadata
+            # are referenced, not copied, since the encoder only reads them
+            events_data = [
+                {
+                    "event_id": event.event_id,
+                    "timestamp": event.timestamp.isoformat(),
+                    "event_type": event.event_type.value,
+                    "source_host": event.source_host,
+                    "log_level": event.log_level.value,
+                    "technique_id": event.technique_id,
+                    "raw_log": event.raw_log,
+                    "parsed_fields": event.parsed_fields,
+                    "metadata": event.metadata,
+                }
+                for event in events
+            ]
+            if orjson is not None:
+                json_data = orjson.dumps(events_data, default=str).decode("utf-8")
+            else:
+                json_data = json.dumps(events_data, separators=(",", ":"), default=str)
         
         if file_path:
             with open(file_path, 'w') as f:
@@ -563,26 +1216,33 @@ class TelemetrySimulator:
         
         return json_data
     
-    def export_events_syslog(self, events: List[TelemetryEvent] = None) -> List[str]:
-        """Export events in syslog format."""
+    def export_events_syslog(self, events: List[TelemetryEvent] = None, *,
+                             out=None) -> Optional[List[str]]:
+        """Export events in syslog format.
+        
+        With ``out`` (a text file-like object), lines are written to it one
+        at a time, newline-terminated, and nothing is returned; otherwise the
+        lines are returned as a list.
+        """
         
         if events is None:
             events = self.generated_events
         
-        syslog_entries = []
+        # RFC 3164 syslog format; priority 16 = local use 0, info
+        lines = (
+            f"<16>{_syslog_timestamp(event.timestamp)} {event.source_host} "
+            f"{event.event_type.value}: {event.raw_log}"
+            for event in events
+        )
         
-        for event in events:
-            # RFC 3164 syslog format
-            priority = 16  # Local use 0, Info priority
-            timestamp_str = event.timestamp.strftime("%b %d %H:%M:%S")
-            hostname = event.source_host
-            tag = event.event_type.value
-            message = event.raw_log
-            
-            syslog_entry = f"<{priority}>{timestamp_str} {hostname} {tag}: {message}"
-            syslog_entries.append(syslog_entry)
+        if out is None:
+            return list(lines)
         
-        return syslog_entries
+        write = out.write
+        for line in lines:
+            write(line)
+            write("\n")
+        return None
     
     def get_detection_opportunities(self, events: List[TelemetryEvent] = None) -> Dict[str, Any]:
         """Analyze events to identify detection opportunities."""
@@ -598,41 +1258,42 @@ class TelemetrySimulator:
             "iocs": []
         }
         
-        # Group events by technique
-        technique_events = {}
-        for event in events:
-            if event.technique_id:
-                if event.technique_id not in technique_events:
-                    technique_events[event.technique_id] = []
-                technique_events[event.technique_id].append(event)
+        if not isinstance(events, TelemetryEventBuffer):
+            buffer = TelemetryEventBuffer()
+            buffer.extend(events)
+            events = buffer
+        codes, scores = events.columns()
+        
+        # Techniques in order of first appearance
+        present, first_index = np.unique(codes, return_index=True)
+        techniques = [int(code) for code in present[np.argsort(first_index)] if code]
+        high = scores > 0.7
+        medium = (scores > 0.4) & ~high
         
         # Analyze each technique for detection opportunities
-        for technique_id, tech_events in technique_events.items():
-            high_conf_events = [e for e in tech_events if e.metadata.get("detection_score", 0) > 0.7]
-            medium_conf_events = [e for e in tech_events if 0.4 < e.metadata.get("detection_score", 0) <= 0.7]
-            
-            if high_conf_events:
-                opportunities["high_confidence_detections"].append({
-                    "technique_id": technique_id,
-                    "event_count": len(high_conf_events),
-                    "confidence": "high",
-                    "sample_event": high_conf_events[0].raw_log
-                })
+        for code in techniques:
+            technique_id = events.technique_ids[code]
+            in_technique = codes == code
             
-            if medium_conf_events:
-                opportunities["medium_confidence_detections"].append({
-                    "technique_id": technique_id,
-                    "event_count": len(medium_conf_events),
-                    "confidence": "medium",
-                    "sample_event": medium_conf_events[0].raw_log
-                })
+            for confidence, selected, key in (
+                ("high", in_technique & high, "high_confidence_detections"),
+                ("medium", in_technique & medium, "medium_confidence_detections"),
+            ):
+                event_count = int(np.count_nonzero(selected))
+                if event_count:
+                    opportunities[key].append({
+                        "technique_id": technique_id,
+                        "event_count": event_count,
+                        "confidence": confidence,
+                        "sample_event": events[int(np.argmax(selected))].raw_log
+                    })
         
         # Identify correlation opportunities
-        if len(technique_events) > 1:
+        if len(techniques) > 1:
             opportunities["correlation_opportunities"].append({
                 "pattern": "technique_sequence",
-                "techniques": list(technique_events.keys()),
-                "description": f"Sequence of {len(technique_events)} techniques detected"
+                "techniques": [events.technique_ids[code] for code in techniques],
+                "description": f"Sequence of {len(techniques)} techniques detected"
             })
         
         return opportunities
@@ -640,4 +1301,20 @@ class TelemetrySimulator:
     def clear_generated_events(self):
         """Clear all generated events."""
         self.generated_events.clear()
-        logger.info("Cleared all generated telemetry events")
\ No newline at end of file
+        logger.info("Cleared all generated telemetry events")
+
+
+def _generate_technique_in_worker(technique_id: str, start_time: datetime,
+                                  duration_minutes: int, stealth_level: float,
+                                  seed: int) -> Tuple[List[TelemetryEvent], np.ndarray]:
+    """Generate one technique's events and offsets in a fresh simulator.
+    
+    Top-level so it can be pickled into a process pool; the simulator holds
+    template lambdas and is never sent across.
+    """
+    
+    simulator = TelemetrySimulator(seed=seed)
+    return simulator._generate_technique_events(
+        technique_id, simulator._technique_templates(technique_id),
+        start_time, duration_minutes, stealth_level
+    )
@@ -5,6 +5,8 @@ Train an RL adversary agent using policy gradient or PPO.
 Usage:
     python rl/train_adversary.py --algo pg --seed 42 --episodes 50
     python rl/train_adversary.py --algo ppo --seed 42 --episodes 200
+    python rl/train_adversary.py --algo ppo --seed 42 --episodes 200 --num-envs 8
+    python rl/train_adversary.py --algo pg --seed 42 --episodes 200 --num-envs 8 --vec-env subproc
 
 Outputs:
     eval/rl/policy.pt       - Trained policy weights
@@ -20,6 +22,7 @@ import os
 import sys
 import time
 import hashlib
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -29,7 +32,7 @@ import numpy as np
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from redteam.envs import AttackEnv, EnvConfig
+from redteam.envs import AttackEnv, EnvConfig, VecEnv, SubprocVecEnv
 from redteam.policy import (
     PolicyNetwork, SimplePolicyGradient,
     ActorCriticNetwork, PPO,
@@ -117,8 +120,9 @@ def train_episode_pg(env: AttackEnv, policy: PolicyNetwork, trainer: SimplePolic
         if use_random:
             action = random_policy_action(env.n_actions, mask, rng)
             log_prob = 0.0
+            hidden = None
         else:
-            action, log_prob = policy.sample_action(obs, mask, rng)
+            action, log_prob, hidden = policy.sample_action(obs, mask, rng, return_hidden=True)
 
         next_obs, reward, done, info = env.step(action)
         mask = info.get("action_mask", env.get_action_mask())
@@ -135,7 +139,7 @@ def train_episode_pg(env: AttackEnv, policy: PolicyNetwork, trainer: SimplePolic
             )
 
         if not use_random:
-            trainer.store_transition(obs, action, reward, log_prob, mask)
+            trainer.store_transition(obs, action, reward, log_prob, mask, hidden)
 
         episode_reward += reward
         episode_steps += 1
@@ -223,6 +227,150 @@ def train_episode_ppo(env: AttackEnv, network: ActorCriticNetwork, trainer: PPO,
     }
 
 
+def train_batch_ppo(vec_env: VecEnv, network: ActorCriticNetwork, trainer: PPO,
+                    rng: np.random.Generator, tracer: Optional[EpisodeTracer] = None,
+                    episode: int = 0, seeds: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    Run one PPO episode per environment in lockstep.
+
+    Each step runs a single batched forward pass for all live environments.
+    Trajectories are stored env-major so every episode stays contiguous in
+    the trainer's buffers and ends on a terminal transition.
+    """
+    seeds = list(seeds) if seeds is not None else [episode + i for i in range(vec_env.num_envs)]
+    n_envs = len(seeds)
+    obs, masks = vec_env.reset(seeds)
+
+    obs_rows, mask_rows, action_rows, lp_rows, value_rows = [], [], [], [], []
+    reward_rows, done_rows, live_rows, info_rows = [], [], [], []
+    live = ~vec_env.dones
+
+    while live.any():
+        actions, log_probs, values = network.sample_actions_batch(obs, masks, rng)
+        obs_rows.append(obs.copy())
+        mask_rows.append(masks.copy())
+
+        obs, rewards, dones, infos = vec_env.step(actions)
+
+        action_rows.append(actions)
+        lp_rows.append(log_probs)
+        value_rows.append(values)
+        reward_rows.append(rewards)
+        done_rows.append(dones)
+        live_rows.append(live)
+        info_rows.append(infos)
+        live = ~dones
+
+    # (T, N) -> per-env column slices
+    obs_arr, mask_arr = np.stack(obs_rows), np.stack(mask_rows)
+    action_arr, lp_arr = np.stack(action_rows), np.stack(lp_rows)
+    value_arr, reward_arr = np.stack(value_rows), np.stack(reward_rows)
+    done_arr, live_arr = np.stack(done_rows), np.stack(live_rows)
+
+    results = []
+    for i in range(n_envs):
+        steps = np.flatnonzero(live_arr[:, i])
+        trainer.store_transitions(
+            obs_arr[steps, i], action_arr[steps, i], reward_arr[steps, i],
+            value_arr[steps, i], lp_arr[steps, i], done_arr[steps, i], mask_arr[steps, i],
+        )
+
+        infos = [info_rows[t][i] for t in steps]
+        if tracer:
+            tracer.start_episode(episode + i, seeds[i])
+            for step, t in enumerate(steps):
+                action = int(action_arr[t, i])
+                tracer.log_step(
+                    step=step,
+                    obs=obs_arr[t, i],
+                    action=action,
+                    action_name=vec_env.get_technique_name(action),
+                    mask=mask_arr[t, i],
+                    reward=float(reward_arr[t, i]),
+                    info=infos[step],
+                )
+
+        results.append({
+            "reward": float(reward_arr[steps, i].sum()),
+            "steps": len(steps),
+            "success": any(info.get("objective_complete") for info in infos),
+            "detected": any(info.get("locked_out") for info in infos),
+            "last_value": 0.0,
+        })
+
+    return results
+
+
+def train_batch_pg(vec_env: VecEnv, policy: PolicyNetwork, trainer: SimplePolicyGradient,
+                   rng: np.random.Generator, tracer: Optional[EpisodeTracer] = None,
+                   episode: int = 0, seeds: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    Run one policy-gradient episode per environment in lockstep.
+
+    The policy stays in this process and runs one batched forward pass per
+    step for all live environments; each episode is stored as a contiguous
+    block in the trainer's buffers.
+    """
+    seeds = list(seeds) if seeds is not None else [episode + i for i in range(vec_env.num_envs)]
+    n_envs = len(seeds)
+    obs, masks = vec_env.reset(seeds)
+
+    obs_rows, mask_rows, action_rows, lp_rows = [], [], [], []
+    reward_rows, live_rows, info_rows = [], [], []
+    live = ~vec_env.dones
+
+    while live.any():
+        actions, log_probs = policy.sample_actions_batch(obs, masks, rng)
+        obs_rows.append(obs.copy())
+        mask_rows.append(masks.copy())
+
+        obs, rewards, dones, infos = vec_env.step(actions)
+
+        action_rows.append(actions)
+        lp_rows.append(log_probs)
+        reward_rows.append(rewards)
+        live_rows.append(live)
+        info_rows.append(infos)
+        live = ~dones
+
+    # (T, N) -> per-env column slices
+    obs_arr, mask_arr = np.stack(obs_rows), np.stack(mask_rows)
+    action_arr, lp_arr = np.stack(action_rows), np.stack(lp_rows)
+    reward_arr, live_arr = np.stack(reward_rows), np.stack(live_rows)
+
+    results = []
+    for i in range(n_envs):
+        steps = np.flatnonzero(live_arr[:, i])
+        trainer.store_transitions(
+            obs_arr[steps, i], action_arr[steps, i], reward_arr[steps, i],
+            lp_arr[steps, i], mask_arr[steps, i],
+        )
+
+        infos = [info_rows[t][i] for t in steps]
+        if tracer:
+            tracer.start_episode(episode + i, seeds[i])
+            for step, t in enumerate(steps):
+                action = int(action_arr[t, i])
+                tracer.log_step(
+                    step=step,
+                    obs=obs_arr[t, i],
+                    action=action,
+                    action_name=vec_env.get_technique_name(action),
+                    mask=mask_arr[t, i],
+                    reward=float(reward_arr[t, i]),
+                    info=infos[step],
+                )
+
+        results.append({
+            "reward": float(reward_arr[steps, i].sum()),
+            "steps": len(steps),
+            "success": any(info.get("objective_complete") for info in infos),
+            "detected": any(info.get("locked_out") for info in infos),
+        })
+
+    return results
+
+
 def write_summary_md(output_dir: Path, results: Dict[str, Any]):
     """Write summary.md with results table."""
     summary_path = output_dir / "summary.md"
@@ -286,6 +434,10 @@ def main():
                         help="PPO clip ratio")
     parser.add_argument("--gae-lambda", type=float, default=0.95,
                         help="GAE lambda for PPO")
+    parser.add_argument("--num-envs", type=int, default=1,
+                        help="Parallel environments per rollout")
+    parser.add_argument("--vec-env", type=str, default="sync", choices=["sync", "subproc"],
+                        help="Vectorized env backend when --num-envs > 1")
     parser.add_argument("--output-dir", type=str, default="eval/rl",
                         help="Output directory for results")
     parser.add_argument("--use-real-detector", action="store_true",
@@ -310,6 +462,8 @@ def main():
     print(f"  Episodes: {args.episodes}")
     print(f"  Steps per episode: {args.steps_per_episode}")
     print(f"  Detector: {'real' if args.use_real_detector else 'stub'}")
+    if args.num_envs > 1:
+        print(f"  Parallel envs: {args.num_envs} ({args.vec_env})")
     print()
 
     # Set seed
@@ -360,6 +514,11 @@ def main():
         trainer = SimplePolicyGradient(policy, gamma=args.gamma)
         network = None
 
+    vec_env = None
+    if args.num_envs > 1:
+        vec_env_cls = SubprocVecEnv if args.vec_env == "subproc" else VecEnv
+        vec_env = vec_env_cls([partial(AttackEnv, env_config)] * args.num_envs)
+
     # Metrics storage
     metrics_path = output_dir / "metrics.jsonl"
     metrics_file = open(metrics_path, "w")
@@ -374,7 +533,25 @@ def main():
     for episode in range(args.episodes):
         episode_seed = seed + episode
 
-        if args.algo == "ppo":
+        if vec_env is not None:
+            # One lockstep rollout covers the next num_envs episodes
+            if episode % args.num_envs == 0:
+                batch_seeds = [seed + e for e in range(episode, min(episode + args.num_envs, args.episodes))]
+                if args.algo == "ppo":
+                    batch_stats = train_batch_ppo(
+                        vec_env, network, trainer, rng, tracer,
+                        episode=episode, seeds=batch_seeds
+                    )
+                    update_stats = trainer.update(last_value=0.0)
+                else:
+                    batch_stats = train_batch_pg(
+                        vec_env, policy, trainer, rng, tracer,
+                        episode=episode, seeds=batch_seeds
+                    )
+                    update_stats = trainer.update()
+                entropy = update_stats.get("entropy", 0.0)
+            episode_stats = batch_stats[episode % args.num_envs]
+        elif args.algo == "ppo":
             episode_stats = train_episode_ppo(
                 env, network, trainer, rng, tracer,
                 episode=episode, seed=episode_seed
@@ -425,6 +602,8 @@ def main():
     metrics_file.close()
     if tracer:
         tracer.close()
+    if vec_env is not None:
+        vec_env.close()
     training_time = time.time() - start_time
 
     # Save policy
@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from redteam.framework import RedTeamSimulator
-from redteam.orchestrator import CampaignOrchestrator
+from redteam.orchestrator import CampaignOrchestrator, install_uring_event_loop_policy
 
 # Configure logging
 logging.basicConfig(
@@ -371,5 +371,6 @@ async def main():
     return True
 
 if __name__ == "__main__":
+    install_uring_event_loop_policy()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
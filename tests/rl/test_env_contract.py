@@ -7,7 +7,7 @@ These tests verify the RL environment meets the expected interface contract.
 import pytest
 import numpy as np
 
-from redteam.envs import AttackEnv, EnvConfig
+from redteam.envs import AttackEnv, EnvConfig, VecEnv, SubprocVecEnv
 
 
 class TestEnvDeterminism:
@@ -326,3 +326,38 @@ class TestRender:
         # At minimum, steps should have incremented
         assert "Steps" in initial_render
         assert "Steps" in updated_render
+
+
+class TestVecEnv:
+    """Test batched stepping of several environments."""
+
+    @pytest.mark.parametrize("vec_env_cls", [VecEnv, SubprocVecEnv])
+    def test_matches_single_envs(self, vec_env_cls):
+        """Each row should follow the same trajectory as a standalone env."""
+        seeds = [1, 2, 3]
+        actions = [0, 1, 0]
+
+        with vec_env_cls([AttackEnv] * len(seeds)) as vec_env:
+            obs, masks = vec_env.reset(seeds)
+            assert obs.shape == (3, vec_env.obs_dim)
+            assert masks.shape == (3, vec_env.n_actions)
+            obs, rewards, dones, _ = vec_env.step(np.array(actions))
+            obs = obs.copy()
+
+        for i, seed in enumerate(seeds):
+            env = AttackEnv()
+            env.reset(seed=seed)
+            expected_obs, expected_reward, expected_done, _ = env.step(actions[i])
+            np.testing.assert_allclose(obs[i], expected_obs)
+            assert rewards[i] == pytest.approx(expected_reward)
+            assert dones[i] == expected_done
+
+    def test_unseeded_envs_start_done(self):
+        """Envs without a seed in reset() should be skipped."""
+        vec_env = VecEnv([AttackEnv] * 3)
+        vec_env.reset([7])
+
+        _, rewards, dones, infos = vec_env.step(np.zeros(3, dtype=np.int64))
+
+        assert dones[1] and dones[2]
+        assert rewards[1] == 0.0 and infos[2] == {}
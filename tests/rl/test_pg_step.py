@@ -7,7 +7,7 @@ Verifies that one update step lowers policy loss on a fixed batch.
 import pytest
 import numpy as np
 
-from redteam.policy import PolicyNetwork, SimplePolicyGradient
+from redteam.policy import PolicyNetwork, SimplePolicyGradient, random_policy_actions
 
 
 class TestPolicyNetwork:
@@ -125,6 +125,17 @@ class TestSimplePolicyGradient:
         expected = np.array([5.9203, 4.97, 3.0], dtype=np.float32)
         np.testing.assert_array_almost_equal(returns, expected, decimal=3)
 
+    def test_returns_restart_after_stored_episode(self):
+        """Returns should not leak across episodes stored as blocks."""
+        policy = PolicyNetwork(obs_dim=9, n_actions=12, use_torch=False)
+        trainer = SimplePolicyGradient(policy, gamma=0.5)
+
+        obs = np.zeros((2, 9), dtype=np.float32)
+        trainer.store_transitions(obs, np.array([0, 1]), np.array([1.0, 1.0]), np.zeros(2))
+        trainer.store_transitions(obs, np.array([2, 3]), np.array([4.0, 2.0]), np.zeros(2))
+
+        np.testing.assert_allclose(trainer.compute_returns(), [1.5, 1.0, 5.0, 2.0])
+
     def test_update_clears_buffers(self):
         """Update should clear buffers."""
         policy = PolicyNetwork(obs_dim=9, n_actions=12, use_torch=False)
@@ -180,6 +191,22 @@ class TestSimplePolicyGradient:
         # Weights should change
         assert not np.allclose(policy.w3, w3_before)
 
+    def test_update_trains_hidden_layers(self):
+        """NumPy update should backpropagate into every layer."""
+        policy = PolicyNetwork(obs_dim=9, n_actions=12, use_torch=False, seed=0)
+        trainer = SimplePolicyGradient(policy)
+        before = {name: getattr(policy, name).copy() for name in policy._PARAM_NAMES}
+
+        rng = np.random.default_rng(0)
+        for i in range(10):
+            obs = rng.standard_normal(9).astype(np.float32)
+            action, log_prob, hidden = policy.sample_action(obs, rng=rng, return_hidden=True)
+            trainer.store_transition(obs, action, float(i % 3), log_prob, hidden=hidden)
+        trainer.update()
+
+        for name, value in before.items():
+            assert not np.allclose(getattr(policy, name), value), name
+
 
 class TestPolicyGradientLearning:
     """Test that policy gradient actually learns."""
@@ -247,6 +274,23 @@ class TestPolicyGradientLearning:
         assert final_probs[1] > initial_probs[1]
 
 
+class TestRandomPolicy:
+    """Test the random baseline policy."""
+
+    def test_batched_random_actions_respect_masks(self):
+        """Each row should only draw actions its mask allows."""
+        rng = np.random.default_rng(0)
+        masks = np.zeros((3, 12), dtype=bool)
+        masks[0, [2, 7]] = True
+        masks[1, :] = True
+        masks[2, 11] = True
+
+        for _ in range(200):
+            actions = random_policy_actions(12, masks, rng)
+            assert actions.shape == (3,)
+            assert masks[np.arange(3), actions].all()
+
+
 class TestPolicySaveLoad:
     """Test policy serialization."""
 
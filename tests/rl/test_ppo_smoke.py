@@ -11,6 +11,7 @@ import numpy as np
 
 from redteam.envs import AttackEnv, EnvConfig
 from redteam.policy import ActorCriticNetwork, PPO, random_policy_action
+from redteam.policy.ppo import RunningMeanStd
 
 
 def run_episode(env: AttackEnv, network: ActorCriticNetwork, trainer: PPO,
@@ -166,6 +167,19 @@ class TestPPOSmoke:
         assert np.isfinite(stats["policy_loss"])
         assert np.isfinite(stats["value_loss"])
 
+    def test_running_advantage_stats_match_concatenation(self):
+        """Batched running stats should equal stats over all samples seen."""
+        rng = np.random.default_rng(0)
+        batches = [rng.normal(2.0, 3.0, size=n) for n in (12, 40, 7)]
+
+        rms = RunningMeanStd(epsilon=0.0)
+        for batch in batches:
+            rms.update(batch)
+
+        combined = np.concatenate(batches)
+        assert rms.mean == pytest.approx(combined.mean())
+        assert rms.var == pytest.approx(combined.var())
+
 
 class TestActorCriticNetwork:
     """Test ActorCriticNetwork functionality."""
@@ -181,6 +195,22 @@ class TestActorCriticNetwork:
         np.testing.assert_almost_equal(np.sum(probs), 1.0, decimal=5)
         assert isinstance(value, float)
 
+    def test_forward_batch_matches_forward(self):
+        """Batched forward pass should match per-observation forward."""
+        network = ActorCriticNetwork(obs_dim=9, n_actions=12, use_torch=False)
+        obs = np.random.randn(4, 9).astype(np.float32)
+        masks = np.ones((4, 12), dtype=bool)
+        masks[1, 5:] = False
+
+        probs, values = network.forward_batch(obs, masks)
+
+        assert probs.shape == (4, 12)
+        assert values.shape == (4,)
+        for i in range(4):
+            row_probs, row_value = network.forward(obs[i], masks[i])
+            np.testing.assert_array_almost_equal(probs[i], row_probs)
+            assert abs(values[i] - row_value) < 1e-5
+
     def test_sample_action_returns_tuple(self):
         """sample_action should return (action, log_prob, value)."""
         network = ActorCriticNetwork(obs_dim=9, n_actions=12, use_torch=False)
@@ -225,6 +255,17 @@ class TestActorCriticNetwork:
         np.testing.assert_array_almost_equal(probs1, probs2)
         assert abs(value1 - value2) < 1e-5
 
+    def test_save_load_flat_npy(self, tmp_path):
+        """Flat .npy checkpoints should round-trip the NumPy weights."""
+        network1 = ActorCriticNetwork(obs_dim=9, n_actions=12, use_torch=False)
+        network1.save(str(tmp_path / "network.npy"))
+
+        network2 = ActorCriticNetwork(obs_dim=9, n_actions=12, use_torch=False)
+        network2.load(str(tmp_path / "network.npy"))
+
+        for name in ("w1", "b1", "w2", "b2", "w_policy", "b_policy", "w_value", "b_value"):
+            np.testing.assert_array_equal(getattr(network1, name), getattr(network2, name))
+
 
 class TestPPODeterminism:
     """Test PPO determinism with same seed."""
@@ -257,3 +298,33 @@ class TestPPODeterminism:
         rewards2 = run_training(42)
 
         np.testing.assert_array_equal(rewards1, rewards2)
+
+
+class TestPPONumba:
+    """Test the optional Numba update kernel."""
+
+    def test_numba_update_matches_numpy(self):
+        """Numba and NumPy updates should produce the same weights."""
+        pytest.importorskip("numba")
+
+        def run_update(use_numba: bool):
+            np.random.seed(0)
+            network = ActorCriticNetwork(obs_dim=9, n_actions=12, use_torch=False)
+            trainer = PPO(network, n_epochs=2, use_numba=use_numba)
+            rng = np.random.default_rng(0)
+            mask = np.array([True] * 8 + [False] * 4)
+            for i in range(20):
+                obs = rng.standard_normal(9).astype(np.float32)
+                step_mask = mask if i % 2 else None
+                action, log_prob, value = network.sample_action(obs, step_mask, rng)
+                trainer.store_transition(obs, action, float(i % 3), value, log_prob,
+                                         i == 19, step_mask)
+            stats = trainer.update(last_value=0.0)
+            return network, stats
+
+        net_numba, stats_numba = run_update(True)
+        net_numpy, stats_numpy = run_update(False)
+
+        np.testing.assert_allclose(net_numba.w_policy, net_numpy.w_policy, atol=1e-5)
+        np.testing.assert_allclose(net_numba.w_value, net_numpy.w_value, atol=1e-5)
+        assert abs(stats_numba["value_loss"] - stats_numpy["value_loss"]) < 1e-4